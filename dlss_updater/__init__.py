@@ -1,21 +1,26 @@
-from .scanner import (
-    get_steam_install_path,
-    get_steam_libraries,
-    find_dlls,
-    find_all_dlls_sync,
-)
-from .updater import update_dll
-from .whitelist import is_whitelisted
 from .version import __version__
-from .config import resource_path, initialize_dll_paths, config_manager
-from .logger import setup_logger
-from .constants import DLL_TYPE_MAP, DLL_GROUPS
 
-# We rename find_dlss_dlls to find_dlls and keep it for backward compatibility
-find_dlss_dlls = find_dlls
-
-# Let's export find_all_dlls_sync instead of the async version
-find_all_dlss_dlls = find_all_dlls_sync
+# Package attributes are imported on first access (PEP 562), so importing a
+# submodule - e.g. dlss_updater.version_worker in a process pool worker -
+# does not pull in the scanner, updater, config and database
+_LAZY_ATTRIBUTES = {
+    "get_steam_install_path": (".scanner", "get_steam_install_path"),
+    "get_steam_libraries": (".scanner", "get_steam_libraries"),
+    "find_dlls": (".scanner", "find_dlls"),
+    "find_all_dlls_sync": (".scanner", "find_all_dlls_sync"),
+    # We rename find_dlss_dlls to find_dlls and keep it for backward compatibility
+    "find_dlss_dlls": (".scanner", "find_dlls"),
+    # Let's export find_all_dlls_sync instead of the async version
+    "find_all_dlss_dlls": (".scanner", "find_all_dlls_sync"),
+    "update_dll": (".updater", "update_dll"),
+    "is_whitelisted": (".whitelist", "is_whitelisted"),
+    "resource_path": (".config", "resource_path"),
+    "initialize_dll_paths": (".config", "initialize_dll_paths"),
+    "config_manager": (".config", "config_manager"),
+    "setup_logger": (".logger", "setup_logger"),
+    "DLL_TYPE_MAP": (".constants", "DLL_TYPE_MAP"),
+    "DLL_GROUPS": (".constants", "DLL_GROUPS"),
+}
 
 # Don't initialize DLL paths at import time anymore
 # This will be done explicitly after admin check
@@ -36,3 +41,18 @@ __all__ = [
     "DLL_GROUPS",
     "config_manager",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,401 @@
+"""
+Adaptive Concurrency for DLSS Updater
+AIMD limiters that tune their concurrency from observed latency and throughput
+
+The static Concurrency multipliers (IO_HEAVY = CPU*32, IO_EXTREME = CPU*64)
+allow thousands of concurrent operations on a many-core machine, which
+thrashes HDD-backed libraries and slow links. Each resource instead gets an
+AdaptiveLimiter that starts small, grows while latency stays near the best
+latency it has seen (doubling at first, then one slot at a time), and backs
+off multiplicatively when latency balloons or operations time out. An
+increase that did not buy any throughput is undone. The old Concurrency
+values remain as the ceilings.
+
+Limiters are kept per resource: one per disk device (st_dev, with ceilings
+from its DeviceBudget), one per network host and one for CPU-bound PE
+parsing. They can be used from coroutines (slot_async) and from worker
+threads (slot).
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from dlss_updater.config import Concurrency
+from dlss_updater.device_scheduler import device_key, get_device_budget
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import LimiterStats, ResourceClass
+
+logger = setup_logger()
+
+# Average window latency above baseline * LATENCY_TOLERANCE counts as congestion
+LATENCY_TOLERANCE = 2.0
+# Multiplicative decrease applied on congestion
+BACKOFF_FACTOR = 0.7
+# A window whose throughput falls below this fraction of the previous one
+# after an increase undoes that increase
+THROUGHPUT_DROP = 0.9
+# The baseline is re-learnt from the best window of each period of this many
+# windows, so it can rise again if the resource gets slower for good
+BASELINE_PERIOD = 32
+# Completions per adjustment window (at least the current limit)
+MIN_WINDOW = 8
+
+# Exceptions that signal an overloaded resource rather than a bad input
+_CONGESTION_ERRORS = (TimeoutError, ConnectionError)
+
+
+class _AsyncWaiter:
+    """A coroutine queued for a slot; granted is set when a slot is handed over."""
+
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter whose limit follows an AIMD control loop.
+
+    Every finished operation reports its latency. Once per window (as many
+    completions as the current limit, at least MIN_WINDOW) the limiter
+    compares the window's average latency with its baseline (the best
+    window latency seen, re-learnt every BASELINE_PERIOD windows):
+
+    - timeouts/connection errors or latency above the tolerance: multiply
+      the limit by BACKOFF_FACTOR
+    - throughput fell after the last increase: undo that increase
+    - otherwise, if the limit was actually reached: double it during slow
+      start, add one slot afterwards
+
+    Thread-safe; coroutines and threads can share one limiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float = LATENCY_TOLERANCE,
+        backoff: float = BACKOFF_FACTOR
+    ):
+        self.name = name
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._latency_tolerance = latency_tolerance
+        self._backoff = backoff
+
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: deque[_AsyncWaiter] = deque()
+        self._in_flight = 0
+
+        # Control loop state
+        self._slow_start = True
+        self._baseline: float | None = None
+        self._period_best: float | None = None
+        self._period_windows = 0
+        self._last_throughput: float | None = None
+        self._limit_before_increase: float | None = None
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._window_latency = 0.0
+        self._window_errors = 0
+        self._window_peak = 0
+
+        # Lifetime statistics
+        self._created = time.monotonic()
+        self._completed = 0
+        self._errors = 0
+        self._decreases = 0
+        self._peak_in_flight = 0
+        self._total_latency = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    # ----- slot bookkeeping (call with self._lock held) -----
+
+    def _take_slot_locked(self) -> None:
+        self._in_flight += 1
+        self._window_peak = max(self._window_peak, self._in_flight)
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _dispatch_locked(self) -> None:
+        """Hand free slots to queued coroutines first, then to waiting threads."""
+        while self._async_waiters and self._in_flight < int(self._limit):
+            waiter = self._async_waiters.popleft()
+            self._take_slot_locked()
+            waiter.granted = True
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # The waiter's event loop is closed; nobody will use the slot
+                waiter.granted = False
+                self._in_flight -= 1
+
+        free = int(self._limit) - self._in_flight
+        if free > 0:
+            self._slot_freed.notify(free)
+
+    # ----- acquisition -----
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free."""
+        with self._slot_freed:
+            while self._async_waiters or self._in_flight >= int(self._limit):
+                self._slot_freed.wait()
+            self._take_slot_locked()
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a slot is free."""
+        with self._lock:
+            if not self._async_waiters and self._in_flight < int(self._limit):
+                self._take_slot_locked()
+                return
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._async_waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._dispatch_locked()
+                else:
+                    self._async_waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float | None = None, congested: bool = False) -> None:
+        """
+        Return a slot and report how the operation went.
+
+        Args:
+            latency: Seconds the operation held its slot (None: no sample,
+                e.g. the operation was cancelled)
+            congested: True if it failed in a way that signals overload
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if latency is not None:
+                self._record_locked(latency, congested)
+            self._dispatch_locked()
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold a slot for the duration of a block (worker threads)."""
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except _CONGESTION_ERRORS:
+            self.release(time.monotonic() - start, congested=True)
+            raise
+        except BaseException:
+            self.release(time.monotonic() - start)
+            raise
+        self.release(time.monotonic() - start)
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self):
+        """Hold a slot for the duration of a block (coroutines)."""
+        await self.acquire_async()
+        start = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except _CONGESTION_ERRORS:
+            self.release(time.monotonic() - start, congested=True)
+            raise
+        except BaseException:
+            self.release(time.monotonic() - start)
+            raise
+        self.release(time.monotonic() - start)
+
+    # ----- control loop -----
+
+    def _record_locked(self, latency: float, congested: bool) -> None:
+        self._completed += 1
+        self._total_latency += latency
+        self._window_count += 1
+        self._window_latency += latency
+        if congested:
+            self._errors += 1
+            self._window_errors += 1
+
+        if self._window_count < max(MIN_WINDOW, int(self._limit)):
+            return
+
+        now = time.monotonic()
+        avg_latency = self._window_latency / self._window_count
+        throughput = self._window_count / max(now - self._window_start, 1e-6)
+        saturated = self._window_peak >= int(self._limit)
+
+        self._baseline = min(self._baseline or avg_latency, avg_latency)
+        self._period_best = min(self._period_best or avg_latency, avg_latency)
+        self._period_windows += 1
+        if self._period_windows >= BASELINE_PERIOD:
+            self._baseline = self._period_best
+            self._period_best = None
+            self._period_windows = 0
+
+        previous = int(self._limit)
+        decreases_before = self._decreases
+        limit_before_increase = None
+        reason = ""
+
+        if self._window_errors or avg_latency > self._baseline * self._latency_tolerance:
+            self._limit = max(self._min_limit, self._limit * self._backoff)
+            self._slow_start = False
+            self._decreases += 1
+            reason = (
+                f"{self._window_errors} timeouts" if self._window_errors
+                else f"latency {avg_latency * 1000:.1f}ms vs baseline {self._baseline * 1000:.1f}ms"
+            )
+        elif (
+            self._limit_before_increase is not None
+            and self._last_throughput
+            and throughput < self._last_throughput * THROUGHPUT_DROP
+        ):
+            # The last increase bought nothing: the resource is saturated
+            self._limit = self._limit_before_increase
+            self._slow_start = False
+            reason = f"throughput fell to {throughput:.0f} ops/s"
+        elif saturated and self._limit < self._max_limit:
+            limit_before_increase = self._limit
+            growth = self._limit if self._slow_start else 1
+            self._limit = min(self._max_limit, self._limit + growth)
+
+        self._limit_before_increase = limit_before_increase
+        self._last_throughput = throughput
+        self._window_start = now
+        self._window_count = 0
+        self._window_latency = 0.0
+        self._window_errors = 0
+        self._window_peak = self._in_flight
+
+        current = int(self._limit)
+        if current < previous:
+            # Backoffs are worth seeing in the log; undoing one probe step is routine
+            log = logger.info if self._decreases > decreases_before else logger.debug
+            log(f"[LIMITER] {self.name}: limit {previous} -> {current} ({reason})")
+        elif current > previous:
+            logger.debug(
+                f"[LIMITER] {self.name}: limit {previous} -> {current} "
+                f"(latency {avg_latency * 1000:.1f}ms, {throughput:.0f} ops/s)"
+            )
+
+    def stats(self) -> LimiterStats:
+        """Snapshot of the limiter's current limit and lifetime statistics."""
+        with self._lock:
+            elapsed = max(time.monotonic() - self._created, 1e-6)
+            return LimiterStats(
+                name=self.name,
+                limit=int(self._limit),
+                min_limit=self._min_limit,
+                max_limit=self._max_limit,
+                peak_in_flight=self._peak_in_flight,
+                completed=self._completed,
+                errors=self._errors,
+                decreases=self._decreases,
+                avg_latency_ms=(self._total_latency / self._completed * 1000) if self._completed else 0.0,
+                throughput_ops_s=self._completed / elapsed,
+            )
+
+
+# =============================================================================
+# Limiter registry
+# =============================================================================
+
+_limiters: dict[tuple[ResourceClass, str], AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _default_limits(resource_class: ResourceClass, key: str) -> tuple[int, int, int]:
+    """
+    (initial, min, max) limits for a resource.
+
+    Disk limits come from the device's budget (see device_scheduler); the
+    other maxima are the old static values.
+    """
+    if resource_class == ResourceClass.DISK:
+        budget = get_device_budget(key)
+        return budget.initial_limit, min(2, budget.max_limit), budget.max_limit
+    if resource_class == ResourceClass.NETWORK:
+        return 4, 1, Concurrency.IO_EXTREME
+    return Concurrency.CPU_BOUND, 1, Concurrency.THREADPOOL_CPU
+
+
+def get_limiter(resource_class: ResourceClass, key: str = "") -> AdaptiveLimiter:
+    """
+    Get (or lazily create) the limiter for one resource.
+
+    Thread-safe: concurrent callers for the same resource share one limiter.
+    """
+    registry_key = (resource_class, key)
+    limiter = _limiters.get(registry_key)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(registry_key)
+        if limiter is None:
+            initial, min_limit, max_limit = _default_limits(resource_class, key)
+            name = f"{resource_class.value}:{key}" if key else resource_class.value
+            limiter = AdaptiveLimiter(name, initial, min_limit, max_limit)
+            _limiters[registry_key] = limiter
+            logger.debug(f"[LIMITER] Created {name} (start {limiter.limit}, max {max_limit})")
+        return limiter
+
+
+def get_disk_limiter(path) -> AdaptiveLimiter:
+    """Limiter for the disk device holding path."""
+    return get_limiter(ResourceClass.DISK, device_key(path))
+
+
+def get_network_limiter(url: str) -> AdaptiveLimiter:
+    """Limiter for the host serving url."""
+    return get_limiter(ResourceClass.NETWORK, urlsplit(url).hostname or url)
+
+
+def get_cpu_limiter() -> AdaptiveLimiter:
+    """Limiter for CPU-bound work (PE parsing)."""
+    return get_limiter(ResourceClass.CPU)
+
+
+def get_limiter_stats() -> list[LimiterStats]:
+    """Statistics for every limiter created so far."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+def log_limiter_stats(context: str) -> None:
+    """Log the limits the adaptive limiters have settled on."""
+    for stats in get_limiter_stats():
+        if not stats.completed:
+            continue
+        logger.info(
+            f"[LIMITER] {context}: {stats.name} limit={stats.limit} "
+            f"(range {stats.min_limit}-{stats.max_limit}, peak {stats.peak_in_flight} in flight, "
+            f"{stats.completed} ops, avg {stats.avg_latency_ms:.1f}ms, "
+            f"{stats.decreases} backoffs, {stats.errors} timeouts)"
+        )
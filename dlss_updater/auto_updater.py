@@ -5,6 +5,7 @@ import aiohttp
 from packaging import version
 from dlss_updater.version import __version__
 from dlss_updater.logger import setup_logger
+from dlss_updater.http_client import get_http_session
 
 logger = setup_logger()
 
@@ -42,18 +43,18 @@ async def check_for_updates_async() -> tuple[str | None, bool, str | None]:
     try:
         logger.info("Checking for updates...")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                GITHUB_API_URL,
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={"Accept": "application/vnd.github.v3+json"}
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"GitHub API returned status {response.status}")
-                    return None, False, None
-
-                content = await response.read()
-                latest_release = _json_decoder.decode(content)
+        session = await get_http_session()
+        async with session.get(
+            GITHUB_API_URL,
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={"Accept": "application/vnd.github.v3+json"}
+        ) as response:
+            if response.status != 200:
+                logger.error(f"GitHub API returned status {response.status}")
+                return None, False, None
+
+            content = await response.read()
+            latest_release = _json_decoder.decode(content)
 
         latest_version = latest_release["tag_name"].lstrip("Vv")
 
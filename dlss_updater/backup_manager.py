@@ -14,6 +14,11 @@ from pathlib import Path
 from dlss_updater.logger import setup_logger
 from dlss_updater.database import db_manager
 from dlss_updater.config import Concurrency
+from dlss_updater.backup_store import delete_blob
+from dlss_updater.checksum import compute_checksum, verify_checksum, verify_checksums
+from dlss_updater.models import DLLBackup, ExecutorPool
+from dlss_updater.copy_engine import atomic_copy_file
+from dlss_updater.executor_registry import run_in_pool
 
 logger = setup_logger()
 
@@ -38,7 +43,13 @@ async def async_copy2(src: Path, dst: Path, chunk_size: int = 65536) -> None:
     await asyncio.to_thread(shutil.copystat, src, dst)
 
 
-def record_backup_metadata_sync(dll_path: Path, backup_path: Path) -> int | None:
+def record_backup_metadata_sync(
+    dll_path: Path,
+    backup_path: Path,
+    original_version: str | None = None,
+    blob_digest: str | None = None,
+    checksum: str | None = None
+) -> int | None:
     """
     Record backup metadata in database (synchronous version).
 
@@ -47,6 +58,12 @@ def record_backup_metadata_sync(dll_path: Path, backup_path: Path) -> int | None
     Args:
         dll_path: Path to original DLL
         backup_path: Path to backup file
+        original_version: Already-known version of the DLL; read from the
+            file when omitted
+        blob_digest: Digest of the backup store blob when backup_path is a
+            deduplicated blob rather than a .dlsss file
+        checksum: Content checksum of the DLL at backup time; computed from
+            the backup file when omitted
 
     Returns:
         Backup ID if successful, None otherwise
@@ -59,22 +76,30 @@ def record_backup_metadata_sync(dll_path: Path, backup_path: Path) -> int | None
             logger.warning(f"No game DLL record found for {dll_path}, cannot record backup metadata")
             return None
 
-        # Mark old backups inactive
+        # Mark old backups inactive; their blobs may be unreferenced afterwards
+        superseded_digests = db_manager._get_active_blob_digests(game_dll.id)
         db_manager._mark_old_backups_inactive(game_dll.id)
 
-        # Get DLL version
-        from dlss_updater.updater import get_dll_version
-        version = get_dll_version(dll_path)
+        # Get DLL version (callers that already parsed it pass it in)
+        version = original_version
+        if version is None:
+            from dlss_updater.updater import get_dll_version
+            version = get_dll_version(dll_path)
 
         # Get backup file size
         backup_size = backup_path.stat().st_size if backup_path.exists() else 0
 
+        if checksum is None and backup_size:
+            checksum = compute_checksum(backup_path)
+
         # Insert backup record
         backup_id = db_manager._insert_backup({
             'game_dll_id': game_dll.id,
             'backup_path': str(backup_path),
             'original_version': version,
-            'backup_size': backup_size
+            'backup_size': backup_size,
+            'blob_digest': blob_digest,
+            'checksum': checksum
         })
 
         if backup_id:
@@ -82,6 +107,9 @@ def record_backup_metadata_sync(dll_path: Path, backup_path: Path) -> int | None
         else:
             logger.warning(f"Failed to record backup metadata for {dll_path.name}")
 
+        if superseded_digests:
+            prune_backup_store_sync(superseded_digests)
+
         return backup_id
 
     except Exception as e:
@@ -109,16 +137,19 @@ async def record_backup_metadata(dll_path: Path, backup_path: Path) -> int | Non
             return None
 
         # Mark all existing backups for this DLL as inactive before creating a new one
+        superseded_digests = await db_manager.get_active_blob_digests(game_dll.id)
         await db_manager.mark_old_backups_inactive(game_dll.id)
 
         # Get DLL version asynchronously (avoids blocking event loop)
         from dlss_updater.updater import get_dll_version_async
         version = await get_dll_version_async(dll_path)
 
-        # Get backup file size (run in thread pool to avoid blocking)
+        # Get backup file size and checksum (run in thread pool to avoid blocking)
+        checksum = None
         if backup_path.exists():
             stat_result = await asyncio.to_thread(backup_path.stat)
             backup_size = stat_result.st_size
+            checksum = await asyncio.to_thread(compute_checksum, backup_path)
         else:
             backup_size = 0
 
@@ -127,7 +158,8 @@ async def record_backup_metadata(dll_path: Path, backup_path: Path) -> int | Non
             'game_dll_id': game_dll.id,
             'backup_path': str(backup_path),
             'original_version': version,
-            'backup_size': backup_size
+            'backup_size': backup_size,
+            'checksum': checksum
         })
 
         if backup_id:
@@ -135,6 +167,9 @@ async def record_backup_metadata(dll_path: Path, backup_path: Path) -> int | Non
         else:
             logger.warning(f"Failed to record backup metadata for {dll_path.name}")
 
+        if superseded_digests:
+            await prune_backup_store(superseded_digests)
+
         return backup_id
 
     except Exception as e:
@@ -159,10 +194,13 @@ async def restore_dll_from_backup(backup_id: int) -> tuple[bool, str]:
         if not backup:
             return False, "Backup not found in database"
 
-        # Get game DLL info
-        game_dll = await db_manager.get_game_dll_by_path(
-            str(Path(backup.backup_path).with_suffix('.dll'))
-        )
+        # Get game DLL info (deduplicated blobs do not live next to the DLL)
+        if backup.blob_digest:
+            game_dll = await db_manager.get_game_dll_by_id(backup.game_dll_id)
+        else:
+            game_dll = await db_manager.get_game_dll_by_path(
+                str(Path(backup.backup_path).with_suffix('.dll'))
+            )
 
         if not game_dll:
             return False, "DLL information not found in database"
@@ -204,8 +242,11 @@ async def restore_dll_from_backup(backup_id: int) -> tuple[bool, str]:
             if dll_path.exists():
                 await asyncio.to_thread(os.chmod, dll_path, stat.S_IWRITE | stat.S_IREAD)
 
-            # Copy backup to DLL location (async to avoid blocking event loop)
-            await async_copy2(backup_path, dll_path)
+            # Copy backup to DLL location as a new file (in a thread to avoid blocking
+            # the event loop); never write into the existing file, which may share
+            # its inode with a hard-linked backup store blob
+            await asyncio.to_thread(atomic_copy_file, backup_path, dll_path)
+            await asyncio.to_thread(shutil.copystat, backup_path, dll_path)
 
             # Verify restore succeeded
             if not dll_path.exists():
@@ -218,6 +259,8 @@ async def restore_dll_from_backup(backup_id: int) -> tuple[bool, str]:
 
             # Mark backup as inactive (removes it from Backups page)
             await db_manager.mark_backup_inactive(backup_id)
+            if backup.blob_digest:
+                await prune_backup_store([backup.blob_digest])
 
             # Cleanup temporary backup
             if temp_backup and temp_backup.exists():
@@ -270,11 +313,20 @@ async def delete_backup(backup_id: int) -> tuple[bool, str]:
 
         backup_path = Path(backup.backup_path)
 
+        if backup.blob_digest:
+            # Deduplicated blob: drop this reference, delete the blob with the last one
+            await db_manager.mark_backup_inactive(backup_id)
+            await prune_backup_store([backup.blob_digest])
+            return True, "Backup deleted successfully"
+
         # Delete backup file if it exists
         if backup_path.exists():
             try:
-                # Remove read-only attribute if present (run in thread pool)
-                await asyncio.to_thread(os.chmod, backup_path, stat.S_IWRITE)
+                # Remove read-only attribute if present (run in thread pool); a
+                # hard-linked backup shares its mode with the live DLL, so skip it
+                backup_stat = await asyncio.to_thread(backup_path.stat)
+                if backup_stat.st_nlink == 1:
+                    await asyncio.to_thread(os.chmod, backup_path, stat.S_IWRITE)
                 await asyncio.to_thread(backup_path.unlink)
                 logger.info(f"Deleted backup file: {backup_path}")
             except Exception as e:
@@ -291,43 +343,97 @@ async def delete_backup(backup_id: int) -> tuple[bool, str]:
         return False, f"Error deleting backup: {str(e)}"
 
 
-async def validate_backup(backup_id: int) -> tuple[bool, str]:
+def prune_backup_store_sync(digests: list[str] | None = None) -> int:
     """
-    Validate that a backup file exists and is accessible
+    Delete backup store blobs that no active backup references any more.
+
+    Runs after deletes, restores and superseded backups (which release blob
+    references) and once at startup for anything an earlier run left behind.
+    Each digest is checked again under the store lock before its blob is
+    unlinked, since a concurrent backup may have reused it in the meantime.
 
     Args:
-        backup_id: Database ID of the backup to validate
+        digests: Blobs whose references were just released; None checks
+            every blob no active backup references
 
     Returns:
-        Tuple of (valid: bool, message: str)
+        Number of blobs deleted
     """
-    try:
-        # Get backup metadata
-        backup = await db_manager.get_backup_by_id(backup_id)
+    if digests is None:
+        digests = db_manager._get_unreferenced_blob_digests()
+    deleted = 0
+    for digest in digests:
+        try:
+            if delete_blob(digest, db_manager._is_blob_referenced):
+                deleted += 1
+        except Exception as e:
+            logger.warning(f"Failed to delete backup blob {digest[:12]}: {e}")
+    return deleted
 
-        if not backup:
-            return False, "Backup not found in database"
 
-        backup_path = Path(backup.backup_path)
+async def prune_backup_store(digests: list[str] | None = None) -> int:
+    """Async wrapper for prune_backup_store_sync (runs in the DB pool)."""
+    return await run_in_pool(ExecutorPool.DB, prune_backup_store_sync, digests)
 
-        # Check if file exists
-        if not backup_path.exists():
-            await db_manager.mark_backup_inactive(backup_id)
-            return False, "Backup file not found"
 
-        # Check if file is readable (run in thread pool to avoid blocking)
-        is_readable = await asyncio.to_thread(os.access, backup_path, os.R_OK)
-        if not is_readable:
-            return False, "Backup file is not readable"
+async def _check_backup_file(backup_id: int) -> tuple[tuple[bool, str], DLLBackup | None]:
+    """
+    Run the cheap backup checks (record, existence, readability, size).
+
+    Returns:
+        ((valid, message), backup) - backup is None when the record is missing
+    """
+    # Get backup metadata
+    backup = await db_manager.get_backup_by_id(backup_id)
 
-        # Check file size matches (run in thread pool to avoid blocking)
-        stat_result = await asyncio.to_thread(backup_path.stat)
-        actual_size = stat_result.st_size
-        if actual_size != backup.backup_size:
-            logger.warning(f"Backup file size mismatch: expected {backup.backup_size}, got {actual_size}")
-            return False, f"Backup file may be corrupted (size mismatch)"
+    if not backup:
+        return (False, "Backup not found in database"), None
 
-        return True, "Backup is valid"
+    backup_path = Path(backup.backup_path)
+
+    # Check if file exists
+    if not backup_path.exists():
+        await db_manager.mark_backup_inactive(backup_id)
+        return (False, "Backup file not found"), backup
+
+    # Check if file is readable (run in thread pool to avoid blocking)
+    is_readable = await asyncio.to_thread(os.access, backup_path, os.R_OK)
+    if not is_readable:
+        return (False, "Backup file is not readable"), backup
+
+    # Check file size matches (run in thread pool to avoid blocking)
+    stat_result = await asyncio.to_thread(backup_path.stat)
+    actual_size = stat_result.st_size
+    if actual_size != backup.backup_size:
+        logger.warning(f"Backup file size mismatch: expected {backup.backup_size}, got {actual_size}")
+        return (False, f"Backup file may be corrupted (size mismatch)"), backup
+
+    return (True, "Backup is valid"), backup
+
+
+async def validate_backup(backup_id: int, check_contents: bool = True) -> tuple[bool, str]:
+    """
+    Validate that a backup file exists, is accessible and is intact
+
+    Args:
+        backup_id: Database ID of the backup to validate
+        check_contents: Also verify the recorded checksum (backups made before
+            checksums were recorded are only size-checked)
+
+    Returns:
+        Tuple of (valid: bool, message: str)
+    """
+    try:
+        result, backup = await _check_backup_file(backup_id)
+        if not result[0] or not check_contents or not backup.checksum:
+            return result
+
+        # Stream the file through the hash (run in thread pool to avoid blocking)
+        if not await asyncio.to_thread(verify_checksum, backup.backup_path, backup.checksum):
+            logger.warning(f"Backup file checksum mismatch: {backup.backup_path}")
+            return False, "Backup file is corrupted (checksum mismatch)"
+
+        return result
 
     except Exception as e:
         logger.error(f"Error validating backup: {e}", exc_info=True)
@@ -336,14 +442,20 @@ async def validate_backup(backup_id: int) -> tuple[bool, str]:
 
 async def validate_backups_batch(
     backup_ids: list[int],
-    max_concurrent: int = None
+    max_concurrent: int = None,
+    check_contents: bool = True
 ) -> dict[int, tuple[bool, str]]:
     """
     Validate multiple backups in parallel with maximum concurrency.
 
+    The cheap checks run concurrently per backup; backups that pass them and
+    have a recorded checksum are then verified together by the parallel
+    checksum engine.
+
     Args:
         backup_ids: List of backup IDs to validate
         max_concurrent: Maximum concurrent validations (default: IO_HEAVY)
+        check_contents: Also verify recorded checksums
 
     Returns:
         Dict mapping backup_id to (valid: bool, message: str)
@@ -356,16 +468,40 @@ async def validate_backups_batch(
     # Maximum concurrency for backup validation (async file I/O scales extremely well)
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def bounded_validate(backup_id: int) -> tuple[int, tuple[bool, str]]:
+    async def bounded_validate(backup_id: int) -> tuple[int, tuple[bool, str], DLLBackup | None]:
         async with semaphore:
-            result = await validate_backup(backup_id)
-            return backup_id, result
+            try:
+                result, backup = await _check_backup_file(backup_id)
+            except Exception as e:
+                logger.error(f"Error validating backup: {e}", exc_info=True)
+                result, backup = (False, f"Error validating backup: {str(e)}"), None
+            return backup_id, result, backup
 
     # Run all validations with bounded concurrency
     tasks = [bounded_validate(bid) for bid in backup_ids]
-    results = await asyncio.gather(*tasks)
-
-    return dict(results)
+    checked = await asyncio.gather(*tasks)
+    results = {backup_id: result for backup_id, result, _ in checked}
+
+    if check_contents:
+        # Deduplicated backups share blobs, so hash each distinct file once
+        ids_by_path: dict[str, list[int]] = {}
+        checksums: dict[str, str] = {}
+        for backup_id, result, backup in checked:
+            if result[0] and backup.checksum:
+                ids_by_path.setdefault(backup.backup_path, []).append(backup_id)
+                checksums[backup.backup_path] = backup.checksum
+
+        if checksums:
+            report = await asyncio.to_thread(verify_checksums, list(checksums.items()))
+            for path in report.mismatched:
+                logger.warning(f"Backup file checksum mismatch: {path}")
+                for backup_id in ids_by_path[path]:
+                    results[backup_id] = (False, "Backup file is corrupted (checksum mismatch)")
+            for path, error in report.errors.items():
+                for backup_id in ids_by_path[path]:
+                    results[backup_id] = (False, f"Error validating backup: {error}")
+
+    return results
 
 
 async def restore_group_for_game(
@@ -0,0 +1,151 @@
+"""
+Deduplicated Backup Store for DLSS Updater
+Content-addressed storage for DLL backups (BackupStorageMode.DEDUPLICATED)
+
+Many games ship byte-identical DLLs, so instead of a .dlsss copy next to every
+DLL the store keeps one blob per distinct content, named by its BLAKE2b digest.
+dll_backups rows reference the blob through blob_digest; a blob is deleted once
+no active backup references it any more. A blob handed out by store_blob() is
+pinned until its caller has recorded the dll_backups row (unpin_blob()), so a
+concurrent prune cannot delete it in between.
+
+New blobs are reflinked or hard-linked from the DLL when the filesystem
+allows it and copied otherwise (copy_engine.clone_file). Hard links are safe because every update and
+restore path replaces the DLL with a new file (copy_engine.atomic_copy_file)
+instead of rewriting it in place, so the blob keeps the original content.
+"""
+
+import hashlib
+import os
+import stat
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+from dlss_updater.copy_engine import clone_file
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import BackupStrategy, StoredBackupBlob
+from dlss_updater.platform_utils import APP_CONFIG_DIR
+
+logger = setup_logger()
+
+BACKUP_STORE_DIRNAME = "backup_store"
+BLOB_SUFFIX = ".blob"
+DIGEST_SIZE = 32  # bytes; 64 hex characters
+
+# Serialises blob creation so two workers backing up identical DLLs
+# do not both materialise the same blob, and blob deletion against both
+_store_lock = threading.Lock()
+
+# Digests returned by store_blob() whose backup row is not recorded yet
+_pinned_digests: Counter[str] = Counter()
+
+
+def get_backup_store_dir() -> Path:
+    """Get the backup store location (same directory as games.db)."""
+    return APP_CONFIG_DIR / BACKUP_STORE_DIRNAME
+
+
+def compute_file_digest(path) -> str:
+    """Stream a file through BLAKE2b and return the hex digest."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=DIGEST_SIZE)).hexdigest()
+
+
+def get_blob_path(digest: str) -> Path:
+    """Blob location for a digest (fanned out over 256 subdirectories)."""
+    return get_backup_store_dir() / digest[:2] / f"{digest}{BLOB_SUFFIX}"
+
+
+def _link_or_copy(dll_path: Path, blob_path: Path) -> str:
+    """Materialise a new blob without copying data where the filesystem allows."""
+    # Reflink or hard link first; FAT/exFAT and some network shares fall back to a copy
+    return clone_file(dll_path, blob_path, BackupStrategy.AUTO).value
+
+
+def store_blob(dll_path, digest: str | None = None) -> StoredBackupBlob:
+    """
+    Store a DLL in the backup store, reusing an identical blob if present.
+
+    The blob stays pinned (delete_blob() leaves it alone) until the caller
+    passes the digest to unpin_blob(), after recording its backup row.
+
+    Args:
+        dll_path: DLL to back up
+        digest: BLAKE2b hex digest of the DLL if the caller already hashed
+            it (see compute_file_digest); saves reading the file again
+
+    Returns:
+        StoredBackupBlob describing the referenced blob
+
+    Raises:
+        OSError: If the DLL cannot be read or the blob cannot be written
+    """
+    dll_path = Path(dll_path)
+    size = dll_path.stat().st_size
+    if digest is None:
+        digest = compute_file_digest(dll_path)
+    blob_path = get_blob_path(digest)
+
+    with _store_lock:
+        try:
+            if blob_path.stat().st_size == size:
+                _pinned_digests[digest] += 1
+                logger.debug(f"[BACKUP STORE] {dll_path.name} matches existing blob {digest[:12]}")
+                return StoredBackupBlob(
+                    digest=digest, blob_path=str(blob_path), size=size, reused=True, method="existing"
+                )
+            # Same name, different size: a damaged blob - replace it below
+            logger.warning(f"[BACKUP STORE] Replacing damaged blob {blob_path}")
+        except FileNotFoundError:
+            pass
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        method = _link_or_copy(dll_path, blob_path)
+        _pinned_digests[digest] += 1
+
+    logger.info(f"[BACKUP STORE] Stored {dll_path.name} as blob {digest[:12]} ({method})")
+    return StoredBackupBlob(
+        digest=digest, blob_path=str(blob_path), size=size, reused=False, method=method
+    )
+
+
+def unpin_blob(digest: str) -> None:
+    """Release a blob pinned by store_blob() once its backup row is recorded (or failed)."""
+    with _store_lock:
+        _pinned_digests[digest] -= 1
+        if _pinned_digests[digest] <= 0:
+            del _pinned_digests[digest]
+
+
+def delete_blob(digest: str, is_referenced: Callable[[str], bool] | None = None) -> bool:
+    """
+    Delete a blob from the store unless it is pinned or still referenced.
+
+    Args:
+        digest: Blob digest
+        is_referenced: Checks the database for active backups of the digest;
+            called under the store lock so no store_blob() can reuse the blob
+            between the check and the unlink
+
+    Returns:
+        True if a blob file was removed
+    """
+    blob_path = get_blob_path(digest)
+    with _store_lock:
+        if _pinned_digests[digest] > 0:
+            logger.debug(f"[BACKUP STORE] Keeping blob {digest[:12]}: backup being recorded")
+            return False
+        if is_referenced is not None and is_referenced(digest):
+            logger.debug(f"[BACKUP STORE] Keeping blob {digest[:12]}: referenced again")
+            return False
+        try:
+            # A hard-linked blob shares its mode with the live DLL, so leave it alone
+            if blob_path.stat().st_nlink == 1:
+                os.chmod(blob_path, stat.S_IWRITE | stat.S_IREAD)
+            blob_path.unlink()
+        except FileNotFoundError:
+            return False
+    logger.info(f"[BACKUP STORE] Deleted unreferenced blob {digest[:12]}")
+    return True
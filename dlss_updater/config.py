@@ -10,10 +10,15 @@ import msgspec
 from .logger import setup_logger
 from .models import (
     MAX_PATHS_PER_LAUNCHER,
+    BackupStorageMode,
+    BackupStrategy,
     DLSSPresetConfig,
+    FsyncPolicy,
     LauncherPathsConfig,
     PerformanceConfig,
+    ScanMode,
     UpdatePreferencesConfig,
+    VersionExtractionBackend,
 )
 
 logger = setup_logger()
@@ -55,6 +60,10 @@ class Concurrency:
     - IO_MEDIUM = 224 (CPU * 16, file operations)
     - IO_HEAVY = 448 (CPU * 32, network/disk heavy ops)
     - IO_EXTREME = 896 (CPU * 64, async I/O that mostly waits)
+
+    Scans, downloads, PE parsing and updates no longer run at these limits
+    directly: adaptive_concurrency tunes a limit per disk, host and CPU from
+    observed latency, and these values are only its ceilings.
     """
 
     # CPU-bound operations (PE parsing, version extraction)
@@ -420,6 +429,26 @@ class ConfigManager(configparser.ConfigParser):
         self["UpdatePreferences"]["CreateBackups"] = str(enabled).lower()
         self.save()
 
+    def get_backup_storage_mode(self) -> BackupStorageMode:
+        """Get where backups are stored (default: sidecar .dlsss files)"""
+        with _config_lock:
+            if not self.has_section("UpdatePreferences"):
+                return BackupStorageMode.SIDECAR
+            value = self["UpdatePreferences"].get("BackupStorage", BackupStorageMode.SIDECAR)
+        try:
+            return BackupStorageMode(value)
+        except ValueError:
+            logger.warning(f"Unknown BackupStorage '{value}' in config, using sidecar")
+            return BackupStorageMode.SIDECAR
+
+    def set_backup_storage_mode(self, mode: BackupStorageMode):
+        """Set where backups are stored and persist to config file"""
+        with _config_lock:
+            if not self.has_section("UpdatePreferences"):
+                self.add_section("UpdatePreferences")
+            self["UpdatePreferences"]["BackupStorage"] = BackupStorageMode(mode).value
+            self.save()
+
     def get_discord_banner_dismissed(self) -> bool:
         """Get whether the Discord invite banner has been dismissed"""
         if not self.has_section("DiscordBanner"):
@@ -516,7 +545,8 @@ class ConfigManager(configparser.ConfigParser):
             update_fsr=self.get_update_preference("FSR"),
             update_streamline=self.get_update_preference("Streamline"),
             create_backups=self.get_backup_preference(),
-            high_performance_mode=self.get_high_performance_mode()
+            high_performance_mode=self.get_high_performance_mode(),
+            backup_storage=self.get_backup_storage_mode(),
         )
 
     def save_update_preferences_struct(self, prefs: UpdatePreferencesConfig):
@@ -531,6 +561,7 @@ class ConfigManager(configparser.ConfigParser):
         self["UpdatePreferences"]["UpdateStreamline"] = str(prefs.update_streamline).lower()
         self["UpdatePreferences"]["CreateBackups"] = str(prefs.create_backups).lower()
         self["UpdatePreferences"]["HighPerformanceMode"] = str(prefs.high_performance_mode).lower()
+        self["UpdatePreferences"]["BackupStorage"] = BackupStorageMode(prefs.backup_storage).value
         self.save()
 
     def get_launcher_paths_struct(self) -> LauncherPathsConfig:
@@ -570,12 +601,28 @@ class ConfigManager(configparser.ConfigParser):
     def get_performance_config_struct(self) -> PerformanceConfig:
         """Get performance config as validated msgspec struct"""
         return PerformanceConfig(
-            max_worker_threads=self.get_max_worker_threads()
+            max_worker_threads=self.get_max_worker_threads(),
+            scan_mode=self.get_scan_mode(),
+            version_backend=self.get_version_extraction_backend(),
+            skip_handle_enumeration=self.get_skip_handle_enumeration(),
+            fsync_policy=self.get_fsync_policy(),
+            backup_strategy=self.get_backup_strategy(),
+            guided_search=self.get_guided_search(),
+            guided_search_max_depth=self.get_guided_search_max_depth(),
+            watch_libraries=self.get_watch_libraries(),
         )
 
     def save_performance_config_struct(self, perf: PerformanceConfig):
         """Save performance config from msgspec struct to INI"""
         self.set_max_worker_threads(perf.max_worker_threads)
+        self.set_scan_mode(ScanMode(perf.scan_mode))
+        self.set_version_extraction_backend(VersionExtractionBackend(perf.version_backend))
+        self.set_skip_handle_enumeration(perf.skip_handle_enumeration)
+        self.set_fsync_policy(FsyncPolicy(perf.fsync_policy))
+        self.set_backup_strategy(BackupStrategy(perf.backup_strategy))
+        self.set_guided_search(perf.guided_search)
+        self.set_guided_search_max_depth(perf.guided_search_max_depth)
+        self.set_watch_libraries(perf.watch_libraries)
 
     def get_dlss_preset_config(self) -> DLSSPresetConfig:
         """
@@ -659,6 +706,167 @@ class ConfigManager(configparser.ConfigParser):
         self["Performance"]["MaxWorkerThreads"] = str(count)
         self.save()
 
+    def get_scan_mode(self) -> ScanMode:
+        """Get the directory scan mode (default: full)"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return ScanMode.FULL
+            value = self["Performance"].get("ScanMode", ScanMode.FULL)
+        try:
+            return ScanMode(value)
+        except ValueError:
+            logger.warning(f"Unknown ScanMode '{value}' in config, using full scan")
+            return ScanMode.FULL
+
+    def set_scan_mode(self, mode: ScanMode):
+        """Set the directory scan mode and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["ScanMode"] = ScanMode(mode).value
+            self.save()
+
+    def get_version_extraction_backend(self) -> VersionExtractionBackend:
+        """Get the bulk version extraction backend (default: auto)"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return VersionExtractionBackend.AUTO
+            value = self["Performance"].get("VersionBackend", VersionExtractionBackend.AUTO)
+        try:
+            return VersionExtractionBackend(value)
+        except ValueError:
+            logger.warning(f"Unknown VersionBackend '{value}' in config, using auto")
+            return VersionExtractionBackend.AUTO
+
+    def set_version_extraction_backend(self, backend: VersionExtractionBackend):
+        """Set the bulk version extraction backend and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["VersionBackend"] = VersionExtractionBackend(backend).value
+            self.save()
+
+    def get_skip_handle_enumeration(self) -> bool:
+        """
+        Get whether in-use checks skip enumerating process file handles.
+
+        When enabled, a locked DLL is detected only by failing to open it,
+        without walking the process table to find the owner (default: False).
+        """
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return False
+            return self["Performance"].getboolean("SkipHandleEnumeration", False)
+
+    def set_skip_handle_enumeration(self, enabled: bool):
+        """Set whether in-use checks skip handle enumeration and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["SkipHandleEnumeration"] = str(enabled).lower()
+            self.save()
+
+    def get_fsync_policy(self) -> FsyncPolicy:
+        """Get the fsync policy for atomic DLL writes (default: file)"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return FsyncPolicy.FILE
+            value = self["Performance"].get("FsyncPolicy", FsyncPolicy.FILE)
+        try:
+            return FsyncPolicy(value)
+        except ValueError:
+            logger.warning(f"Unknown FsyncPolicy '{value}' in config, using file")
+            return FsyncPolicy.FILE
+
+    def set_fsync_policy(self, policy: FsyncPolicy):
+        """Set the fsync policy for atomic DLL writes and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["FsyncPolicy"] = FsyncPolicy(policy).value
+            self.save()
+
+    def get_backup_strategy(self) -> BackupStrategy:
+        """Get the preferred backup strategy (default: auto - reflink, hard link, copy)"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return BackupStrategy.AUTO
+            value = self["Performance"].get("BackupStrategy", BackupStrategy.AUTO)
+        try:
+            return BackupStrategy(value)
+        except ValueError:
+            logger.warning(f"Unknown BackupStrategy '{value}' in config, using auto")
+            return BackupStrategy.AUTO
+
+    def set_backup_strategy(self, strategy: BackupStrategy):
+        """Set the preferred backup strategy and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["BackupStrategy"] = BackupStrategy(strategy).value
+            self.save()
+
+    def get_guided_search(self) -> bool:
+        """
+        Get whether per-game scans use guided search.
+
+        Guided search first probes directories where DLLs were found in
+        earlier scans and only walks the game folder when they miss
+        (default: False).
+        """
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return False
+            return self["Performance"].getboolean("GuidedSearch", False)
+
+    def set_guided_search(self, enabled: bool):
+        """Set whether per-game scans use guided search and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["GuidedSearch"] = str(enabled).lower()
+            self.save()
+
+    def get_guided_search_max_depth(self) -> int:
+        """Get how many levels below the game root a guided search fallback walk descends (default: 8)"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return 8
+            value = self["Performance"].get("GuidedSearchMaxDepth", "8")
+        try:
+            return min(64, max(1, int(value)))
+        except ValueError:
+            logger.warning(f"Invalid GuidedSearchMaxDepth '{value}' in config, using 8")
+            return 8
+
+    def set_guided_search_max_depth(self, depth: int):
+        """Set the guided search fallback walk depth and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["GuidedSearchMaxDepth"] = str(int(depth))
+            self.save()
+
+    def get_watch_libraries(self) -> bool:
+        """
+        Get whether launcher libraries are watched for changes in the background.
+
+        When enabled, games installed, removed or patched after a scan are
+        picked up without rescanning (default: False).
+        """
+        with _config_lock:
+            if not self.has_section("Performance"):
+                return False
+            return self["Performance"].getboolean("WatchLibraries", False)
+
+    def set_watch_libraries(self, enabled: bool):
+        """Set whether launcher libraries are watched and persist to config file"""
+        with _config_lock:
+            if not self.has_section("Performance"):
+                self.add_section("Performance")
+            self["Performance"]["WatchLibraries"] = str(enabled).lower()
+            self.save()
+
     def get_high_performance_mode(self) -> bool:
         """
         Get high performance update mode.
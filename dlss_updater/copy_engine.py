@@ -0,0 +1,313 @@
+"""
+Copy Engine for DLSS Updater
+Atomic write-to-temp-and-rename file replacement
+
+DLL updates used to delete the target and then rewrite it from Python, which
+copies every byte through user space and leaves a window in which the game
+has no DLL at all. The engine instead writes a sibling temp file and renames
+it over the target with os.replace(), so an interrupted update leaves either
+the old or the new DLL on disk, never neither.
+
+Data is copied in the kernel where possible (os.copy_file_range, then
+os.sendfile) and falls back to writing slices of an mmap of the source. How
+hard the data is flushed before the rename is controlled by FsyncPolicy.
+
+clone_file() materialises backups without copying data where the filesystem
+allows it: a FICLONE reflink (Btrfs, XFS), then a hard link, then a copy.
+"""
+
+import errno
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import BackupStrategy, FsyncPolicy
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = setup_logger()
+
+# Largest single kernel copy / write request
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# errnos meaning "this copy primitive is not usable here", not a real I/O error
+_UNSUPPORTED_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EPERM", None),
+    ) if code is not None
+)
+
+# Hard links also fail when the filesystem caps links per file
+_LINK_UNSUPPORTED_ERRNOS = _UNSUPPORTED_ERRNOS | frozenset(
+    code for code in (getattr(errno, "EMLINK", None),) if code is not None
+)
+
+# Unsupported errnos that can also come from one file or target (a cross-device
+# target, a read-only or locked file); they never rule a strategy out for a device
+_PER_FILE_ERRNOS = frozenset(
+    code for code in (getattr(errno, "EXDEV", None), getattr(errno, "EPERM", None)) if code is not None
+)
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+
+# Order in which clone_file() tries strategies
+_STRATEGY_CHAIN = (BackupStrategy.REFLINK, BackupStrategy.HARDLINK, BackupStrategy.COPY)
+
+# Devices (st_dev) where a reflink/hard link already failed; skip the attempt there
+_unsupported_lock = threading.Lock()
+_unsupported: dict[BackupStrategy, set[int]] = {
+    BackupStrategy.REFLINK: set(),
+    BackupStrategy.HARDLINK: set(),
+}
+
+
+def _write_all(fd: int, data) -> None:
+    """Write a whole buffer to fd, looping over short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view[:COPY_CHUNK_SIZE])
+        view = view[written:]
+
+
+def _copy_fd(in_fd: int, out_fd: int, size: int) -> str:
+    """
+    Copy size bytes from in_fd to out_fd (both positioned at 0).
+
+    Returns:
+        Name of the primitive that finished the copy (for logging)
+    """
+    copied = 0
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                n = os.copy_file_range(
+                    in_fd, out_fd, min(COPY_CHUNK_SIZE, size - copied), offset_src=copied
+                )
+                if n == 0:
+                    break
+                copied += n
+            if copied >= size:
+                return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    if hasattr(os, "sendfile") and sys.platform != "win32":
+        try:
+            while copied < size:
+                n = os.sendfile(out_fd, in_fd, copied, min(COPY_CHUNK_SIZE, size - copied))
+                if n == 0:
+                    break
+                copied += n
+            if copied >= size:
+                return "sendfile"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    with mmap.mmap(in_fd, 0, access=mmap.ACCESS_READ) as mm:
+        _write_all(out_fd, memoryview(mm)[copied:size])
+    return "mmap"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """fsync a directory so a rename inside it is durable (no-op on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError as e:
+        logger.debug(f"[COPY] Directory fsync failed for {directory}: {e}")
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_copy_file(
+    source,
+    target,
+    source_buffer: bytes | memoryview | None = None,
+    fsync_policy: FsyncPolicy | None = None
+) -> int:
+    """
+    Atomically replace target with the contents of source.
+
+    The data is written to a temp file in the target's directory and renamed
+    over the target with the source's permission bits. On failure the temp
+    file is removed and the target is left untouched.
+
+    Args:
+        source: Path of the file to copy
+        target: Path of the file to replace (or create)
+        source_buffer: Source contents already in memory (e.g. from the
+            high-performance source cache); written instead of re-reading source
+        fsync_policy: Flush policy; None uses the configured FsyncPolicy
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        OSError: If the copy or the final rename fails
+    """
+    if fsync_policy is None:
+        from dlss_updater.config import config_manager
+        fsync_policy = config_manager.get_fsync_policy()
+
+    target = Path(target)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".tmp", dir=target.parent
+    )
+    try:
+        try:
+            if source_buffer is not None:
+                size = len(source_buffer)
+                _write_all(fd, source_buffer)
+                method = "buffer"
+            else:
+                in_fd = os.open(source, os.O_RDONLY | _O_BINARY)
+                try:
+                    size = os.fstat(in_fd).st_size
+                    method = _copy_fd(in_fd, fd, size) if size else "empty"
+                finally:
+                    os.close(in_fd)
+
+            if fsync_policy != FsyncPolicy.NONE:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        # mkstemp creates the temp file owner-only (0600)
+        shutil.copymode(source, temp_name)
+        os.replace(temp_name, target)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+    if fsync_policy == FsyncPolicy.FULL:
+        _fsync_directory(target.parent)
+
+    logger.debug(f"[COPY] Replaced {target} ({size} bytes via {method})")
+    return size
+
+
+def _reflink(source: Path, temp_path: Path) -> None:
+    """Create temp_path as a copy-on-write clone of source (Linux FICLONE)."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks need Linux FICLONE")
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        dst_fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(source, temp_path)
+
+
+def clone_file(
+    source,
+    target,
+    strategy: BackupStrategy | None = None
+) -> BackupStrategy:
+    """
+    Materialise target as a copy of source using the cheapest safe strategy.
+
+    Tries a reflink clone, then a hard link, then a metadata-preserving copy
+    (starting the chain at the requested strategy). The result is written to
+    a temp file and renamed over target, so an existing target is replaced
+    atomically. Hard links rely on the DLL being replaced, never rewritten in
+    place, by later updates (see atomic_copy_file).
+
+    Args:
+        source: File to back up
+        target: Backup location (replaced if it exists)
+        strategy: Preferred strategy; None uses the configured BackupStrategy
+
+    Returns:
+        The BackupStrategy that was used
+
+    Raises:
+        OSError: If even the plain copy fails
+    """
+    if strategy is None:
+        from dlss_updater.config import config_manager
+        strategy = config_manager.get_backup_strategy()
+    if strategy == BackupStrategy.AUTO:
+        strategy = BackupStrategy.REFLINK
+
+    source = Path(source)
+    target = Path(target)
+    device = os.stat(source).st_dev
+    chain = _STRATEGY_CHAIN[_STRATEGY_CHAIN.index(strategy):]
+
+    for candidate in chain:
+        if candidate != BackupStrategy.COPY:
+            with _unsupported_lock:
+                if device in _unsupported[candidate]:
+                    continue
+
+        temp_path = target.with_name(f".{target.name}.{threading.get_ident()}.tmp")
+        # A crashed earlier attempt can leave the temp file behind; link() would fail on it
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        try:
+            if candidate == BackupStrategy.REFLINK:
+                _reflink(source, temp_path)
+            elif candidate == BackupStrategy.HARDLINK:
+                os.link(source, temp_path)
+            else:
+                shutil.copy2(source, temp_path)
+            os.replace(temp_path, target)
+            if candidate == BackupStrategy.HARDLINK and os.path.lexists(temp_path):
+                # rename() is a no-op when target is already a link to source
+                os.unlink(temp_path)
+            return candidate
+        except OSError as e:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            if candidate == BackupStrategy.COPY:
+                raise
+            unsupported = (
+                _LINK_UNSUPPORTED_ERRNOS if candidate == BackupStrategy.HARDLINK else _UNSUPPORTED_ERRNOS
+            )
+            # Unsupported errnos rule the strategy out for the whole filesystem, except
+            # those that can be specific to one file; anything else (ENOSPC, EACCES, ...)
+            # only fails this attempt
+            if e.errno in unsupported and e.errno not in _PER_FILE_ERRNOS:
+                with _unsupported_lock:
+                    _unsupported[candidate].add(device)
+                logger.debug(f"[COPY] {candidate.value} unavailable for {source.name}: {e}")
+            else:
+                logger.debug(f"[COPY] {candidate.value} failed for {source.name}, trying next strategy: {e}")
+
+    # Unreachable: COPY is always last in the chain and raises on failure
+    raise OSError(f"No backup strategy succeeded for {source}")
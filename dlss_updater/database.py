@@ -8,22 +8,25 @@ Performance optimizations:
 - Thread-local connection reuse for sync operations
 """
 
+import os
 import sqlite3
 import asyncio
 import logging
 import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 import aiosqlite
 
+from dlss_updater.executor_registry import run_in_pool
 from dlss_updater.logger import setup_logger
 from dlss_updater.platform_utils import APP_CONFIG_DIR
 from dlss_updater.models import (
     Game, GameDLL, DLLBackup, UpdateHistory, SteamImage,
-    GameDLLBackup, GameBackupSummary, GameWithBackupCount, MergedGame
+    GameDLLBackup, GameBackupSummary, GameWithBackupCount, MergedGame,
+    IncompleteUpdateSession, UpdateJournalEntry, ExecutorPool, DLLLocationPrior
 )
 
 logger = setup_logger()
@@ -97,7 +100,8 @@ class DatabaseManager:
             self._pool_semaphore: asyncio.Semaphore | None = None
             self._pool_active = False  # Track pool lifecycle state
 
-            # Thread-local storage for sync operations (connection reuse)
+            # Thread-local storage for sync operations (connection reuse); sync
+            # work runs in the fixed-size db pool, bounding open connections
             self._thread_local = threading.local()
 
             logger.info(f"Database path: {self.db_path}")
@@ -107,7 +111,7 @@ class DatabaseManager:
         if self.initialized:
             return
 
-        await asyncio.to_thread(self._create_schema)
+        await run_in_pool(ExecutorPool.DB, self._create_schema)
 
         self.initialized = True
         logger.info("Database schema initialized successfully")
@@ -352,6 +356,19 @@ class DatabaseManager:
                 END
             """)
 
+            # Persistent DLL version cache - avoids re-parsing unchanged PE files
+            # A row is only valid while size, mtime_ns and inode still match the file
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_version_cache (
+                    path_key TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL DEFAULT 0,
+                    version TEXT NOT NULL,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
             # Search history table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS search_history (
@@ -363,6 +380,49 @@ class DatabaseManager:
                 )
             """)
 
+            # Write-ahead journal of high-performance update sessions; rows only
+            # exist while a session is running, or after it was interrupted
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS update_sessions (
+                    id TEXT PRIMARY KEY,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS update_journal (
+                    session_id TEXT NOT NULL,
+                    target_path TEXT NOT NULL,
+                    source_dll_name TEXT NOT NULL,
+                    game_name TEXT NOT NULL,
+                    dll_type TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    backup_path TEXT,
+                    checksum TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (session_id, target_path),
+                    FOREIGN KEY (session_id) REFERENCES update_sessions(id) ON DELETE CASCADE
+                )
+            """)
+
+            # Directories (relative to the game root) where DLLs were found, per
+            # engine and launcher; guided search probes the most frequent first
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_location_priors (
+                    engine TEXT NOT NULL,
+                    launcher TEXT NOT NULL,
+                    relative_dir TEXT NOT NULL,
+                    hits INTEGER DEFAULT 0,
+                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (engine, launcher, relative_dir)
+                )
+            """)
+
+            # Columns added after the initial release (CREATE TABLE IF NOT EXISTS
+            # leaves existing tables untouched, so add them explicitly)
+            self._ensure_column(cursor, "dll_backups", "blob_digest", "TEXT")
+            self._ensure_column(cursor, "dll_backups", "checksum", "TEXT")
+
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_launcher ON games(launcher)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_steam_app_id ON games(steam_app_id)")
@@ -370,6 +430,7 @@ class DatabaseManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_game_dlls_dll_type ON game_dlls(dll_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_dll_backups_game_dll_id ON dll_backups(game_dll_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_dll_backups_active ON dll_backups(is_active)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_dll_backups_blob_digest ON dll_backups(blob_digest)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_update_history_game_dll_id ON update_history(game_dll_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_steam_name ON steam_app_list(name COLLATE NOCASE)")
 
@@ -391,11 +452,19 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    @staticmethod
+    def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, definition: str):
+        """Add a column to an existing table if it is missing (schema migration)"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            logger.info(f"Added column {table}.{column}")
+
     # ===== Game Operations =====
 
     async def upsert_game(self, game_data: dict[str, Any]) -> Game | None:
         """Insert or update game record"""
-        return await asyncio.to_thread(self._upsert_game, game_data)
+        return await run_in_pool(ExecutorPool.DB, self._upsert_game, game_data)
 
     def _upsert_game(self, game_data: dict[str, Any]) -> Game | None:
         """Upsert game (runs in thread) - uses thread-local connection"""
@@ -441,7 +510,7 @@ class DatabaseManager:
 
     async def get_games_grouped_by_launcher(self) -> dict[str, list[Game]]:
         """Get all games grouped by launcher"""
-        return await asyncio.to_thread(self._get_games_grouped_by_launcher)
+        return await run_in_pool(ExecutorPool.DB, self._get_games_grouped_by_launcher)
 
     def _get_games_grouped_by_launcher(self) -> dict[str, list[Game]]:
         """Get games grouped by launcher (runs in thread) - uses thread-local connection"""
@@ -492,7 +561,7 @@ class DatabaseManager:
         even if they have the same name. Use merge_games_by_name() in UI layer
         to properly merge while preserving all paths.
         """
-        return await asyncio.to_thread(self._get_all_games_by_launcher)
+        return await run_in_pool(ExecutorPool.DB, self._get_all_games_by_launcher)
 
     def _get_all_games_by_launcher(self) -> dict[str, list[Game]]:
         """Get all games by launcher (no GROUP BY) - uses thread-local connection"""
@@ -537,7 +606,7 @@ class DatabaseManager:
         Returns:
             Number of games deleted
         """
-        return await asyncio.to_thread(self._delete_all_games)
+        return await run_in_pool(ExecutorPool.DB, self._delete_all_games)
 
     def _delete_all_games(self):
         """Delete all games (runs in thread)"""
@@ -571,7 +640,7 @@ class DatabaseManager:
         Returns:
             Number of duplicate entries removed
         """
-        return await asyncio.to_thread(self._cleanup_duplicate_games)
+        return await run_in_pool(ExecutorPool.DB, self._cleanup_duplicate_games)
 
     def _cleanup_duplicate_games(self):
         """Cleanup duplicate games (runs in thread) - optimized with batched SQL"""
@@ -650,7 +719,7 @@ class DatabaseManager:
 
     async def upsert_game_dll(self, dll_data: dict[str, Any]) -> GameDLL | None:
         """Insert or update game DLL record"""
-        return await asyncio.to_thread(self._upsert_game_dll, dll_data)
+        return await run_in_pool(ExecutorPool.DB, self._upsert_game_dll, dll_data)
 
     def _upsert_game_dll(self, dll_data: dict[str, Any]) -> GameDLL | None:
         """Upsert game DLL (runs in thread)"""
@@ -700,7 +769,7 @@ class DatabaseManager:
 
     async def get_game_dll_by_path(self, dll_path: str) -> GameDLL | None:
         """Get game DLL by path"""
-        return await asyncio.to_thread(self._get_game_dll_by_path, dll_path)
+        return await run_in_pool(ExecutorPool.DB, self._get_game_dll_by_path, dll_path)
 
     def _get_game_dll_by_path(self, dll_path: str) -> GameDLL | None:
         """Get game DLL by path (runs in thread)"""
@@ -735,7 +804,7 @@ class DatabaseManager:
 
     async def get_dlls_for_game(self, game_id: int) -> list[GameDLL]:
         """Get all DLLs for a specific game"""
-        return await asyncio.to_thread(self._get_dlls_for_game, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_dlls_for_game, game_id)
 
     def _get_dlls_for_game(self, game_id: int) -> list[GameDLL]:
         """Get DLLs for game (runs in thread)"""
@@ -769,9 +838,60 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def batch_get_dlls_for_games(self, game_ids: list[int]) -> dict[int, list[GameDLL]]:
+        """
+        Get DLLs for many games in a single query per chunk.
+
+        Args:
+            game_ids: List of game IDs
+
+        Returns:
+            Dict mapping game_id to its DLLs (games without DLLs map to [])
+        """
+        if not game_ids:
+            return {}
+        return await run_in_pool(ExecutorPool.DB, self._batch_get_dlls_for_games, game_ids)
+
+    def _batch_get_dlls_for_games(self, game_ids: list[int]) -> dict[int, list[GameDLL]]:
+        """Batch get DLLs for games (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        CHUNK_SIZE = 500  # Stay well below SQLite's host parameter limit
+
+        try:
+            result: dict[int, list[GameDLL]] = {gid: [] for gid in game_ids}
+            unique_ids = list(result)
+
+            for i in range(0, len(unique_ids), CHUNK_SIZE):
+                chunk = unique_ids[i:i + CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT id, game_id, dll_type, dll_filename, dll_path, current_version, detected_at
+                    FROM game_dlls
+                    WHERE game_id IN ({placeholders})
+                    ORDER BY game_id, id
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    result[row[1]].append(GameDLL(
+                        id=row[0],
+                        game_id=row[1],
+                        dll_type=row[2],
+                        dll_filename=row[3],
+                        dll_path=row[4],
+                        current_version=row[5],
+                        detected_at=datetime.fromisoformat(row[6])
+                    ))
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error batch getting DLLs for games: {e}", exc_info=True)
+            return {gid: [] for gid in game_ids}
+
     async def get_game_dll_by_path(self, dll_path: str) -> GameDLL | None:
         """Get DLL record by file path"""
-        return await asyncio.to_thread(self._get_game_dll_by_path, dll_path)
+        return await run_in_pool(ExecutorPool.DB, self._get_game_dll_by_path, dll_path)
 
     def _get_game_dll_by_path(self, dll_path: str) -> GameDLL | None:
         """Get DLL by path (runs in thread)"""
@@ -804,9 +924,44 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def get_game_dll_by_id(self, dll_id: int) -> GameDLL | None:
+        """Get DLL by ID"""
+        return await run_in_pool(ExecutorPool.DB, self._get_game_dll_by_id, dll_id)
+
+    def _get_game_dll_by_id(self, dll_id: int) -> GameDLL | None:
+        """Get DLL by ID (runs in thread)"""
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT id, game_id, dll_type, dll_filename, dll_path, current_version, detected_at
+                FROM game_dlls
+                WHERE id = ?
+            """, (dll_id,))
+
+            row = cursor.fetchone()
+            if row:
+                return GameDLL(
+                    id=row[0],
+                    game_id=row[1],
+                    dll_type=row[2],
+                    dll_filename=row[3],
+                    dll_path=row[4],
+                    current_version=row[5],
+                    detected_at=datetime.fromisoformat(row[6])
+                )
+            return None
+
+        except Exception as e:
+            logger.error(f"Error getting DLL by ID: {e}", exc_info=True)
+            return None
+        finally:
+            conn.close()
+
     async def update_game_dll_version(self, dll_id: int, new_version: str):
         """Update DLL version"""
-        return await asyncio.to_thread(self._update_game_dll_version, dll_id, new_version)
+        return await run_in_pool(ExecutorPool.DB, self._update_game_dll_version, dll_id, new_version)
 
     def _update_game_dll_version(self, dll_id: int, new_version: str):
         """Update DLL version (runs in thread)"""
@@ -830,7 +985,11 @@ class DatabaseManager:
 
     # ===== Batch Operations (Performance Optimized) =====
 
-    async def batch_upsert_games(self, games: list[dict[str, Any]]) -> dict[str, Game]:
+    async def batch_upsert_games(
+        self,
+        games: list[dict[str, Any]],
+        update_launcher: bool = False
+    ) -> dict[str, Game]:
         """
         Batch upsert multiple games in a single transaction.
 
@@ -839,6 +998,8 @@ class DatabaseManager:
 
         Args:
             games: List of game dicts with keys: name, path, launcher, steam_app_id
+            update_launcher: Replace the launcher of existing games (by default
+                a game keeps the launcher it was first recorded with)
 
         Returns:
             Dict mapping path to Game object
@@ -846,9 +1007,9 @@ class DatabaseManager:
         if not games:
             return {}
 
-        return await asyncio.to_thread(self._batch_upsert_games, games)
+        return await run_in_pool(ExecutorPool.DB, self._batch_upsert_games, games, update_launcher)
 
-    def _batch_upsert_games(self, games: list[dict[str, Any]]) -> dict[str, Game]:
+    def _batch_upsert_games(self, games: list[dict[str, Any]], update_launcher: bool = False) -> dict[str, Game]:
         """Batch upsert games (runs in thread) - uses thread-local connection"""
         conn = self._get_thread_connection()
         cursor = conn.cursor()
@@ -861,11 +1022,13 @@ class DatabaseManager:
                 for g in games
             ]
 
-            cursor.executemany("""
+            launcher_update = "launcher = excluded.launcher," if update_launcher else ""
+            cursor.executemany(f"""
                 INSERT INTO games (name, path, launcher, steam_app_id, last_scanned)
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
                 ON CONFLICT(path) DO UPDATE SET
                     name = excluded.name,
+                    {launcher_update}
                     steam_app_id = COALESCE(excluded.steam_app_id, games.steam_app_id),
                     last_scanned = CURRENT_TIMESTAMP
             """, game_data)
@@ -917,7 +1080,7 @@ class DatabaseManager:
         if not dlls:
             return 0
 
-        return await asyncio.to_thread(self._batch_upsert_dlls, dlls)
+        return await run_in_pool(ExecutorPool.DB, self._batch_upsert_dlls, dlls)
 
     def _batch_upsert_dlls(self, dlls: list[dict[str, Any]]) -> int:
         """Batch upsert DLLs (runs in thread) - uses thread-local connection"""
@@ -951,11 +1114,188 @@ class DatabaseManager:
             conn.rollback()
             return 0
 
+    async def delete_games_without_dlls(self, game_paths: list[str]) -> int:
+        """
+        Delete the given games if they no longer have any DLLs.
+
+        Args:
+            game_paths: Paths of games whose DLLs may have moved to other games
+
+        Returns:
+            Number of games deleted
+        """
+        if not game_paths:
+            return 0
+        return await run_in_pool(ExecutorPool.DB, self._delete_games_without_dlls, game_paths)
+
+    def _delete_games_without_dlls(self, game_paths: list[str]) -> int:
+        """Delete games left without DLLs (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                DELETE FROM games
+                WHERE path = ?
+                  AND NOT EXISTS (SELECT 1 FROM game_dlls gd WHERE gd.game_id = games.id)
+            """, [(path,) for path in game_paths])
+            removed = cursor.rowcount
+            conn.commit()
+            return removed
+
+        except Exception as e:
+            logger.error(f"Error deleting games without DLLs: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
+    async def prune_missing_under(self, directory: str, present_dll_paths: list[str]) -> tuple[int, int]:
+        """
+        Remove DLLs and games under a rescanned directory that are gone from disk.
+
+        DLLs that still have backups are kept (so they stay restorable), and
+        so is any game that still has DLLs.
+
+        Args:
+            directory: Directory that was rescanned
+            present_dll_paths: DLL paths the rescan found under it
+
+        Returns:
+            Tuple of (games removed, DLLs removed)
+        """
+        return await run_in_pool(ExecutorPool.DB, self._prune_missing_under, directory, present_dll_paths)
+
+    def _prune_missing_under(self, directory: str, present_dll_paths: list[str]) -> tuple[int, int]:
+        """Prune vanished DLLs and games in one transaction (runs in thread)"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        # substr() instead of LIKE: game folder names may contain % or _
+        prefix = directory.rstrip("/\\") + os.sep
+
+        try:
+            cursor.execute("""
+                SELECT gd.id, gd.dll_path
+                FROM game_dlls gd
+                WHERE substr(gd.dll_path, 1, ?) = ?
+                  AND NOT EXISTS (SELECT 1 FROM dll_backups b WHERE b.game_dll_id = gd.id)
+            """, (len(prefix), prefix))
+            present = set(present_dll_paths)
+            stale_ids = [(row[0],) for row in cursor.fetchall() if row[1] not in present]
+
+            # Foreign keys are not enforced on these connections, so the
+            # dependent rows ON DELETE CASCADE describes are removed by hand
+            cursor.executemany("DELETE FROM update_history WHERE game_dll_id = ?", stale_ids)
+            cursor.executemany("DELETE FROM game_dlls WHERE id = ?", stale_ids)
+
+            cursor.execute("""
+                DELETE FROM games
+                WHERE (path = ? OR substr(path, 1, ?) = ?)
+                  AND NOT EXISTS (SELECT 1 FROM game_dlls gd WHERE gd.game_id = games.id)
+            """, (directory, len(prefix), prefix))
+            removed_games = cursor.rowcount
+
+            conn.commit()
+            return removed_games, len(stale_ids)
+
+        except Exception as e:
+            logger.error(f"Error pruning missing games under {directory}: {e}", exc_info=True)
+            conn.rollback()
+            return 0, 0
+
+    # ===== DLL Version Cache Operations =====
+    # get_dll_versions_cached() runs in worker threads, so the cache is only
+    # exposed through blocking *_sync methods
+
+    def get_cached_dll_versions_sync(self, fingerprints: list[tuple[str, int, int, int]]) -> dict[str, str]:
+        """
+        Look up cached versions for many DLLs in batched queries (blocking).
+
+        Args:
+            fingerprints: List of (path_key, file_size, mtime_ns, inode) tuples
+
+        Returns:
+            Dict mapping path_key to version for entries whose fingerprint still matches
+        """
+        if not fingerprints:
+            return {}
+        return self._get_cached_dll_versions(fingerprints)
+
+    def store_dll_versions_sync(self, entries: list[tuple[str, int, int, int, str]]) -> int:
+        """
+        Batch upsert DLL versions into the persistent version cache (blocking).
+
+        Args:
+            entries: List of (path_key, file_size, mtime_ns, inode, version) tuples
+
+        Returns:
+            Number of entries stored
+        """
+        if not entries:
+            return 0
+        return self._store_dll_versions(entries)
+
+    def _get_cached_dll_versions(
+        self,
+        fingerprints: list[tuple[str, int, int, int]]
+    ) -> dict[str, str]:
+        """Batch lookup of cached DLL versions (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        CHUNK_SIZE = 500  # Stay well below SQLite's host parameter limit
+
+        try:
+            expected = {fp[0]: fp[1:] for fp in fingerprints}
+            keys = list(expected)
+            result = {}
+
+            for i in range(0, len(keys), CHUNK_SIZE):
+                chunk = keys[i:i + CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT path_key, file_size, mtime_ns, inode, version
+                    FROM dll_version_cache
+                    WHERE path_key IN ({placeholders})
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    if (row[1], row[2], row[3]) == expected[row[0]]:
+                        result[row[0]] = row[4]
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error reading DLL version cache: {e}", exc_info=True)
+            return {}
+
+    def _store_dll_versions(self, entries: list[tuple[str, int, int, int, str]]) -> int:
+        """Batch upsert cached DLL versions (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                INSERT INTO dll_version_cache (path_key, file_size, mtime_ns, inode, version)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path_key) DO UPDATE SET
+                    file_size = excluded.file_size,
+                    mtime_ns = excluded.mtime_ns,
+                    inode = excluded.inode,
+                    version = excluded.version,
+                    cached_at = CURRENT_TIMESTAMP
+            """, entries)
+
+            conn.commit()
+            return len(entries)
+
+        except Exception as e:
+            logger.error(f"Error writing DLL version cache: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
     # ===== Backup Operations =====
 
     async def insert_backup(self, backup_data: dict[str, Any]) -> int | None:
         """Insert backup record"""
-        return await asyncio.to_thread(self._insert_backup, backup_data)
+        return await run_in_pool(ExecutorPool.DB, self._insert_backup, backup_data)
 
     def _insert_backup(self, backup_data: dict[str, Any]) -> int | None:
         """Insert backup (runs in thread)"""
@@ -964,14 +1304,18 @@ class DatabaseManager:
 
         try:
             cursor.execute("""
-                INSERT INTO dll_backups (game_dll_id, backup_path, original_version, backup_size)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO dll_backups (
+                    game_dll_id, backup_path, original_version, backup_size, blob_digest, checksum
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
                 RETURNING id
             """, (
                 backup_data['game_dll_id'],
                 backup_data['backup_path'],
                 backup_data.get('original_version'),
-                backup_data.get('backup_size', 0)
+                backup_data.get('backup_size', 0),
+                backup_data.get('blob_digest'),
+                backup_data.get('checksum')
             ))
 
             backup_id = cursor.fetchone()[0]
@@ -987,7 +1331,7 @@ class DatabaseManager:
 
     async def get_all_backups(self) -> list[DLLBackup]:
         """Get all active backups"""
-        return await asyncio.to_thread(self._get_all_backups)
+        return await run_in_pool(ExecutorPool.DB, self._get_all_backups)
 
     def _get_all_backups(self) -> list[DLLBackup]:
         """Get all backups (runs in thread)"""
@@ -999,7 +1343,7 @@ class DatabaseManager:
                 SELECT
                     b.id, b.game_dll_id, g.name, d.dll_filename,
                     b.backup_path, b.original_version, b.backup_created_at,
-                    b.backup_size, b.is_active
+                    b.backup_size, b.is_active, b.blob_digest, b.checksum
                 FROM dll_backups b
                 JOIN game_dlls d ON b.game_dll_id = d.id
                 JOIN games g ON d.game_id = g.id
@@ -1018,7 +1362,9 @@ class DatabaseManager:
                     original_version=row[5],
                     backup_created_at=datetime.fromisoformat(row[6]),
                     backup_size=row[7],
-                    is_active=bool(row[8])
+                    is_active=bool(row[8]),
+                    blob_digest=row[9],
+                    checksum=row[10]
                 ))
 
             return backups
@@ -1031,7 +1377,7 @@ class DatabaseManager:
 
     async def get_backup_by_id(self, backup_id: int) -> DLLBackup | None:
         """Get backup by ID"""
-        return await asyncio.to_thread(self._get_backup_by_id, backup_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_backup_by_id, backup_id)
 
     def _get_backup_by_id(self, backup_id: int) -> DLLBackup | None:
         """Get backup by ID (runs in thread)"""
@@ -1043,7 +1389,7 @@ class DatabaseManager:
                 SELECT
                     b.id, b.game_dll_id, g.name, d.dll_filename,
                     b.backup_path, b.original_version, b.backup_created_at,
-                    b.backup_size, b.is_active
+                    b.backup_size, b.is_active, b.blob_digest, b.checksum
                 FROM dll_backups b
                 JOIN game_dlls d ON b.game_dll_id = d.id
                 JOIN games g ON d.game_id = g.id
@@ -1061,7 +1407,9 @@ class DatabaseManager:
                     original_version=row[5],
                     backup_created_at=datetime.fromisoformat(row[6]),
                     backup_size=row[7],
-                    is_active=bool(row[8])
+                    is_active=bool(row[8]),
+                    blob_digest=row[9],
+                    checksum=row[10]
                 )
             return None
 
@@ -1071,9 +1419,65 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def _get_unreferenced_blob_digests(self) -> list[str]:
+        """Get unreferenced blob digests (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT DISTINCT blob_digest FROM dll_backups
+                WHERE blob_digest IS NOT NULL
+                GROUP BY blob_digest
+                HAVING SUM(is_active) = 0
+            """)
+            return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error getting unreferenced blob digests: {e}", exc_info=True)
+            return []
+
+    async def get_active_blob_digests(self, game_dll_id: int) -> list[str]:
+        """Get digests of the backup blobs a game DLL's active backups reference"""
+        return await run_in_pool(ExecutorPool.DB, self._get_active_blob_digests, game_dll_id)
+
+    def _get_active_blob_digests(self, game_dll_id: int) -> list[str]:
+        """Get blob digests of a game DLL's active backups (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT DISTINCT blob_digest FROM dll_backups
+                WHERE game_dll_id = ? AND is_active = 1 AND blob_digest IS NOT NULL
+            """, (game_dll_id,))
+            return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error getting active blob digests: {e}", exc_info=True)
+            return []
+
+    def _is_blob_referenced(self, digest: str) -> bool:
+        """Check blob references (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT 1 FROM dll_backups
+                WHERE blob_digest = ? AND is_active = 1
+                LIMIT 1
+            """, (digest,))
+            return cursor.fetchone() is not None
+
+        except Exception as e:
+            # Err on the side of keeping the blob
+            logger.error(f"Error checking blob references: {e}", exc_info=True)
+            return True
+
     async def mark_backup_inactive(self, backup_id: int):
         """Mark backup as inactive"""
-        return await asyncio.to_thread(self._mark_backup_inactive, backup_id)
+        return await run_in_pool(ExecutorPool.DB, self._mark_backup_inactive, backup_id)
 
     def _mark_backup_inactive(self, backup_id: int):
         """Mark backup inactive (runs in thread)"""
@@ -1097,7 +1501,7 @@ class DatabaseManager:
 
     async def mark_old_backups_inactive(self, game_dll_id: int):
         """Mark all existing backups for a game DLL as inactive"""
-        return await asyncio.to_thread(self._mark_old_backups_inactive, game_dll_id)
+        return await run_in_pool(ExecutorPool.DB, self._mark_old_backups_inactive, game_dll_id)
 
     def _mark_old_backups_inactive(self, game_dll_id: int):
         """Mark old backups inactive (runs in thread)"""
@@ -1128,7 +1532,7 @@ class DatabaseManager:
         Clean up duplicate backup entries by keeping only the most recent backup for each DLL
         This is a one-time cleanup for existing databases with duplicates
         """
-        return await asyncio.to_thread(self._cleanup_duplicate_backups)
+        return await run_in_pool(ExecutorPool.DB, self._cleanup_duplicate_backups)
 
     def _cleanup_duplicate_backups(self):
         """Cleanup duplicate backups (runs in thread)"""
@@ -1176,7 +1580,7 @@ class DatabaseManager:
 
     async def delete_all_backups(self):
         """Mark all active backups as inactive"""
-        return await asyncio.to_thread(self._delete_all_backups)
+        return await run_in_pool(ExecutorPool.DB, self._delete_all_backups)
 
     def _delete_all_backups(self):
         """Delete all backups (runs in thread)"""
@@ -1208,7 +1612,7 @@ class DatabaseManager:
 
     async def record_update_history(self, history_data: dict[str, Any]):
         """Record update history"""
-        return await asyncio.to_thread(self._record_update_history, history_data)
+        return await run_in_pool(ExecutorPool.DB, self._record_update_history, history_data)
 
     def _record_update_history(self, history_data: dict[str, Any]):
         """Record update history (runs in thread)"""
@@ -1234,11 +1638,239 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    # ===== Update Journal Operations =====
+    # The journal records from worker threads of the update pipeline, so its
+    # writes are exposed as blocking *_sync methods next to the async API
+
+    def begin_update_session_sync(self, session_id: str, entries: list[tuple[str, str, str, str]]) -> bool:
+        """Journal a new update session (blocking; see _begin_update_session)"""
+        return self._begin_update_session(session_id, entries)
+
+    def write_journal_states_sync(self, session_id: str, states: list[tuple[str, str, str | None, str | None]]) -> int:
+        """Batch-apply journal state changes (blocking; see _write_journal_states)"""
+        return self._write_journal_states(session_id, states)
+
+    def finish_update_session_sync(self, session_id: str):
+        """Drop a finished session and its journal (blocking)"""
+        return self._finish_update_session(session_id)
+
+    def _begin_update_session(self, session_id: str, entries: list[tuple[str, str, str, str]]) -> bool:
+        """
+        Journal a new update session with every DLL in the PLANNED state.
+
+        Args:
+            session_id: Unique session identifier
+            entries: (target_path, source_dll_name, game_name, dll_type) tuples
+
+        Returns:
+            True if the session was journaled
+        """
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("INSERT INTO update_sessions (id) VALUES (?)", (session_id,))
+            cursor.executemany("""
+                INSERT OR REPLACE INTO update_journal
+                    (session_id, target_path, source_dll_name, game_name, dll_type, state)
+                VALUES (?, ?, ?, ?, ?, 'planned')
+            """, [(session_id, *entry) for entry in entries])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error journaling update session: {e}", exc_info=True)
+            conn.rollback()
+            return False
+
+    def _write_journal_states(self, session_id: str, states: list[tuple[str, str, str | None, str | None]]) -> int:
+        """
+        Batch-apply journal state changes for one session.
+
+        Args:
+            session_id: Session the entries belong to
+            states: (target_path, state, backup_path, checksum) tuples;
+                None keeps the previously journaled backup path/checksum
+
+        Returns:
+            Number of state changes written
+        """
+        if not states:
+            return 0
+
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                UPDATE update_journal
+                SET state = ?,
+                    backup_path = COALESCE(?, backup_path),
+                    checksum = COALESCE(?, checksum),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE session_id = ? AND target_path = ?
+            """, [
+                (state, backup_path, checksum, session_id, target_path)
+                for target_path, state, backup_path, checksum in states
+            ])
+
+            conn.commit()
+            return len(states)
+
+        except Exception as e:
+            logger.error(f"Error writing update journal: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
+    async def finish_update_session(self, session_id: str):
+        """Drop a finished (or resolved) session and its journal"""
+        return await run_in_pool(ExecutorPool.DB, self._finish_update_session, session_id)
+
+    def _finish_update_session(self, session_id: str):
+        """Delete a session and its journal entries (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DELETE FROM update_journal WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM update_sessions WHERE id = ?", (session_id,))
+            conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error finishing update session: {e}", exc_info=True)
+            conn.rollback()
+
+    async def get_incomplete_update_sessions(self) -> list[IncompleteUpdateSession]:
+        """Get journaled update sessions that never finished, oldest first"""
+        return await run_in_pool(ExecutorPool.DB, self._get_incomplete_update_sessions)
+
+    def _get_incomplete_update_sessions(self) -> list[IncompleteUpdateSession]:
+        """Get incomplete update sessions (runs in thread)"""
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT
+                    s.id, s.started_at, j.target_path, j.source_dll_name,
+                    j.game_name, j.dll_type, j.state, j.backup_path, j.checksum
+                FROM update_sessions s
+                LEFT JOIN update_journal j ON j.session_id = s.id
+                ORDER BY s.started_at, j.target_path
+            """)
+
+            sessions: dict[str, IncompleteUpdateSession] = {}
+            for row in cursor.fetchall():
+                session = sessions.get(row[0])
+                if session is None:
+                    session = sessions[row[0]] = IncompleteUpdateSession(
+                        session_id=row[0],
+                        started_at=datetime.fromisoformat(row[1])
+                    )
+                if row[2] is not None:
+                    session.entries.append(UpdateJournalEntry(
+                        target_path=row[2],
+                        source_dll_name=row[3],
+                        game_name=row[4],
+                        dll_type=row[5],
+                        state=row[6],
+                        backup_path=row[7],
+                        checksum=row[8]
+                    ))
+
+            return list(sessions.values())
+
+        except Exception as e:
+            logger.error(f"Error getting incomplete update sessions: {e}", exc_info=True)
+            return []
+        finally:
+            conn.close()
+
+    # ===== Guided Search Priors =====
+
+    async def get_dll_location_priors(self) -> list[DLLLocationPrior]:
+        """Get every learned DLL location, most frequent first"""
+        return await run_in_pool(ExecutorPool.DB, self._get_dll_location_priors)
+
+    def _get_dll_location_priors(self) -> list[DLLLocationPrior]:
+        """Get learned DLL locations (runs in thread)"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT engine, launcher, relative_dir, hits
+                FROM dll_location_priors
+                ORDER BY hits DESC, last_seen DESC
+            """)
+            return [
+                DLLLocationPrior(engine=row[0], launcher=row[1], relative_dir=row[2], hits=row[3])
+                for row in cursor.fetchall()
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting DLL location priors: {e}", exc_info=True)
+            return []
+
+    async def get_known_dll_directories(self) -> list[str]:
+        """Get the folders of every recorded game DLL"""
+        return await run_in_pool(ExecutorPool.DB, self._get_known_dll_directories)
+
+    def _get_known_dll_directories(self) -> list[str]:
+        """Get recorded DLL folders (runs in thread)"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT dll_path FROM game_dlls")
+            return list(dict.fromkeys(os.path.dirname(row[0]) for row in cursor.fetchall()))
+
+        except Exception as e:
+            logger.error(f"Error getting recorded DLL folders: {e}", exc_info=True)
+            return []
+
+    async def record_dll_locations(self, locations: list[tuple[str, str, str, int]]) -> int:
+        """
+        Add hits to learned DLL locations.
+
+        Args:
+            locations: (engine, launcher, relative_dir, hits) tuples
+
+        Returns:
+            Number of locations written
+        """
+        return await run_in_pool(ExecutorPool.DB, self._record_dll_locations, locations)
+
+    def _record_dll_locations(self, locations: list[tuple[str, str, str, int]]) -> int:
+        """Upsert learned DLL locations in one transaction (runs in thread)"""
+        if not locations:
+            return 0
+
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                INSERT INTO dll_location_priors (engine, launcher, relative_dir, hits, last_seen)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(engine, launcher, relative_dir) DO UPDATE SET
+                    hits = hits + excluded.hits,
+                    last_seen = CURRENT_TIMESTAMP
+            """, locations)
+            conn.commit()
+            return len(locations)
+
+        except Exception as e:
+            logger.error(f"Error recording DLL locations: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
     # ===== Steam Integration Operations =====
 
     async def upsert_steam_app(self, app_id: int, name: str):
         """Insert or update Steam app list entry"""
-        return await asyncio.to_thread(self._upsert_steam_app, app_id, name)
+        return await run_in_pool(ExecutorPool.DB, self._upsert_steam_app, app_id, name)
 
     def _upsert_steam_app(self, app_id: int, name: str):
         """Upsert Steam app (runs in thread)"""
@@ -1264,7 +1896,7 @@ class DatabaseManager:
 
     async def find_steam_app_by_name(self, game_name: str) -> int | None:
         """Find Steam app ID by game name"""
-        return await asyncio.to_thread(self._find_steam_app_by_name, game_name)
+        return await run_in_pool(ExecutorPool.DB, self._find_steam_app_by_name, game_name)
 
     def _find_steam_app_by_name(self, game_name: str) -> int | None:
         """Find Steam app by name (runs in thread)"""
@@ -1307,7 +1939,7 @@ class DatabaseManager:
 
     async def get_steam_app_list_timestamp(self) -> datetime | None:
         """Get timestamp of last Steam app list update"""
-        return await asyncio.to_thread(self._get_steam_app_list_timestamp)
+        return await run_in_pool(ExecutorPool.DB, self._get_steam_app_list_timestamp)
 
     def _get_steam_app_list_timestamp(self) -> datetime | None:
         """Get Steam app list timestamp (runs in thread)"""
@@ -1332,7 +1964,7 @@ class DatabaseManager:
 
     async def cache_steam_image(self, app_id: int, local_path: str):
         """Cache Steam image metadata"""
-        return await asyncio.to_thread(self._cache_steam_image, app_id, local_path)
+        return await run_in_pool(ExecutorPool.DB, self._cache_steam_image, app_id, local_path)
 
     def _cache_steam_image(self, app_id: int, local_path: str):
         """Cache Steam image (runs in thread)"""
@@ -1363,7 +1995,7 @@ class DatabaseManager:
 
     async def get_cached_image_path(self, app_id: int) -> str | None:
         """Get cached image path for Steam app"""
-        return await asyncio.to_thread(self._get_cached_image_path, app_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_cached_image_path, app_id)
 
     def _get_cached_image_path(self, app_id: int) -> str | None:
         """Get cached image path (runs in thread)"""
@@ -1387,7 +2019,7 @@ class DatabaseManager:
 
     async def mark_image_fetch_failed(self, app_id: int):
         """Mark image fetch as failed"""
-        return await asyncio.to_thread(self._mark_image_fetch_failed, app_id)
+        return await run_in_pool(ExecutorPool.DB, self._mark_image_fetch_failed, app_id)
 
     def _mark_image_fetch_failed(self, app_id: int):
         """Mark image fetch failed (runs in thread)"""
@@ -1415,7 +2047,7 @@ class DatabaseManager:
 
     async def is_image_fetch_failed(self, app_id: int) -> bool:
         """Check if image fetch has already failed for this app"""
-        return await asyncio.to_thread(self._is_image_fetch_failed, app_id)
+        return await run_in_pool(ExecutorPool.DB, self._is_image_fetch_failed, app_id)
 
     def _is_image_fetch_failed(self, app_id: int) -> bool:
         """Check if image fetch failed (runs in thread)"""
@@ -1437,13 +2069,66 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def batch_get_image_cache_status(
+        self,
+        app_ids: list[int]
+    ) -> dict[int, tuple[str | None, bool]]:
+        """
+        Resolve cached image paths and failed flags for many Steam apps at once.
+
+        Replaces a get_cached_image_path() + is_image_fetch_failed() pair per
+        game card with one query per launcher tab.
+
+        Args:
+            app_ids: Steam app IDs to look up
+
+        Returns:
+            Dict mapping app_id to (local_path, fetch_failed). local_path is None
+            when the fetch failed; apps without a cache row are omitted.
+        """
+        if not app_ids:
+            return {}
+        return await run_in_pool(ExecutorPool.DB, self._batch_get_image_cache_status, app_ids)
+
+    def _batch_get_image_cache_status(
+        self,
+        app_ids: list[int]
+    ) -> dict[int, tuple[str | None, bool]]:
+        """Batch image cache lookup (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        CHUNK_SIZE = 500  # Stay well below SQLite's host parameter limit
+
+        try:
+            unique_ids = list(dict.fromkeys(app_ids))
+            result = {}
+
+            for i in range(0, len(unique_ids), CHUNK_SIZE):
+                chunk = unique_ids[i:i + CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT steam_app_id, local_path, fetch_failed
+                    FROM steam_images
+                    WHERE steam_app_id IN ({placeholders})
+                """, chunk)
+
+                for app_id, local_path, fetch_failed in cursor.fetchall():
+                    failed = fetch_failed == 1
+                    result[app_id] = (None if failed else local_path, failed)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error batch reading image cache: {e}", exc_info=True)
+            return {}
+
     async def clear_steam_images_cache(self):
         """
         Clear all steam image cache entries (for migration).
 
-        Non-blocking: runs in thread pool via asyncio.to_thread().
+        Non-blocking: runs in the shared db thread pool.
         """
-        return await asyncio.to_thread(self._clear_steam_images_cache)
+        return await run_in_pool(ExecutorPool.DB, self._clear_steam_images_cache)
 
     def _clear_steam_images_cache(self):
         """Clear all steam image cache entries (runs in thread)."""
@@ -1480,7 +2165,7 @@ class DatabaseManager:
         if not apps:
             return 0
 
-        return await asyncio.to_thread(self._upsert_steam_apps, apps)
+        return await run_in_pool(ExecutorPool.DB, self._upsert_steam_apps, apps)
 
     def _upsert_steam_apps(self, apps: list[tuple[int, str, str]]) -> int:
         """Bulk upsert Steam apps (runs in thread)"""
@@ -1519,6 +2204,99 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def replace_steam_apps(
+        self,
+        batches: AsyncIterator[list[tuple[int, str, str]]]
+    ) -> int:
+        """
+        Replace the whole Steam app list from a stream of batches.
+
+        Batches are staged in a TEMP table (separate temp database, so no lock
+        is held on games.db while the download is still streaming), then swapped
+        into steam_apps in a single transaction. Readers keep seeing the previous
+        list until the swap commits; if nothing was staged the existing list is
+        left untouched.
+
+        Args:
+            batches: Async iterator yielding lists of (appid, name, name_normalized)
+
+        Returns:
+            Number of apps in the new list (0 if nothing was replaced)
+        """
+        conn = await run_in_pool(ExecutorPool.DB, self._begin_steam_apps_staging)
+        try:
+            staged = 0
+            async for batch in batches:
+                if batch:
+                    await run_in_pool(ExecutorPool.DB, self._stage_steam_apps_batch, conn, batch)
+                    staged += len(batch)
+
+            if not staged:
+                logger.warning("No Steam apps staged, keeping existing app list")
+                return 0
+
+            return await run_in_pool(ExecutorPool.DB, self._swap_staged_steam_apps, conn)
+
+        except Exception as e:
+            logger.error(f"Error replacing Steam apps: {e}", exc_info=True)
+            return 0
+        finally:
+            await run_in_pool(ExecutorPool.DB, conn.close)
+
+    def _begin_steam_apps_staging(self) -> sqlite3.Connection:
+        """Open a dedicated connection with an empty staging table (runs in thread)"""
+        # Batches are fed from successive to_thread() calls, which may land on
+        # different worker threads; they never run concurrently
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS steam_apps_staging (
+                appid INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                name_normalized TEXT NOT NULL
+            )
+        """)
+        conn.execute("DELETE FROM temp.steam_apps_staging")
+        conn.commit()
+        return conn
+
+    def _stage_steam_apps_batch(self, conn: sqlite3.Connection, batch: list[tuple[int, str, str]]):
+        """Append one batch to the staging table (runs in thread)"""
+        conn.executemany("""
+            INSERT INTO temp.steam_apps_staging (appid, name, name_normalized)
+            VALUES (?, ?, ?)
+        """, batch)
+        conn.commit()
+
+    def _swap_staged_steam_apps(self, conn: sqlite3.Connection) -> int:
+        """Swap staged apps into steam_apps in one transaction (runs in thread)"""
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DELETE FROM steam_apps")
+            # Keep the last occurrence of an appid listed in several category
+            # files. Duplicates are dropped here rather than via INSERT OR REPLACE,
+            # whose implicit delete does not fire the FTS5 delete trigger.
+            cursor.execute("""
+                INSERT INTO steam_apps (appid, name, name_normalized)
+                SELECT appid, name, name_normalized
+                FROM temp.steam_apps_staging
+                WHERE rowid IN (
+                    SELECT MAX(rowid) FROM temp.steam_apps_staging GROUP BY appid
+                )
+            """)
+            cursor.execute("DELETE FROM temp.steam_apps_staging")
+            cursor.execute("SELECT COUNT(*) FROM steam_apps")
+            count = cursor.fetchone()[0]
+            conn.commit()
+            logger.info(f"Replaced Steam app list in database ({count} apps)")
+            return count
+
+        except Exception as e:
+            logger.error(f"Error swapping staged Steam apps: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
     async def search_steam_app(self, query: str, limit: int = 10) -> list[tuple[int, str]]:
         """
         FTS5 full-text search for Steam apps by name.
@@ -1532,7 +2310,7 @@ class DatabaseManager:
         Returns:
             List of tuples (appid, name) matching the query
         """
-        return await asyncio.to_thread(self._search_steam_app, query, limit)
+        return await run_in_pool(ExecutorPool.DB, self._search_steam_app, query, limit)
 
     def _search_steam_app(self, query: str, limit: int) -> list[tuple[int, str]]:
         """FTS5 search for Steam app (runs in thread)"""
@@ -1606,7 +2384,7 @@ class DatabaseManager:
         Returns:
             Steam app ID if found, None otherwise
         """
-        return await asyncio.to_thread(self._get_steam_app_by_name, name_normalized)
+        return await run_in_pool(ExecutorPool.DB, self._get_steam_app_by_name, name_normalized)
 
     def _get_steam_app_by_name(self, name_normalized: str) -> int | None:
         """Get Steam app by normalized name (runs in thread)"""
@@ -1638,7 +2416,7 @@ class DatabaseManager:
         Returns:
             Number of Steam apps in the database
         """
-        return await asyncio.to_thread(self._get_steam_apps_count)
+        return await run_in_pool(ExecutorPool.DB, self._get_steam_apps_count)
 
     def _get_steam_apps_count(self) -> int:
         """Get Steam apps count (runs in thread)"""
@@ -1662,7 +2440,7 @@ class DatabaseManager:
 
         This also clears the FTS5 index via the DELETE trigger.
         """
-        return await asyncio.to_thread(self._clear_steam_apps)
+        return await run_in_pool(ExecutorPool.DB, self._clear_steam_apps)
 
     def _clear_steam_apps(self):
         """Clear all Steam apps (runs in thread)"""
@@ -1691,7 +2469,7 @@ class DatabaseManager:
         Returns:
             List of GameDLLBackup objects for the game, ordered by creation date (newest first)
         """
-        return await asyncio.to_thread(self._get_backups_for_game, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_backups_for_game, game_id)
 
     def _get_backups_for_game(self, game_id: int) -> list[GameDLLBackup]:
         """Get backups for game (runs in thread)"""
@@ -1747,7 +2525,7 @@ class DatabaseManager:
         Returns:
             True if game has at least one active backup, False otherwise
         """
-        return await asyncio.to_thread(self._game_has_backups, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._game_has_backups, game_id)
 
     def _game_has_backups(self, game_id: int) -> bool:
         """Check if game has backups (runs in thread)"""
@@ -1786,7 +2564,7 @@ class DatabaseManager:
         Returns:
             GameBackupSummary if game has backups, None otherwise
         """
-        return await asyncio.to_thread(self._get_game_backup_summary, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_game_backup_summary, game_id)
 
     def _get_game_backup_summary(self, game_id: int) -> GameBackupSummary | None:
         """Get game backup summary (runs in thread)"""
@@ -1853,7 +2631,7 @@ class DatabaseManager:
         Returns:
             Dict mapping dll_type (e.g., "DLSS", "FSR") to list of DLLBackup objects
         """
-        return await asyncio.to_thread(self._get_backups_grouped_by_dll_type, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_backups_grouped_by_dll_type, game_id)
 
     def _get_backups_grouped_by_dll_type(self, game_id: int) -> dict[str, list[DLLBackup]]:
         """Get backups grouped by DLL type (runs in thread)"""
@@ -1900,6 +2678,75 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def batch_get_backups_grouped_by_dll_type(
+        self,
+        game_ids: list[int]
+    ) -> dict[int, dict[str, list[DLLBackup]]]:
+        """
+        Get active backups for many games, grouped by game and DLL type.
+
+        Bulk counterpart of get_backups_grouped_by_dll_type() for building
+        the games grid without one query per game.
+
+        Args:
+            game_ids: List of game IDs
+
+        Returns:
+            Dict mapping game_id to {dll_type: [DLLBackup, ...]} (newest first);
+            games without active backups are omitted
+        """
+        if not game_ids:
+            return {}
+        return await run_in_pool(ExecutorPool.DB, self._batch_get_backups_grouped_by_dll_type, game_ids)
+
+    def _batch_get_backups_grouped_by_dll_type(
+        self,
+        game_ids: list[int]
+    ) -> dict[int, dict[str, list[DLLBackup]]]:
+        """Batch get grouped backups (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        CHUNK_SIZE = 500  # Stay well below SQLite's host parameter limit
+
+        try:
+            unique_ids = list(dict.fromkeys(game_ids))
+            result: dict[int, dict[str, list[DLLBackup]]] = {}
+
+            for i in range(0, len(unique_ids), CHUNK_SIZE):
+                chunk = unique_ids[i:i + CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT
+                        b.id, b.game_dll_id, g.name, gd.dll_filename,
+                        b.backup_path, b.original_version, b.backup_created_at,
+                        b.backup_size, b.is_active, gd.dll_type, gd.game_id
+                    FROM dll_backups b
+                    INNER JOIN game_dlls gd ON b.game_dll_id = gd.id
+                    INNER JOIN games g ON gd.game_id = g.id
+                    WHERE gd.game_id IN ({placeholders}) AND b.is_active = 1
+                    ORDER BY gd.game_id, gd.dll_type, b.backup_created_at DESC
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    backup = DLLBackup(
+                        id=row[0],
+                        game_dll_id=row[1],
+                        game_name=row[2],
+                        dll_filename=row[3],
+                        backup_path=row[4],
+                        original_version=row[5],
+                        backup_created_at=datetime.fromisoformat(row[6]),
+                        backup_size=row[7],
+                        is_active=bool(row[8])
+                    )
+                    result.setdefault(row[10], {}).setdefault(row[9], []).append(backup)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error batch getting grouped backups: {e}", exc_info=True)
+            return {}
+
     async def get_games_with_backups(self) -> list[GameWithBackupCount]:
         """
         Get all games that have active backups with their backup counts.
@@ -1909,7 +2756,7 @@ class DatabaseManager:
         Returns:
             List of GameWithBackupCount objects, ordered by game name
         """
-        return await asyncio.to_thread(self._get_games_with_backups)
+        return await run_in_pool(ExecutorPool.DB, self._get_games_with_backups)
 
     def _get_games_with_backups(self) -> list[GameWithBackupCount]:
         """Get games with backups (runs in thread)"""
@@ -1962,7 +2809,7 @@ class DatabaseManager:
         Returns:
             List of GameDLLBackup objects, ordered by creation date (newest first)
         """
-        return await asyncio.to_thread(self._get_all_backups_filtered, game_id)
+        return await run_in_pool(ExecutorPool.DB, self._get_all_backups_filtered, game_id)
 
     def _get_all_backups_filtered(
         self,
@@ -2040,7 +2887,7 @@ class DatabaseManager:
         """
         if not game_ids:
             return {}
-        return await asyncio.to_thread(self._batch_check_games_have_backups, game_ids)
+        return await run_in_pool(ExecutorPool.DB, self._batch_check_games_have_backups, game_ids)
 
     def _batch_check_games_have_backups(
         self,
@@ -2097,7 +2944,7 @@ class DatabaseManager:
         Returns:
             List of Game objects matching the query
         """
-        return await asyncio.to_thread(self._search_games, query, launcher, limit)
+        return await run_in_pool(ExecutorPool.DB, self._search_games, query, launcher, limit)
 
     def _search_games(
         self,
@@ -2162,7 +3009,7 @@ class DatabaseManager:
 
     async def get_game_count(self) -> int:
         """Get total number of games in database."""
-        return await asyncio.to_thread(self._get_game_count)
+        return await run_in_pool(ExecutorPool.DB, self._get_game_count)
 
     def _get_game_count(self) -> int:
         """Get game count (runs in thread)"""
@@ -2195,7 +3042,7 @@ class DatabaseManager:
             launcher: Optional launcher filter used
             result_count: Number of results returned
         """
-        return await asyncio.to_thread(
+        return await run_in_pool(ExecutorPool.DB,
             self._add_search_history, query, launcher, result_count
         )
 
@@ -2250,7 +3097,7 @@ class DatabaseManager:
         Returns:
             List of dicts with query, launcher, result_count, timestamp
         """
-        return await asyncio.to_thread(self._get_search_history, limit)
+        return await run_in_pool(ExecutorPool.DB, self._get_search_history, limit)
 
     def _get_search_history(self, limit: int) -> list[dict[str, Any]]:
         """Get search history (runs in thread)"""
@@ -2284,7 +3131,7 @@ class DatabaseManager:
 
     async def clear_search_history(self):
         """Clear all search history."""
-        return await asyncio.to_thread(self._clear_search_history)
+        return await run_in_pool(ExecutorPool.DB, self._clear_search_history)
 
     def _clear_search_history(self):
         """Clear search history (runs in thread)"""
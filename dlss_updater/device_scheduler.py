@@ -0,0 +1,220 @@
+"""
+Device Scheduler for DLSS Updater
+Per-physical-device I/O budgets for scanning and copying
+
+Every launcher scan used to start at once and each library root was walked
+by up to THREADPOOL_IO threads. With several libraries on one spinning disk
+the head spends its time seeking between them and throughput collapses,
+while an NVMe drive is left underused by the same static numbers.
+
+Work is therefore grouped by device (st_dev). Each device gets a
+DeviceBudget chosen from the kind of storage behind it - a rotational disk
+walks one root at a time with few threads, an NVMe drive many roots with
+many threads - and separate devices run fully in parallel. The budget also
+bounds the device's adaptive disk limiter (see adaptive_concurrency), which
+the per-game scans and the update copy phases already go through.
+
+Storage kind is read from /sys/block/*/queue/rotational on Linux. Other
+platforms and virtual filesystems get the UNKNOWN budget, which keeps the
+previous behaviour.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from dlss_updater.config import Concurrency
+from dlss_updater.directory_walker import MAX_WALK_WORKERS
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import DeviceBudget, StorageKind
+
+logger = setup_logger()
+
+_BUDGETS: dict[StorageKind, DeviceBudget] = {
+    StorageKind.ROTATIONAL: DeviceBudget(
+        kind=StorageKind.ROTATIONAL,
+        concurrent_roots=1,
+        walk_workers=2,
+        initial_limit=2,
+        max_limit=4,
+    ),
+    StorageKind.SSD: DeviceBudget(
+        kind=StorageKind.SSD,
+        concurrent_roots=4,
+        walk_workers=MAX_WALK_WORKERS,
+        initial_limit=8,
+        max_limit=min(32, Concurrency.IO_HEAVY),
+    ),
+    StorageKind.NVME: DeviceBudget(
+        kind=StorageKind.NVME,
+        concurrent_roots=8,
+        walk_workers=MAX_WALK_WORKERS,
+        initial_limit=16,
+        max_limit=Concurrency.IO_HEAVY,
+    ),
+    StorageKind.UNKNOWN: DeviceBudget(
+        kind=StorageKind.UNKNOWN,
+        concurrent_roots=4,
+        walk_workers=MAX_WALK_WORKERS,
+        initial_limit=8,
+        max_limit=Concurrency.IO_HEAVY,
+    ),
+}
+
+_SYS_DEV_BLOCK = Path("/sys/dev/block")
+
+# device key -> budget, filled on first use of each device
+_budget_cache: dict[str, DeviceBudget] = {}
+_budget_lock = threading.Lock()
+
+
+def device_key(path) -> str:
+    """Identify the disk device holding path (st_dev of its nearest existing ancestor)."""
+    candidate = Path(path)
+    for parent in (candidate, *candidate.parents):
+        try:
+            return str(os.stat(parent).st_dev)
+        except OSError:
+            continue
+    return candidate.anchor or "unknown"
+
+
+def _mount_source_device(st_dev: int) -> int | None:
+    """
+    Resolve an anonymous device number (Btrfs, overlay) to its backing block device.
+
+    Looks the device up in /proc/self/mountinfo and stats the mount source.
+    """
+    wanted = f"{os.major(st_dev)}:{os.minor(st_dev)}"
+    try:
+        with open("/proc/self/mountinfo", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3 or fields[2] != wanted or " - " not in line:
+                    continue
+                source = line.split(" - ", 1)[1].split()[1]
+                if source.startswith("/dev/"):
+                    return os.stat(source).st_rdev
+    except (OSError, IndexError):
+        pass
+    return None
+
+
+def _sysfs_disk_dir(st_dev: int) -> Path | None:
+    """sysfs directory of the whole disk holding st_dev (partitions map to their parent)."""
+    try:
+        path = (_SYS_DEV_BLOCK / f"{os.major(st_dev)}:{os.minor(st_dev)}").resolve(strict=True)
+    except OSError:
+        return None
+    if not (path / "queue").is_dir():
+        path = path.parent
+    return path if (path / "queue").is_dir() else None
+
+
+def detect_storage_kind(st_dev: int) -> StorageKind:
+    """Detect the kind of storage behind a device number (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        return StorageKind.UNKNOWN
+
+    if os.major(st_dev) == 0:
+        st_dev = _mount_source_device(st_dev)
+        if st_dev is None:
+            return StorageKind.UNKNOWN
+
+    disk_dir = _sysfs_disk_dir(st_dev)
+    if disk_dir is None:
+        return StorageKind.UNKNOWN
+
+    try:
+        rotational = (disk_dir / "queue" / "rotational").read_text().strip()
+    except OSError:
+        return StorageKind.UNKNOWN
+    if rotational == "1":
+        return StorageKind.ROTATIONAL
+
+    # Device-mapper and md devices are NVMe when the disks below them are
+    names = [disk_dir.name]
+    with contextlib.suppress(OSError):
+        names.extend(os.listdir(disk_dir / "slaves"))
+    if any(name.startswith("nvme") for name in names):
+        return StorageKind.NVME
+    return StorageKind.SSD
+
+
+def get_device_budget(key: str) -> DeviceBudget:
+    """
+    Budget for the device identified by a device_key() value.
+
+    Detection runs once per device; the result is cached and logged.
+    """
+    budget = _budget_cache.get(key)
+    if budget is not None:
+        return budget
+
+    kind = detect_storage_kind(int(key)) if key.isdigit() else StorageKind.UNKNOWN
+    budget = _BUDGETS[kind]
+    with _budget_lock:
+        if key not in _budget_cache:
+            _budget_cache[key] = budget
+            logger.info(
+                f"[DEVICE] Device {key}: {kind.value} - {budget.concurrent_roots} roots at once, "
+                f"{budget.walk_workers} walkers per root, disk limit "
+                f"{budget.initial_limit}-{budget.max_limit}"
+            )
+        return _budget_cache[key]
+
+
+def get_path_budget(path) -> DeviceBudget:
+    """Budget for the device holding path."""
+    return get_device_budget(device_key(path))
+
+
+class DeviceScheduler:
+    """
+    Runs per-root work grouped by physical device.
+
+    Each device admits at most its budget's concurrent_roots at a time;
+    different devices never wait on each other. Create one scheduler per
+    scan and share it between launchers so roots of different launchers on
+    the same disk are also serialised (its semaphores belong to the running
+    event loop).
+    """
+
+    def __init__(self):
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, path):
+        """Hold one of the root slots of path's device; yields the device's budget."""
+        def _resolve() -> tuple[str, DeviceBudget]:
+            key = device_key(path)
+            return key, get_device_budget(key)
+
+        # Resolving the device stats the path and may read sysfs
+        key, budget = await asyncio.to_thread(_resolve)
+        semaphore = self._slots.get(key)
+        if semaphore is None:
+            semaphore = self._slots[key] = asyncio.Semaphore(budget.concurrent_roots)
+        async with semaphore:
+            yield budget
+
+    async def map(
+        self,
+        paths: list[Any],
+        fn: Callable[[Any, DeviceBudget], Awaitable[Any]]
+    ) -> list[Any]:
+        """
+        Run fn(path, budget) for every path under its device's budget.
+
+        Returns:
+            Results in the order of paths; a failed call yields its exception
+        """
+        async def run(path):
+            async with self.slot(path) as budget:
+                return await fn(path, budget)
+
+        return await asyncio.gather(*(run(path) for path in paths), return_exceptions=True)
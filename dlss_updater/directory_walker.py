@@ -0,0 +1,219 @@
+"""
+Directory Walker for DLSS Updater
+Work-stealing parallel walk of a directory tree
+
+The old walkers fanned out over the root's immediate children and walked each
+child serially, so a library with one huge game folder (a 300k-file MMO)
+ended up on a single thread while the others sat idle.
+
+Here every discovered subdirectory is a unit of work. Each worker keeps its
+own deque and pops from its tail, so it walks depth-first through the tree it
+is in (warm directory caches, a small pending set). A worker that runs dry
+steals from the head of another worker's deque, which holds that worker's
+shallowest pending directory and so the largest chunk of remaining work.
+Workers run in the shared scan pool, at most MAX_WALK_WORKERS per walk so
+one root never occupies the whole pool. A walk starts with one worker and
+adds another only when a worker queues more directories than it can list
+next; a worker that finds nothing to take returns its thread to the pool
+instead of waiting. Every walk reports its timing and how evenly the
+directories were spread over the workers.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from dlss_updater.config import Concurrency
+from dlss_updater.executor_registry import get_executor
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ExecutorPool, WalkStats
+
+logger = setup_logger()
+
+# Most workers a single walk runs in the scan pool; the rest of the pool
+# stays free for walks of other roots and devices
+MAX_WALK_WORKERS = max(2, Concurrency.THREADPOOL_IO // 4)
+
+# visit(directory) -> (subdirectory paths to descend into, matching file paths)
+VisitFn = Callable[[str], tuple[list[str], list[str]]]
+
+
+class _WorkStealingWalk:
+    """State shared by the workers of one walk."""
+
+    def __init__(self, root: str, visit: VisitFn, workers: int):
+        self._visit = visit
+        self._executor = get_executor(ExecutorPool.SCAN)
+        self._deques: list[deque[str]] = [deque() for _ in range(workers)]
+        self._deques[0].append(root)
+        # Directories queued or being listed; the walk is done at zero
+        self._outstanding = 1
+        self._lock = threading.Lock()
+        # Worker slots (deque indices) not held by a running worker
+        self._free_slots = list(range(workers - 1, 0, -1))
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        # Per-slot counters, each written only by the slot's current worker
+        self.found: list[list[str]] = [[] for _ in range(workers)]
+        self.visited = [0] * workers
+        self.steals = [0] * workers
+        self.peak_workers = 1
+
+    def start(self) -> None:
+        self._executor.submit(self._run_slot, 0)
+
+    def _take(self, index: int) -> str | None:
+        """Next directory for a worker: its own newest, else another's oldest."""
+        try:
+            return self._deques[index].pop()
+        except IndexError:
+            pass
+
+        count = len(self._deques)
+        for offset in range(1, count):
+            try:
+                directory = self._deques[(index + offset) % count].popleft()
+            except IndexError:
+                continue
+            self.steals[index] += 1
+            return directory
+        return None
+
+    def _spawn_helper(self) -> None:
+        """Start another worker if a slot is free (it steals the queued directories)."""
+        with self._lock:
+            if not self._free_slots:
+                return
+            index = self._free_slots.pop()
+            self.peak_workers = max(self.peak_workers, len(self._deques) - len(self._free_slots))
+        self._executor.submit(self._run_slot, index)
+
+    def _run_slot(self, index: int) -> None:
+        """Run one worker in a slot; a failure ends the whole walk instead of hanging it."""
+        try:
+            self._run_worker(index)
+        except BaseException as e:
+            self.error = e
+            self.done.set()
+        finally:
+            if index:
+                with self._lock:
+                    self._free_slots.append(index)
+
+    def _run_worker(self, index: int) -> None:
+        """Worker loop (runs in the scan pool); returns when there is nothing to take."""
+        local = self._deques[index]
+        found = self.found[index]
+
+        while not self.done.is_set():
+            directory = self._take(index)
+            if directory is None:
+                # Whoever queues directories later lists them itself or starts a helper
+                return
+
+            try:
+                subdirs, files = self._visit(directory)
+            except Exception as e:
+                # A failing directory must still be counted off, or the walk never ends
+                logger.debug(f"Cannot access {directory}: {e}")
+                subdirs, files = [], []
+
+            found.extend(files)
+            self.visited[index] += 1
+
+            # Count the children in before anyone can steal them
+            with self._lock:
+                self._outstanding += len(subdirs) - 1
+                finished = self._outstanding == 0
+            local.extend(subdirs)
+
+            if finished:
+                self.done.set()
+            elif len(subdirs) > 1:
+                self._spawn_helper()
+
+
+def _walk_serial(root: str, visit: VisitFn) -> list[str]:
+    """Iterative depth-first walk in the calling thread."""
+    found = []
+    dirs_to_scan = [root]
+
+    while dirs_to_scan:
+        current_dir = dirs_to_scan.pop()
+        try:
+            subdirs, files = visit(current_dir)
+        except Exception as e:
+            logger.debug(f"Cannot access {current_dir}: {e}")
+            continue
+        found.extend(files)
+        dirs_to_scan.extend(subdirs)
+
+    return found
+
+
+def walk_tree(root: str, visit: VisitFn, max_workers: int) -> tuple[list[str], WalkStats]:
+    """
+    Walk the tree under root, calling visit() once per directory.
+
+    Args:
+        root: Root directory
+        visit: Lists one directory; returns (subdirectory paths to descend
+            into, matching file paths). Exceptions skip the directory.
+        max_workers: Workers in the shared scan pool (1 = serial walk in the
+            calling thread), capped at MAX_WALK_WORKERS. Must not be called
+            from the scan pool itself.
+
+    Returns:
+        Tuple of (matching file paths, WalkStats)
+    """
+    start = time.perf_counter()
+
+    if max_workers <= 1:
+        directories = 0
+
+        def counting_visit(directory: str) -> tuple[list[str], list[str]]:
+            nonlocal directories
+            directories += 1
+            return visit(directory)
+
+        found = _walk_serial(root, counting_visit)
+        stats = WalkStats(
+            root=root,
+            directories=directories,
+            files_found=len(found),
+            workers=1,
+            steals=0,
+            elapsed_seconds=time.perf_counter() - start,
+            busiest_worker_share=1.0,
+        )
+        logger.debug(
+            f"[WALK] {root}: {stats.directories} dirs, {stats.files_found} matches "
+            f"in {stats.elapsed_seconds:.2f}s (serial)"
+        )
+        return found, stats
+
+    max_workers = min(max_workers, MAX_WALK_WORKERS)
+    walk = _WorkStealingWalk(root, visit, max_workers)
+    walk.start()
+    walk.done.wait()
+    if walk.error is not None:
+        raise walk.error
+
+    found = [path for worker_found in walk.found for path in worker_found]
+    directories = sum(walk.visited)
+    stats = WalkStats(
+        root=root,
+        directories=directories,
+        files_found=len(found),
+        workers=walk.peak_workers,
+        steals=sum(walk.steals),
+        elapsed_seconds=time.perf_counter() - start,
+        busiest_worker_share=max(walk.visited) / directories if directories else 0.0,
+    )
+    logger.info(
+        f"[WALK] {root}: {stats.directories} dirs, {stats.files_found} matches "
+        f"in {stats.elapsed_seconds:.2f}s ({stats.workers} workers, {stats.steals} steals, "
+        f"busiest worker listed {stats.busiest_worker_share:.0%})"
+    )
+    return found, stats
@@ -9,6 +9,9 @@ import aiofiles
 import concurrent.futures
 from .logger import setup_logger
 from .config import initialize_dll_paths, Concurrency
+from .adaptive_concurrency import get_cpu_limiter, get_network_limiter, log_limiter_stats
+from .http_cache import fetch_if_modified
+from .http_client import get_http_session
 
 logger = setup_logger()
 
@@ -29,46 +32,8 @@ def _get_dll_cache_dir():
 LOCAL_DLL_CACHE_DIR = _get_dll_cache_dir()
 
 # Thread-safety locks for free-threading (Python 3.14+)
-_session_lock = threading.Lock()
 _cache_init_lock = threading.Lock()
 
-# Shared aiohttp session for connection reuse
-_http_session: aiohttp.ClientSession | None = None
-
-
-async def get_http_session() -> aiohttp.ClientSession:
-    """Get or create shared HTTP session.
-
-    Thread-safe for free-threading (Python 3.14+).
-    """
-    global _http_session
-
-    # Quick check without lock
-    if _http_session is not None and not _http_session.closed:
-        return _http_session
-
-    # Need to create session - use lock
-    with _session_lock:
-        # Double-check after acquiring lock
-        if _http_session is None or _http_session.closed:
-            _http_session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60)
-            )
-    return _http_session
-
-
-async def close_http_session() -> None:
-    """Close shared HTTP session (call on app shutdown).
-
-    Thread-safe for free-threading (Python 3.14+).
-    """
-    global _http_session
-
-    with _session_lock:
-        if _http_session and not _http_session.closed:
-            await _http_session.close()
-            _http_session = None
-
 
 def ensure_cache_dir():
     """Ensure local cache directory exists"""
@@ -105,18 +70,22 @@ def get_local_dll_path(dll_name, skip_update_check=False):
 
 
 async def get_remote_manifest_async() -> dict | None:
-    """Fetch the remote DLL manifest (async version)"""
+    """
+    Fetch the remote DLL manifest (async version)
+
+    Sent as a conditional GET while a cached manifest exists; on 304 the cached
+    copy is returned. A freshly downloaded manifest is written to the cache.
+    """
     try:
         session = await get_http_session()
-        async with session.get(
+        result = await fetch_if_modified(
+            session,
             DLL_MANIFEST_URL,
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as response:
-            if response.status != 200:
-                logger.error(f"Failed to fetch DLL manifest: HTTP {response.status}")
-                return None
-            content = await response.read()
-            return _json_decoder.decode(content)
+            Path(LOCAL_DLL_CACHE_DIR) / "manifest.json",
+            _json_decoder.decode,
+            timeout=10,
+        )
+        return result.data if result else None
     except TimeoutError:
         logger.error("Timeout fetching DLL manifest")
         return None
@@ -192,15 +161,16 @@ async def update_cached_manifest_async(manifest):
 
 async def check_for_dll_update_async(dll_name: str, manifest: dict | None = None) -> bool:
     """Check if a newer version of the DLL is available (async version)"""
-    from .updater import get_dll_version, parse_version
+    from .updater import get_dll_version_cached, parse_version
 
     local_path = Path(LOCAL_DLL_CACHE_DIR) / dll_name
     if not local_path.exists():
         logger.info(f"No local copy of {dll_name} exists, download needed")
         return True
 
-    # get_dll_version is CPU-bound (reads PE headers), run in thread
-    local_version = await asyncio.to_thread(get_dll_version, str(local_path))
+    # Persistent version cache avoids re-parsing unchanged DLLs on every start;
+    # a miss is CPU-bound (reads PE headers), so run in thread
+    local_version = await asyncio.to_thread(get_dll_version_cached, str(local_path))
     if not local_version:
         logger.info(f"Could not determine version of local {dll_name}, assuming update needed")
         return True
@@ -442,21 +412,20 @@ async def initialize_dll_cache_async(progress_callback=None):
     await report_progress(0, 100, "Fetching DLL manifest...")
 
     # Fetch latest manifest
+    # get_remote_manifest_async() keeps the cached manifest.json up to date
     manifest = await get_remote_manifest_async()
     if manifest:
-        await update_cached_manifest_async(manifest)
-
         await report_progress(10, 100, "Checking for DLL updates...")
 
         # Check all DLLs for updates concurrently
         dll_names = list(manifest.keys())
         total_dlls = len(dll_names)
 
-        # CPU-bound PE parsing - scale with CPU threads
-        check_semaphore = asyncio.Semaphore(Concurrency.IO_HEAVY)
+        # CPU-bound PE parsing - adaptive limit up to THREADPOOL_CPU
+        check_limiter = get_cpu_limiter()
 
         async def bounded_check(name):
-            async with check_semaphore:
+            async with check_limiter.slot_async():
                 return await check_for_dll_update_async(name, manifest)
 
         # Create bounded check tasks
@@ -479,11 +448,12 @@ async def initialize_dll_cache_async(progress_callback=None):
         if dlls_to_update:
             await report_progress(40, 100, f"Downloading {len(dlls_to_update)} DLL updates...")
 
-            # Network I/O - use extreme concurrency to saturate bandwidth
-            download_semaphore = asyncio.Semaphore(Concurrency.IO_EXTREME)
+            # Network I/O - the host's limiter grows until latency or
+            # throughput says the link is saturated (ceiling: IO_EXTREME)
+            download_limiter = get_network_limiter(GITHUB_RAW_BASE)
 
             async def bounded_download(name):
-                async with download_semaphore:
+                async with download_limiter.slot_async():
                     return await download_latest_dll_async(name, manifest)
 
             download_tasks = [bounded_download(name) for name in dlls_to_update]
@@ -509,6 +479,7 @@ async def initialize_dll_cache_async(progress_callback=None):
         _cache_initialized = True
     initialize_dll_paths()
 
+    log_limiter_stats("DLL cache")
     await report_progress(100, 100, "DLL cache initialized")
 
 
@@ -0,0 +1,173 @@
+"""
+Executor Registry for DLSS Updater
+Named, shared thread pools instead of ad-hoc executors per call
+
+Directory walks used to build and tear down a ThreadPoolExecutor for every
+library root, version extraction and the high-performance updater kept pools
+of their own, and everything else went through the default asyncio.to_thread
+pool. Threads were created and destroyed all the time and nothing bounded or
+reported how many existed.
+
+The registry owns one pool per kind of work (ExecutorPool): scan, pe-parse,
+file-copy and db. Pools are created on first use, reused for the life of the
+process and shut down by task_registry.cancel_all_tasks(). Callers that used
+to size a private pool per call bound their share of a shared pool with
+map_bounded() instead.
+
+A task must never wait on work submitted to its own pool (a full pool would
+deadlock); nested work goes to a different pool.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Any, Callable, Iterable, Iterator
+
+from dlss_updater.config import Concurrency
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ExecutorPool, ExecutorStats
+from dlss_updater.task_registry import register_shutdown_hook
+
+logger = setup_logger()
+
+# SQLite has a single writer; a few threads (each with its own thread-local
+# connection) keep reads concurrent without opening a connection per thread
+DB_WORKERS = 4
+
+
+def _pool_size(pool: ExecutorPool) -> int:
+    """Worker count of a pool."""
+    if pool == ExecutorPool.PE_PARSE:
+        return Concurrency.THREADPOOL_CPU
+    if pool == ExecutorPool.DB:
+        return DB_WORKERS
+    return Concurrency.THREADPOOL_IO
+
+
+class _RegistryExecutor(concurrent.futures.ThreadPoolExecutor):
+    """ThreadPoolExecutor that counts submissions for get_executor_stats()."""
+
+    def __init__(self, pool: ExecutorPool, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"pool-{pool.value}")
+        self.pool = pool
+        self.max_workers = max_workers
+        self.submitted = 0
+        self._count_lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._count_lock:
+            self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+    def stats(self) -> ExecutorStats:
+        # _threads and _work_queue are CPython implementation details, read
+        # only for reporting
+        return ExecutorStats(
+            name=self.pool.value,
+            max_workers=self.max_workers,
+            threads=len(getattr(self, "_threads", ())),
+            queued=self._work_queue.qsize() if hasattr(self, "_work_queue") else 0,
+            submitted=self.submitted,
+        )
+
+
+_executors: dict[ExecutorPool, _RegistryExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(pool: ExecutorPool) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Get (or lazily create) a shared pool.
+
+    Thread-safe: concurrent callers for the same pool share one executor.
+    """
+    executor = _executors.get(pool)
+    if executor is not None:
+        return executor
+
+    with _executors_lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            executor = _RegistryExecutor(pool, _pool_size(pool))
+            _executors[pool] = executor
+            logger.debug(f"[EXECUTOR] Created {pool.value} pool (workers={executor.max_workers})")
+        return executor
+
+
+async def run_in_pool(pool: ExecutorPool, fn: Callable, *args, **kwargs) -> Any:
+    """Run fn(*args, **kwargs) in a shared pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(pool), functools.partial(fn, *args, **kwargs))
+
+
+def map_bounded(
+    pool: ExecutorPool,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_in_flight: int
+) -> Iterator[tuple[Any, concurrent.futures.Future]]:
+    """
+    Run fn(item) for every item with at most max_in_flight submitted at once.
+
+    Lets a caller use part of a shared pool the way it used to size a private
+    one. Yields (item, future) pairs in completion order.
+    """
+    executor = get_executor(pool)
+    remaining = iter(items)
+    pending: dict[concurrent.futures.Future, Any] = {}
+    max_in_flight = max(1, max_in_flight)
+
+    def fill():
+        while len(pending) < max_in_flight:
+            try:
+                item = next(remaining)
+            except StopIteration:
+                return
+            pending[executor.submit(fn, item)] = item
+
+    fill()
+    while pending:
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+        fill()
+
+
+def get_executor_stats() -> list[ExecutorStats]:
+    """Statistics for every pool created so far."""
+    with _executors_lock:
+        executors = list(_executors.values())
+    return [executor.stats() for executor in executors]
+
+
+def log_executor_stats(context: str) -> None:
+    """Log how many threads each shared pool is running."""
+    stats = get_executor_stats()
+    if not stats:
+        return
+    summary = ", ".join(
+        f"{s.name}={s.threads}/{s.max_workers} threads ({s.submitted} tasks, {s.queued} queued)"
+        for s in stats
+    )
+    logger.info(f"[EXECUTOR] {context}: {summary}")
+
+
+def shutdown_executors() -> None:
+    """
+    Shut down every pool, dropping queued work (called during app shutdown).
+
+    Running tasks are not waited for. A pool requested again afterwards (e.g.
+    by late database cleanup) is simply created anew.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if executors:
+        logger.info(f"[EXECUTOR] Shut down {len(executors)} thread pools")
+
+
+register_shutdown_hook("executors", shutdown_executors)
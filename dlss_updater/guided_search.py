@@ -0,0 +1,291 @@
+"""
+Guided Search for DLSS Updater
+Per-game DLL search that probes learned locations before walking the game
+
+Upscaler DLLs sit at a handful of predictable places relative to the game
+root (Binaries/Win64, bin/x64, an Unreal plugin folder, the root itself), yet
+a full per-game walk also lists every file under asset trees such as
+Content/Paks or movies.
+
+Every game is walked once: the first time a game is seen (nothing recorded
+for it in the database yet) its folder is walked, depth-limited and never
+descending into known asset directories. Games with recorded DLLs are not
+walked again; guided search lists only the folders their DLLs were recorded
+in plus the directories where DLLs were found for games of the same engine
+(learned priors, stored in the database per engine and launcher, topped up
+with built-in defaults). Every hit is fed back into the priors when the scan
+is saved.
+"""
+
+import fnmatch
+import os
+import threading
+from collections import Counter
+from pathlib import PurePath
+
+from dlss_updater.database import db_manager
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import DLLLocationPrior
+
+logger = setup_logger()
+
+# Asset-heavy directories that never hold the DLLs we update (lowercase)
+ASSET_DIRECTORIES: frozenset = frozenset({
+    'paks', 'movies', 'movie', 'videos', 'video', 'cinematics',
+    'audio', 'sound', 'sounds', 'music', 'soundbanks', 'wwiseaudio',
+    'localization', 'streamingassets', 'textures', 'splash',
+})
+
+# Locations probed even before anything was learned ("*" matches any
+# top-level folder, e.g. an Unreal project or a Unity "<Game>_Data" folder)
+BUILTIN_PRIORS: dict[str, tuple[str, ...]] = {
+    "unreal": (
+        "*/Binaries/Win64",
+        "Engine/Plugins/Runtime/Nvidia/DLSS/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Runtime/Nvidia/Streamline/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Runtime/AMD/FSR3/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Runtime/Intel/XeSS/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Marketplace/DLSS/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Marketplace/Streamline/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Marketplace/FSR3/Binaries/ThirdParty/Win64",
+        "Engine/Plugins/Marketplace/XeSS/Binaries/ThirdParty/Win64",
+        "*/Plugins/DLSS/Binaries/ThirdParty/Win64",
+        "*/Plugins/Streamline/Binaries/ThirdParty/Win64",
+        "*/Plugins/FSR3/Binaries/ThirdParty/Win64",
+        "*/Plugins/XeSS/Binaries/ThirdParty/Win64",
+        "Engine/Binaries/ThirdParty/Nvidia/NGX/Win64",
+        "",
+    ),
+    "unity": ("", "*_Data/Plugins/x86_64", "*_Data/Plugins"),
+    "generic": ("", "bin/x64", "bin", "x64", "Binaries/Win64"),
+}
+
+# Most locations probed per game
+MAX_PROBES = 32
+
+
+def _path_key(path) -> str:
+    """Case-insensitive lookup key for a directory (separators unified, no trailing one)."""
+    key = str(path).lower()
+    if os.altsep:
+        key = key.replace(os.altsep, os.sep)
+    return key.rstrip(os.sep)
+
+
+def detect_engine(top_level_names: list[str]) -> str:
+    """Guess a game's engine from the names in its root folder."""
+    lower = {name.lower() for name in top_level_names}
+    if "engine" in lower:
+        return "unreal"
+    if "unityplayer.dll" in lower or any(name.endswith("_data") for name in lower):
+        return "unity"
+    return "generic"
+
+
+def _generalize(relative_dir: str) -> str:
+    """Replace a project-specific first folder with a wildcard so the location transfers between games."""
+    parts = list(PurePath(relative_dir).parts)
+    if len(parts) >= 2 and parts[0].lower() != "engine" and parts[1].lower() == "binaries":
+        parts[0] = "*"
+    elif parts and parts[0].lower().endswith("_data"):
+        parts[0] = "*_Data"
+    return "/".join(parts)
+
+
+class GuidedSearch:
+    """
+    Guided per-game DLL search for one scan.
+
+    Thread-safe: games are scanned concurrently and all record their hits
+    into the same instance; save() writes them back in one transaction.
+    """
+
+    def __init__(self, priors: list[DLLLocationPrior], max_depth: int, known_dll_dirs: list[str] = ()):
+        self._priors = priors
+        self.max_depth = max_depth
+        # Every ancestor of a recorded DLL folder -> the recorded folders below it
+        self._known_dirs: dict[str, list[str]] = {}
+        for directory in known_dll_dirs:
+            ancestor = directory
+            while True:
+                self._known_dirs.setdefault(_path_key(ancestor), []).append(directory)
+                parent = os.path.dirname(ancestor)
+                if parent == ancestor:
+                    break
+                ancestor = parent
+        self._lock = threading.Lock()
+        self._learned: Counter[tuple[str, str, str]] = Counter()
+        self.games_probed = 0
+        self.games_walked = 0
+
+    @classmethod
+    async def load(cls, max_depth: int) -> "GuidedSearch":
+        """Create a search seeded with the priors learned by earlier scans."""
+        priors = await db_manager.get_dll_location_priors()
+        known_dll_dirs = await db_manager.get_known_dll_directories()
+        logger.info(
+            f"[GUIDED] Loaded {len(priors)} learned DLL locations, {len(known_dll_dirs)} recorded DLL folders "
+            f"(max depth {max_depth})"
+        )
+        return cls(priors, max_depth, known_dll_dirs)
+
+    def _candidates(self, engine: str, launcher: str) -> list[str]:
+        """Locations to probe: this launcher's priors, other launchers', then the built-ins."""
+        ordered = [p.relative_dir for p in self._priors if p.engine == engine and p.launcher == launcher]
+        ordered += [p.relative_dir for p in self._priors if p.engine == engine and p.launcher != launcher]
+        ordered += BUILTIN_PRIORS.get(engine, BUILTIN_PRIORS["generic"])
+        return list(dict.fromkeys(ordered))[:MAX_PROBES]
+
+    @staticmethod
+    def _expand(root: str, top_level_dirs: list[str], relative_dir: str) -> list[str]:
+        """Directories a (possibly wildcarded) relative location stands for."""
+        if not relative_dir:
+            return [root]
+        first, _, rest = relative_dir.partition("/")
+        if "*" not in first:
+            return [os.path.join(root, *relative_dir.split("/"))]
+        pattern = first.lower()
+        return [
+            os.path.join(root, name, *rest.split("/")) if rest else os.path.join(root, name)
+            for name in top_level_dirs
+            if fnmatch.fnmatchcase(name.lower(), pattern)
+        ]
+
+    @staticmethod
+    def _list_dlls(directory: str, dll_names_lower: frozenset) -> list[str]:
+        """Matching DLLs directly inside directory (no recursion)."""
+        found = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name.lower() in dll_names_lower and entry.is_file(follow_symlinks=False):
+                            found.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return found
+
+    def _walk(self, root: str, dll_names_lower: frozenset, skip_dirs: frozenset) -> list[str]:
+        """Depth-limited walk that prunes skipped and asset directories before descending."""
+        found = []
+        dirs_to_scan = [(root, 0)]
+
+        while dirs_to_scan:
+            current_dir, depth = dirs_to_scan.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            name_lower = entry.name.lower()
+                            if entry.is_file(follow_symlinks=False):
+                                if name_lower in dll_names_lower:
+                                    found.append(entry.path)
+                            elif (
+                                depth < self.max_depth
+                                and entry.is_dir(follow_symlinks=False)
+                                and name_lower not in skip_dirs
+                                and name_lower not in ASSET_DIRECTORIES
+                            ):
+                                dirs_to_scan.append((entry.path, depth + 1))
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Cannot access {current_dir}: {e}")
+
+        return found
+
+    def scan(
+        self,
+        game_path,
+        dll_names_lower: frozenset,
+        skip_dirs: frozenset,
+        launcher: str
+    ) -> list[str]:
+        """
+        Find DLLs in one game folder (runs in thread pool).
+
+        Args:
+            game_path: Game root directory
+            dll_names_lower: Frozenset of lowercase DLL names to find
+            skip_dirs: Lowercase directory names never descended into
+            launcher: Launcher the game belongs to (priors are kept per launcher)
+
+        Returns:
+            List of found DLL paths
+        """
+        root = str(game_path)
+        top_level_names = []
+        top_level_dirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    top_level_names.append(entry.name)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            top_level_dirs.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot access {root}: {e}")
+            return []
+
+        engine = detect_engine(top_level_names)
+        known_dirs = self._known_dirs.get(_path_key(root))
+
+        found = []
+        if known_dirs:
+            # Recorded before: its own DLL folders plus the learned locations
+            for directory in dict.fromkeys(known_dirs):
+                found.extend(self._list_dlls(directory, dll_names_lower))
+        else:
+            # First time this game is seen: walk it so no DLL folder is missed
+            found.extend(self._walk(root, dll_names_lower, skip_dirs))
+        # Probes also reach plugin folders deeper than max_depth
+        for relative_dir in self._candidates(engine, launcher):
+            for directory in self._expand(root, top_level_dirs, relative_dir):
+                found.extend(self._list_dlls(directory, dll_names_lower))
+        # Walk, recorded, wildcard and literal locations can all list a folder
+        found = list(dict.fromkeys(found))
+
+        with self._lock:
+            if known_dirs:
+                self.games_probed += 1
+            else:
+                self.games_walked += 1
+
+        self._learn(root, engine, launcher, found)
+        return found
+
+    def _learn(self, root: str, engine: str, launcher: str, found: list[str]) -> None:
+        """Count the folders the DLLs were found in, relative to the game root."""
+        if not found:
+            return
+        locations = set()
+        for path in found:
+            relative = os.path.relpath(os.path.dirname(path), root)
+            relative = "" if relative == "." else relative.replace(os.sep, "/")
+            locations.add(_generalize(relative))
+        with self._lock:
+            for relative_dir in locations:
+                self._learned[(engine, launcher, relative_dir)] += 1
+
+    async def save(self) -> int:
+        """
+        Write the locations learned by this scan to the database.
+
+        Returns:
+            Number of locations written
+        """
+        with self._lock:
+            rows = [(*key, hits) for key, hits in self._learned.items()]
+            self._learned.clear()
+            probed, walked = self.games_probed, self.games_walked
+
+        written = await db_manager.record_dll_locations(rows)
+        logger.info(
+            f"[GUIDED] {probed + walked} games: {probed} known games probed, "
+            f"{walked} new games walked (depth {self.max_depth}); {written} locations learned"
+        )
+        return written
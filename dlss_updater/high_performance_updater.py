@@ -15,6 +15,9 @@ The 4-phase pipeline:
 - Phase 2: Write updates in parallel from cache
 - Phase 3: Verify updates and cleanup resources
 
+Each run is journaled to SQLite (update_journal.UpdateJournal), so a session
+interrupted by a crash can be resumed or rolled back on the next start.
+
 Thread-safety: All classes use threading.Lock for Python 3.14 free-threading
 compatibility where the GIL may be disabled.
 
@@ -41,19 +44,30 @@ from typing import Callable, Any
 
 import psutil
 
-from .config import LATEST_DLL_PATHS, Concurrency, config_manager
+from .config import LATEST_DLL_PATHS, config_manager
 from .constants import DLL_TYPE_MAP
 from .logger import setup_logger
 from .models import (
     BackupEntry,
+    BackupStorageMode,
     BatchUpdateResult,
     CacheStats,
+    ChecksumVerificationReport,
+    ExecutorPool,
     MemoryStatus,
     ProcessedDLLResult,
+    UpdateJournalState,
 )
+from .adaptive_concurrency import get_disk_limiter, log_limiter_stats
+from .checksum import BLAKE2B, compute_checksum, verify_checksums
+from .copy_engine import atomic_copy_file
+from .executor_registry import get_executor, log_executor_stats
+from .open_file_snapshot import invalidate_open_file_snapshot
+from .update_journal import UpdateJournal
 from .updater import (
-    create_backup,
+    create_backup_with_strategy,
     get_dll_version,
+    get_dll_versions_cached,
     is_file_in_use,
     parse_version,
     remove_read_only,
@@ -635,7 +649,9 @@ class BackupManifest:
         self,
         original_path: str,
         backup_path: str,
-        size: int
+        size: int,
+        checksum: str | None = None,
+        strategy: str = "copy"
     ) -> None:
         """
         Add a backup entry to the manifest.
@@ -644,13 +660,17 @@ class BackupManifest:
             original_path: Path to the original DLL file
             backup_path: Path to the backup file
             size: Size of the backup file in bytes
+            checksum: Checksum of the original DLL taken before the backup
+            strategy: How the backup was materialised (BackupStrategy value)
         """
         with self._lock:
             entry = BackupEntry(
                 original_path=str(original_path),
                 backup_path=str(backup_path),
                 original_size=size,
-                verified=False
+                verified=False,
+                checksum=checksum,
+                strategy=strategy
             )
             self._entries.append(entry)
             logger.debug(f"[MANIFEST] Added backup: {Path(original_path).name}")
@@ -665,6 +685,19 @@ class BackupManifest:
         with self._lock:
             return list(self._entries)
 
+    def get_strategy_counts(self) -> dict[str, int]:
+        """
+        Count backups by the strategy used to create them.
+
+        Returns:
+            Mapping of strategy name to number of backups
+        """
+        counts: dict[str, int] = {}
+        with self._lock:
+            for entry in self._entries:
+                counts[entry.strategy] = counts.get(entry.strategy, 0) + 1
+        return counts
+
     def get_backup_path(self, original_path: str) -> str | None:
         """
         Get the backup path for an original file.
@@ -724,7 +757,9 @@ class BackupManifest:
                         original_path=entry.original_path,
                         backup_path=entry.backup_path,
                         original_size=entry.original_size,
-                        verified=True
+                        verified=True,
+                        checksum=entry.checksum,
+                        strategy=entry.strategy
                     )
 
                 except Exception as e:
@@ -741,6 +776,26 @@ class BackupManifest:
 
         return all_valid, errors
 
+    def verify_checksums(self) -> ChecksumVerificationReport:
+        """
+        Verify backup contents against the checksums taken at backup time.
+
+        Unlike verify_all(), this reads every backup through the hash (in
+        parallel), so it catches corrupted copies and backups that were
+        changed after creation.
+
+        Returns:
+            ChecksumVerificationReport for the entries that have a checksum
+        """
+        with self._lock:
+            items = [
+                (entry.backup_path, entry.checksum)
+                for entry in self._entries
+                if entry.checksum
+            ]
+        # Deduplicated backups can share one blob; hash it once
+        return verify_checksums(list(dict(items).items()))
+
     def rollback_all(self) -> dict[str, Any]:
         """
         Rollback all backups by restoring original files.
@@ -904,6 +959,10 @@ class HighPerformanceUpdateManager:
         self._start_time: float = 0.0
         self._peak_memory_mb: float = 0.0
         self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._journal: UpdateJournal | None = None
+        # Per-run version table (path -> version): sources are resolved in
+        # Phase 0, targets in the pre-filter, and every later phase reads it
+        self._versions: dict[str, str | None] = {}
 
     async def execute(
         self,
@@ -972,12 +1031,14 @@ class HighPerformanceUpdateManager:
         # Initialize components
         self._source_cache = SourceDLLMemoryCache(self._memory_monitor)
         self._backup_manifest = BackupManifest()
+        self._versions = {}
+        self._journal = None
+        # False until the run completes or is cleanly aborted; an unresolved
+        # journaled session is offered for resume/rollback on the next start
+        session_resolved = False
 
-        # Create thread pool executor
-        self._executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=Concurrency.THREADPOOL_IO,
-            thread_name_prefix="hp_update"
-        )
+        # Backups, updates and checks run in the shared file-copy pool
+        self._executor = get_executor(ExecutorPool.FILE_COPY)
 
         backups_created = 0
         updates_succeeded = 0
@@ -1028,6 +1089,10 @@ class HighPerformanceUpdateManager:
                     detailed_skipped=[]
                 )
 
+            # Journal the session before anything is touched on disk
+            self._journal = UpdateJournal()
+            await asyncio.to_thread(self._journal.begin, filtered_tasks)
+
             # Update total steps based on filtered count
             # Steps breakdown:
             #   - 3 phase-level calls (backup, update, verify)
@@ -1113,10 +1178,13 @@ class HighPerformanceUpdateManager:
             # ========== PHASE 3: Verify & Cleanup ==========
             await _progress("Verifying updates...")
 
-            await self._phase3_verify_cleanup(update_results)
+            errors.extend(await self._phase3_verify_cleanup(update_results))
+            session_resolved = True
 
         except (MemoryPressureError, UpdateAbortedError):
-            # Re-raise for caller to handle
+            # No DLL is left half-updated: either none was written yet or the
+            # backups were already rolled back. Re-raise for caller to handle
+            session_resolved = True
             raise
 
         except Exception as e:
@@ -1132,11 +1200,19 @@ class HighPerformanceUpdateManager:
             if self._source_cache:
                 self._source_cache.release_all()
 
-            if self._executor:
-                self._executor.shutdown(wait=False)
+            # The pool is shared and outlives the run; just drop the reference
+            self._executor = None
+
+            if self._journal:
+                if session_resolved:
+                    await asyncio.to_thread(self._journal.finish)
+                else:
+                    await asyncio.to_thread(self._journal.flush)
 
             # Update peak memory
             self._update_peak_memory()
+            log_limiter_stats("high-performance update")
+            log_executor_stats("high-performance update")
 
         # Calculate duration
         duration = time.monotonic() - self._start_time
@@ -1186,13 +1262,24 @@ class HighPerformanceUpdateManager:
             unique_sources
         )
 
+        # Resolve each source version once for the whole run
+        source_versions = await asyncio.to_thread(
+            get_dll_versions_cached,
+            list(unique_sources.values())
+        )
+        self._versions.update(source_versions)
+
         # Check memory after loading
         self._memory_monitor.check_critical_and_raise()
         self._update_peak_memory()
 
         return loaded
 
-    def _check_needs_update(self, task: DLLTask) -> tuple[bool, str]:
+    def _check_needs_update(
+        self,
+        task: DLLTask,
+        versions: dict[str, str | None] | None = None
+    ) -> tuple[bool, str]:
         """
         Check if a single DLL needs updating (runs in thread pool).
 
@@ -1200,6 +1287,7 @@ class HighPerformanceUpdateManager:
 
         Args:
             task: DLL update task to check
+            versions: Optional pre-fetched versions from the persistent version cache
 
         Returns:
             Tuple of (needs_update: bool, reason: str)
@@ -1213,8 +1301,10 @@ class HighPerformanceUpdateManager:
         if not source_path:
             return False, "No source DLL"
 
-        existing_version = get_dll_version(target_path)
-        latest_version = get_dll_version(source_path)
+        if versions is None:
+            versions = get_dll_versions_cached([task.target_path, source_path])
+        existing_version = versions.get(task.target_path)
+        latest_version = versions.get(source_path)
 
         if not existing_version or not latest_version:
             # Can't determine versions - include for update
@@ -1248,13 +1338,26 @@ class HighPerformanceUpdateManager:
         tasks_needing_update: list[DLLTask] = []
         skipped_count = 0
 
+        # Resolve all target versions up front (sources were resolved in Phase 0):
+        # one persistent cache lookup, with only new/changed DLLs being PE-parsed
+        version_paths = [task.target_path for task in dll_tasks]
+        version_paths.extend(
+            path for path in {LATEST_DLL_PATHS.get(task.source_dll_name) for task in dll_tasks}
+            if path and path not in self._versions
+        )
+        self._versions.update(
+            await asyncio.to_thread(get_dll_versions_cached, version_paths)
+        )
+        versions = self._versions
+
         # Submit version checks in parallel
         futures: dict[concurrent.futures.Future, DLLTask] = {}
 
         for task in dll_tasks:
             future = self._executor.submit(
                 self._check_needs_update,
-                task
+                task,
+                versions
             )
             futures[future] = task
 
@@ -1288,7 +1391,7 @@ class HighPerformanceUpdateManager:
         """
         Phase 1: Create backups for all target DLLs in parallel.
 
-        Uses ThreadPoolExecutor for parallel backup creation.
+        Uses the shared file-copy pool for parallel backup creation.
         If ANY backup fails, raises BackupFailedError for rollback.
 
         Args:
@@ -1303,6 +1406,12 @@ class HighPerformanceUpdateManager:
         """
         logger.info(f"[PHASE 1] Creating backups for {len(dll_tasks)} DLLs")
 
+        # Deduplicated backups are addressed by BLAKE2b digest; checksumming with
+        # BLAKE2b lets the backup store reuse it instead of hashing each DLL again
+        checksum_algorithm = None
+        if config_manager.get_backup_storage_mode() == BackupStorageMode.DEDUPLICATED:
+            checksum_algorithm = BLAKE2B
+
         # Submit all backup tasks
         futures: dict[concurrent.futures.Future, DLLTask] = {}
 
@@ -1313,8 +1422,12 @@ class HighPerformanceUpdateManager:
                 continue
 
             future = self._executor.submit(
+                self._run_disk_limited,
+                task.target_path,
                 self._create_single_backup,
-                str(target_path)
+                str(target_path),
+                self._versions.get(task.target_path),
+                checksum_algorithm
             )
             futures[future] = task
 
@@ -1333,7 +1446,15 @@ class HighPerformanceUpdateManager:
                     self._backup_manifest.add_backup(
                         result["original_path"],
                         result["backup_path"],
-                        result["size"]
+                        result["size"],
+                        result["checksum"],
+                        result["strategy"]
+                    )
+                    self._journal_record(
+                        task.target_path,
+                        UpdateJournalState.BACKED_UP,
+                        result["backup_path"],
+                        result["checksum"]
                     )
                     partial_backups.append(result["backup_path"])
                     backups_created += 1
@@ -1366,22 +1487,42 @@ class HighPerformanceUpdateManager:
                 partial_backups
             )
 
+        # Write-ahead: every backup is journaled before the first DLL is replaced
+        if self._journal:
+            await asyncio.to_thread(self._journal.flush)
+
+        strategy_counts = self._backup_manifest.get_strategy_counts()
+        logger.info(
+            "[PHASE 1] Backup strategies: "
+            + ", ".join(f"{name}={count}" for name, count in sorted(strategy_counts.items()))
+        )
+
         self._update_peak_memory()
         return backups_created
 
-    def _create_single_backup(self, target_path: str) -> dict[str, Any]:
+    def _create_single_backup(
+        self,
+        target_path: str,
+        original_version: str | None = None,
+        checksum_algorithm: str | None = None
+    ) -> dict[str, Any]:
         """
         Create a single backup (runs in thread pool).
 
         Args:
             target_path: Path to the DLL to back up
+            original_version: Version from the run's version table, recorded
+                with the backup metadata instead of re-parsing the DLL
+            checksum_algorithm: Checksum algorithm (None: the default one)
 
         Returns:
-            Dict with 'success', 'backup_path', 'original_path', 'size', 'error'
+            Dict with 'success', 'backup_path', 'original_path', 'size', 'checksum',
+            'strategy', 'error'
         """
         try:
             path = Path(target_path)
-            backup_path = create_backup(path)
+            checksum = compute_checksum(path, checksum_algorithm)
+            backup_path, strategy = create_backup_with_strategy(path, original_version, checksum)
 
             if backup_path:
                 return {
@@ -1389,6 +1530,8 @@ class HighPerformanceUpdateManager:
                     "backup_path": str(backup_path),
                     "original_path": target_path,
                     "size": path.stat().st_size,
+                    "checksum": checksum,
+                    "strategy": str(strategy),
                     "error": None
                 }
             else:
@@ -1429,6 +1572,10 @@ class HighPerformanceUpdateManager:
         """
         logger.info(f"[PHASE 2] Applying {len(dll_tasks)} updates from cache")
 
+        # In-use checks share one open-handle snapshot; start the phase from a
+        # fresh one rather than a snapshot taken before the backups
+        invalidate_open_file_snapshot()
+
         results: list[dict[str, Any]] = []
 
         # Submit all update tasks
@@ -1436,6 +1583,8 @@ class HighPerformanceUpdateManager:
 
         for task in dll_tasks:
             future = self._executor.submit(
+                self._run_disk_limited,
+                task.target_path,
                 self._apply_single_update,
                 task
             )
@@ -1464,6 +1613,9 @@ class HighPerformanceUpdateManager:
                     "skipped": False
                 })
 
+        if self._journal:
+            await asyncio.to_thread(self._journal.flush)
+
         self._update_peak_memory()
         return results
 
@@ -1480,10 +1632,13 @@ class HighPerformanceUpdateManager:
         """
         target_path = Path(task.target_path)
         dll_name = target_path.name
+        written = False
 
         # Base result dict with common fields
         def make_result(success: bool, error: str = None, skipped: bool = False,
                        old_version: str = None, new_version: str = None) -> dict[str, Any]:
+            if not written:
+                self._journal_record(task.target_path, UpdateJournalState.UNCHANGED)
             return {
                 "success": success,
                 "path": str(target_path),
@@ -1514,8 +1669,8 @@ class HighPerformanceUpdateManager:
                 logger.debug(f"[PHASE 2] Cache miss for {task.source_dll_name}, using file copy")
 
                 # Get versions for comparison
-                existing_version = get_dll_version(target_path)
-                latest_version = get_dll_version(source_path)
+                existing_version = self._get_run_version(task.target_path)
+                latest_version = self._get_run_version(source_path)
 
                 if existing_version and latest_version:
                     if parse_version(existing_version) >= parse_version(latest_version):
@@ -1531,12 +1686,13 @@ class HighPerformanceUpdateManager:
                         old_version=existing_version, new_version=latest_version
                     )
 
-                # Perform update using shutil
+                # Perform update via an atomic temp-file copy
                 original_permissions = os.stat(target_path).st_mode
                 remove_read_only(target_path)
 
-                os.remove(target_path)
-                shutil.copyfile(source_path, target_path)
+                atomic_copy_file(source_path, target_path)
+                written = True
+                self._journal_record(task.target_path, UpdateJournalState.WRITTEN)
                 restore_permissions(target_path, original_permissions)
 
                 return make_result(
@@ -1547,8 +1703,8 @@ class HighPerformanceUpdateManager:
             source_path = LATEST_DLL_PATHS.get(task.source_dll_name)
 
             # Get versions for comparison
-            existing_version = get_dll_version(target_path)
-            latest_version = get_dll_version(source_path) if source_path else None
+            existing_version = self._get_run_version(task.target_path)
+            latest_version = self._get_run_version(source_path) if source_path else None
 
             if existing_version and latest_version:
                 if parse_version(existing_version) >= parse_version(latest_version):
@@ -1564,21 +1720,21 @@ class HighPerformanceUpdateManager:
                     old_version=existing_version, new_version=latest_version
                 )
 
-            # Perform update from cache
+            # Perform update from cache: write a sibling temp file and atomically
+            # rename it over the target, so the game is never left without the DLL
             original_permissions = os.stat(target_path).st_mode
             remove_read_only(target_path)
 
-            os.remove(target_path)
-
-            # Write from cache
-            with open(target_path, "wb") as f:
-                f.write(source_data)
+            atomic_copy_file(source_path, target_path, source_buffer=source_data)
+            written = True
+            self._journal_record(task.target_path, UpdateJournalState.WRITTEN)
 
             restore_permissions(target_path, original_permissions)
 
-            # Verify update
-            new_version = get_dll_version(target_path)
-            if new_version == latest_version:
+            # Verify update: the written bytes must match the cached source, so the
+            # target now carries the source's (already known) version
+            if self._file_matches_source(target_path, source_data):
+                self._journal_record(task.target_path, UpdateJournalState.VERIFIED)
                 logger.info(
                     f"[PHASE 2] Updated {target_path.name}: "
                     f"{existing_version} -> {latest_version}"
@@ -1596,31 +1752,104 @@ class HighPerformanceUpdateManager:
                 )
             else:
                 logger.error(
-                    f"[PHASE 2] Version mismatch after update: "
-                    f"expected {latest_version}, got {new_version}"
+                    f"[PHASE 2] Content mismatch after update: "
+                    f"{target_path} does not match source {task.source_dll_name}"
                 )
                 return make_result(
-                    False, f"Version mismatch: expected {latest_version}, got {new_version}",
-                    skipped=False, old_version=existing_version, new_version=new_version
+                    False, f"Verification failed: written file does not match {task.source_dll_name}",
+                    skipped=False, old_version=existing_version
                 )
 
         except Exception as e:
             logger.error(f"[PHASE 2] Error updating {target_path}: {e}", exc_info=True)
             return make_result(False, str(e), skipped=False)
 
+    @staticmethod
+    def _run_disk_limited(target_path: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in a slot of the adaptive limiter for target_path's disk."""
+        with get_disk_limiter(target_path).slot():
+            return fn(*args)
+
+    def _journal_record(
+        self,
+        target_path: str,
+        state: UpdateJournalState,
+        backup_path: str | None = None,
+        checksum: str | None = None
+    ) -> None:
+        """Buffer a journal state change for the current session, if any."""
+        if self._journal:
+            self._journal.record(target_path, state, backup_path, checksum)
+
+    def _get_run_version(self, dll_path: str) -> str | None:
+        """
+        Look up a DLL version in the per-run version table.
+
+        Paths missing from the table (e.g. a pre-filter error) are parsed once
+        and memoised for the rest of the run.
+
+        Args:
+            dll_path: Path to the DLL
+
+        Returns:
+            Version string, or None if it cannot be determined
+        """
+        with self._lock:
+            if dll_path in self._versions:
+                return self._versions[dll_path]
+
+        version = get_dll_version(dll_path)
+        with self._lock:
+            self._versions[dll_path] = version
+        return version
+
+    @staticmethod
+    def _file_matches_source(
+        target_path: Path,
+        source_data: bytes,
+        chunk_size: int = 1024 * 1024
+    ) -> bool:
+        """
+        Check that a written file is byte-identical to the cached source.
+
+        Args:
+            target_path: Path of the file that was just written
+            source_data: Source DLL contents from the memory cache
+            chunk_size: Read size used for the comparison
+
+        Returns:
+            True if the file contents equal source_data
+        """
+        if target_path.stat().st_size != len(source_data):
+            return False
+
+        expected = memoryview(source_data)
+        offset = 0
+        with open(target_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                if expected[offset:offset + len(chunk)] != chunk:
+                    return False
+                offset += len(chunk)
+        return offset == len(source_data)
+
     async def _phase3_verify_cleanup(
         self,
         update_results: list[dict[str, Any]]
-    ) -> None:
+    ) -> list[dict[str, str]]:
         """
         Phase 3: Verify updates and cleanup resources.
 
-        Verifies successful updates and releases cached resources.
+        Verifies successful updates, checks every backup created in Phase 1
+        against its checksum and releases cached resources.
 
         Args:
             update_results: Results from Phase 2
+
+        Returns:
+            Error dicts for backups that failed checksum verification
         """
         logger.info("[PHASE 3] Verifying updates and cleaning up")
+        errors: list[dict[str, str]] = []
 
         # Count successful updates
         success_count = sum(1 for r in update_results if r["success"])
@@ -1628,6 +1857,16 @@ class HighPerformanceUpdateManager:
         if success_count > 0:
             logger.info(f"[PHASE 3] {success_count} updates verified successfully")
 
+        # Verify backup contents (the updates themselves were byte-compared in Phase 2)
+        if self._backup_manifest and self._backup_manifest.get_entries():
+            report = await asyncio.to_thread(self._backup_manifest.verify_checksums)
+            for path in report.mismatched:
+                logger.error(f"[PHASE 3] Backup checksum mismatch: {path}")
+                errors.append({"phase": "verify", "path": path, "error": "Backup checksum mismatch"})
+            for path, error in report.errors.items():
+                logger.error(f"[PHASE 3] Could not verify backup {path}: {error}")
+                errors.append({"phase": "verify", "path": path, "error": error})
+
         # Release cache resources
         if self._source_cache:
             stats = self._source_cache.stats
@@ -1639,6 +1878,7 @@ class HighPerformanceUpdateManager:
             self._source_cache.release_all()
 
         self._update_peak_memory()
+        return errors
 
     def _update_peak_memory(self) -> None:
         """Update peak memory usage tracking."""
@@ -0,0 +1,204 @@
+"""
+Conditional HTTP Refresh for DLSS Updater
+Shared ETag / If-Modified-Since layer for remote files that are kept locally
+
+The DLL manifest, the game whitelist and the Steam app list rarely change
+between launches. Validators (ETag / Last-Modified) are recorded per URL, and
+while a local copy exists the next request is sent conditionally: a 304 Not
+Modified costs a few hundred bytes and only refreshes timestamps, instead of
+re-downloading the full body.
+
+Validators are only recorded after the new content has been stored locally,
+so a 304 always means the local copy is current.
+"""
+
+import asyncio
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import aiohttp
+import msgspec
+
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ConditionalFetchResult, HttpValidatorData, HttpValidators
+from dlss_updater.platform_utils import APP_CONFIG_DIR
+
+logger = setup_logger()
+
+# Bump when the on-disk layout changes; older stores are discarded
+STORE_VERSION = 1
+STORE_FILENAME = "http_validators.json"
+
+_store_decoder = msgspec.json.Decoder(HttpValidatorData)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to path via a temporary file and os.replace()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _touch_and_read(path: Path) -> bytes:
+    """Refresh a local copy's mtime (it was just confirmed current) and read it."""
+    os.utime(path)
+    return path.read_bytes()
+
+
+class HttpValidatorStore:
+    """
+    Per-URL validator store persisted next to games.db.
+
+    Loaded lazily on first use. Thread-safe for free-threading (Python 3.14+).
+    Every method may read or write the store file, so coroutines call them
+    through asyncio.to_thread().
+    """
+
+    def __init__(self, store_path: Path | None = None):
+        self.store_path = store_path or APP_CONFIG_DIR / STORE_FILENAME
+        self._entries: dict[str, HttpValidators] | None = None
+        self._lock = threading.Lock()
+
+    def _load_locked(self) -> dict[str, HttpValidators]:
+        """Load entries on first access (caller holds the lock)."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = _store_decoder.decode(self.store_path.read_bytes())
+                if data.version == STORE_VERSION:
+                    self._entries = data.entries
+            except FileNotFoundError:
+                pass
+            except (OSError, msgspec.DecodeError, msgspec.ValidationError) as e:
+                logger.warning(f"[HTTP CACHE] Discarding unreadable validator store: {e}")
+        return self._entries
+
+    def _save_locked(self):
+        """Persist entries (caller holds the lock)."""
+        data = HttpValidatorData(version=STORE_VERSION, entries=self._entries or {})
+        try:
+            _write_atomic(self.store_path, msgspec.json.encode(data))
+        except OSError as e:
+            logger.error(f"[HTTP CACHE] Failed to save validator store: {e}")
+
+    def get(self, url: str) -> HttpValidators | None:
+        """Get the validators recorded for url, if any."""
+        with self._lock:
+            return self._load_locked().get(url)
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """
+        Build conditional request headers for url.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, or {} if nothing is recorded
+        """
+        validators = self.get(url)
+        if validators is None:
+            return {}
+        headers = {}
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+        return headers
+
+    def record(self, url: str, etag: str | None, last_modified: str | None):
+        """Record validators for content that has just been stored locally."""
+        with self._lock:
+            entries = self._load_locked()
+            if etag or last_modified:
+                entries[url] = HttpValidators(etag=etag, last_modified=last_modified)
+            elif entries.pop(url, None) is None:
+                return
+            self._save_locked()
+
+    def record_response(self, url: str, headers: Mapping[str, str]):
+        """Record the ETag / Last-Modified headers of a 200 response."""
+        self.record(url, headers.get("ETag"), headers.get("Last-Modified"))
+
+    def touch(self, url: str):
+        """Mark url as confirmed current (after a 304)."""
+        with self._lock:
+            validators = self._load_locked().get(url)
+            if validators is None:
+                return
+            validators.checked_at = datetime.now()
+            self._save_locked()
+
+    def forget(self, url: str):
+        """Drop validators for url (its local copy is missing or incomplete)."""
+        self.record(url, None, None)
+
+
+# Application-wide validator store
+http_validators = HttpValidatorStore()
+
+
+async def fetch_if_modified(
+    session: aiohttp.ClientSession,
+    url: str,
+    cache_path: Path,
+    parse: Callable[[bytes], Any],
+    timeout: float = 10,
+) -> ConditionalFetchResult | None:
+    """
+    GET url, conditionally when cache_path holds a previously fetched copy.
+
+    On 200 the body is parsed, written to cache_path and its validators are
+    recorded. On 304 only the timestamps are refreshed and the local copy is
+    parsed instead. Parse errors on a 200 propagate without touching the local
+    copy; an unparseable local copy triggers one unconditional retry.
+
+    Args:
+        session: aiohttp session to use
+        url: Resource URL
+        cache_path: Local copy of the resource
+        parse: Converts raw bytes into the value returned to the caller
+        timeout: Total request timeout in seconds
+
+    Returns:
+        ConditionalFetchResult, or None on a non-200/304 status
+
+    Raises:
+        TimeoutError, aiohttp.ClientError: On network failures
+    """
+    has_local_copy = await asyncio.to_thread(cache_path.is_file)
+    headers = await asyncio.to_thread(http_validators.request_headers, url) if has_local_copy else {}
+    name = url.rsplit("/", 1)[-1]
+
+    async with session.get(
+        url,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as response:
+        if response.status == 304 and headers:
+            try:
+                data = parse(await asyncio.to_thread(_touch_and_read, cache_path))
+            except Exception as e:
+                logger.warning(f"[HTTP CACHE] Local copy of {name} is unusable ({e}), re-downloading")
+                await asyncio.to_thread(http_validators.forget, url)
+                await asyncio.to_thread(cache_path.unlink, missing_ok=True)
+                return await fetch_if_modified(session, url, cache_path, parse, timeout)
+            await asyncio.to_thread(http_validators.touch, url)
+            logger.info(f"[HTTP CACHE] {name} not modified, using local copy")
+            return ConditionalFetchResult(data=data, not_modified=True)
+
+        if response.status != 200:
+            logger.error(f"Failed to fetch {url}: HTTP {response.status}")
+            return None
+
+        body = await response.read()
+        data = parse(body)
+        await asyncio.to_thread(_write_atomic, cache_path, body)
+        await asyncio.to_thread(http_validators.record_response, url, response.headers)
+        logger.debug(f"[HTTP CACHE] Downloaded {name} ({len(body)} bytes)")
+        return ConditionalFetchResult(data=data)
@@ -0,0 +1,94 @@
+"""
+Shared HTTP Client for DLSS Updater
+One pooled aiohttp session for every network subsystem
+
+All modules (DLL repository, whitelist, Steam app list and images, update
+checks) go through get_http_session() so connections, TLS sessions and DNS
+lookups are reused: fetching hundreds of Steam header images reuses a few
+keep-alive connections per CDN host instead of doing a handshake per image.
+
+The session is closed by task_registry.cancel_all_tasks() during shutdown.
+"""
+
+import asyncio
+import threading
+
+import aiohttp
+
+from dlss_updater.logger import setup_logger
+from dlss_updater.task_registry import register_shutdown_hook
+
+logger = setup_logger()
+
+# Connection pool tuning
+CONNECTION_LIMIT = 64  # Total simultaneous connections
+CONNECTION_LIMIT_PER_HOST = 16  # Per host (GitHub raw, Steam CDNs)
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection stays pooled
+DNS_CACHE_TTL = 300  # Seconds resolved addresses are reused
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=15)
+
+# Thread-safety lock for free-threading (Python 3.14+)
+_session_lock = threading.Lock()
+
+_http_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create the pooled session (must run inside the event loop)."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        use_dns_cache=True,
+    )
+    logger.debug(
+        f"Created shared HTTP session (limit={CONNECTION_LIMIT}, "
+        f"per_host={CONNECTION_LIMIT_PER_HOST}, keepalive={KEEPALIVE_TIMEOUT}s)"
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Get or create the shared HTTP session.
+
+    Callers must not close the returned session; per-request timeouts can
+    still be passed to session.get().
+
+    Thread-safe for free-threading (Python 3.14+).
+    """
+    global _http_session, _session_loop
+
+    # Quick check without lock
+    session = _http_session
+    if session is not None and not session.closed and not _session_loop.is_closed():
+        return session
+
+    # Need to create session - use lock
+    with _session_lock:
+        # Double-check after acquiring lock
+        if _http_session is None or _http_session.closed or _session_loop.is_closed():
+            _http_session = _create_session()
+            _session_loop = asyncio.get_running_loop()
+        return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session (runs as a task registry shutdown hook).
+
+    Thread-safe for free-threading (Python 3.14+).
+    """
+    global _http_session, _session_loop
+
+    with _session_lock:
+        session = _http_session
+        _http_session = None
+        _session_loop = None
+
+    if session is not None and not session.closed:
+        await session.close()
+        logger.info("HTTP session closed")
+
+
+register_shutdown_hook("http-session", close_http_session)
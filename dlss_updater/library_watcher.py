@@ -0,0 +1,476 @@
+"""
+Library Watcher for DLSS Updater
+Keeps the game/DLL tables current between scans
+
+Games installed, removed or patched after a scan used to stay invisible (or
+stale) in the Games view until the user ran another full scan of every
+launcher.
+
+When enabled ([Performance] WatchLibraries), the watcher follows every
+configured launcher root in the background. Changes are mapped to the game
+folder they happened in (the root's immediate child), collected for a short
+quiet period so an install or patch that writes thousands of files is handled
+once, and then only those game folders are rescanned: their games and DLLs
+are upserted with the same batch operations as a full scan, and DLLs (and
+games) that disappeared are pruned.
+
+On Linux the watcher uses inotify (through ctypes) on each root a few levels
+deep. Elsewhere, or when inotify is unavailable, it polls: every root is
+listed to the same depth periodically and compared with the previous listing.
+Only directories and the DLL files being searched for are considered, so
+games writing logs, saves or shader caches do not trigger rescans. Changes
+below the watched depth are picked up once anything above it changes, which
+an install or patch practically always does (Binaries/Win64 is within it).
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from dlss_updater import scanner
+from dlss_updater.database import db_manager
+from dlss_updater.executor_registry import get_executor, run_in_pool
+from dlss_updater.guided_search import ASSET_DIRECTORIES
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ExecutorPool
+from dlss_updater.scan_pipeline import ScanPipeline
+from dlss_updater.task_registry import register_shutdown_hook, register_task
+from dlss_updater.whitelist import check_whitelist_batch
+
+logger = setup_logger()
+
+# Seconds without new changes before the affected games are rescanned
+WATCH_DEBOUNCE = 3.0
+
+# Seconds between two listings of every root (polling fallback)
+POLL_INTERVAL = 60.0
+
+# Directory levels below a root that are watched (root = 0, game folder = 1)
+WATCH_DEPTH = 5
+
+# Upper bound on inotify watches (the per-user kernel limit is often 8192)
+MAX_WATCHES = 8192
+
+# inotify constants (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# notify(root, changed path)
+NotifyFn = Callable[[str, str], None]
+
+
+def _descend(name_lower: str, skip_dirs: frozenset) -> bool:
+    """Whether a subdirectory is watched (never skipped or asset directories)."""
+    return name_lower not in skip_dirs and name_lower not in ASSET_DIRECTORIES
+
+
+class _InotifyBackend:
+    """Linux inotify through ctypes: one watch per directory down to WATCH_DEPTH."""
+
+    def __init__(self, notify: NotifyFn, dll_names_lower: frozenset, skip_dirs: frozenset):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, f"inotify_init1 failed: {os.strerror(code)}")
+
+        self._fd = fd
+        self._notify = notify
+        self._dll_names_lower = dll_names_lower
+        self._skip_dirs = skip_dirs
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # wd -> (root, directory, depth)
+        self._watches: dict[int, tuple[str, str, int]] = {}
+        self._lock = threading.Lock()
+        self._limit_warned = False
+
+    def _watch_tree(self, root: str, directory: str, depth: int) -> int:
+        """Watch directory and its subdirectories down to WATCH_DEPTH (runs in thread pool)."""
+        added = 0
+        pending = [(directory, depth)]
+
+        while pending:
+            current, level = pending.pop()
+            with self._lock:
+                if len(self._watches) >= MAX_WATCHES:
+                    if not self._limit_warned:
+                        self._limit_warned = True
+                        logger.warning(f"[WATCH] Watch limit ({MAX_WATCHES}) reached; deeper folders are not watched")
+                    return added
+
+            wd = self._add_watch(self._fd, os.fsencode(current), _WATCH_MASK)
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code == errno.ENOSPC and not self._limit_warned:
+                    self._limit_warned = True
+                    logger.warning("[WATCH] Kernel inotify watch limit reached; deeper folders are not watched")
+                continue
+            with self._lock:
+                self._watches[wd] = (root, current, level)
+            added += 1
+
+            if level >= WATCH_DEPTH:
+                continue
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False) and _descend(entry.name.lower(), self._skip_dirs):
+                                pending.append((entry.path, level + 1))
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Cannot access {current}: {e}")
+
+        return added
+
+    async def start(self, roots: list[str]) -> None:
+        self._loop = asyncio.get_running_loop()
+        for root in roots:
+            await run_in_pool(ExecutorPool.SCAN, self._watch_tree, root, root, 0)
+        self._loop.add_reader(self._fd, self._on_readable)
+        logger.info(f"[WATCH] inotify watching {len(self._watches)} folders under {len(roots)} roots")
+
+    def _on_readable(self) -> None:
+        """Drain and dispatch pending inotify events (runs on the event loop)."""
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logger.warning(f"[WATCH] Reading inotify events failed: {e}")
+                return
+            if not data:
+                return
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                self._dispatch(wd, mask, name)
+
+    def _dispatch(self, wd: int, mask: int, name: str) -> None:
+        if mask & _IN_Q_OVERFLOW:
+            # Events were lost: treat every game folder of every root as changed
+            with self._lock:
+                roots = {root for root, _, level in self._watches.values() if level == 0}
+            logger.warning("[WATCH] inotify queue overflowed; rescanning all watched games")
+            for root in roots:
+                self._notify(root, root)
+            return
+
+        with self._lock:
+            watch = self._watches.pop(wd, None) if mask & _IN_IGNORED else self._watches.get(wd)
+        if watch is None or mask & _IN_IGNORED:
+            return
+
+        root, directory, level = watch
+        path = os.path.join(directory, name)
+
+        if mask & _IN_ISDIR:
+            if not _descend(name.lower(), self._skip_dirs):
+                return
+            if mask & (_IN_CREATE | _IN_MOVED_TO) and level < WATCH_DEPTH:
+                # A moved-in folder brings a whole subtree; watch it off the loop
+                future = get_executor(ExecutorPool.SCAN).submit(self._watch_tree, root, path, level + 1)
+                future.add_done_callback(_log_failure)
+        elif level == 0 or name.lower() not in self._dll_names_lower:
+            # Loose files in a root belong to no game; other files are noise
+            return
+
+        self._notify(root, path)
+
+    def close(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+
+
+def _log_failure(future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"[WATCH] Adding watches failed: {future.exception()}")
+
+
+class _PollingBackend:
+    """Fallback: lists every root to WATCH_DEPTH periodically and compares the listings."""
+
+    def __init__(self, notify: NotifyFn, dll_names_lower: frozenset, skip_dirs: frozenset):
+        self._notify = notify
+        self._dll_names_lower = dll_names_lower
+        self._skip_dirs = skip_dirs
+        self._task: asyncio.Task | None = None
+        # root -> game folder -> signature
+        self._snapshots: dict[str, dict[str, frozenset]] = {}
+
+    def _snapshot(self, root: str) -> dict[str, frozenset]:
+        """
+        Signature of each game folder under root (runs in thread pool).
+
+        A signature holds the folder's subdirectories and the size and
+        modification time of the matching DLLs in them.
+        """
+        games = {}
+        try:
+            with os.scandir(root) as entries:
+                game_dirs = [
+                    entry.path for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and _descend(entry.name.lower(), self._skip_dirs)
+                ]
+        except OSError as e:
+            logger.debug(f"Cannot access {root}: {e}")
+            return games
+
+        for game_dir in game_dirs:
+            signature = []
+            pending = [(game_dir, 1)]
+            while pending:
+                current, level = pending.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                name_lower = entry.name.lower()
+                                if entry.is_file(follow_symlinks=False):
+                                    if name_lower in self._dll_names_lower:
+                                        st = entry.stat(follow_symlinks=False)
+                                        signature.append((entry.path, st.st_size, st.st_mtime_ns))
+                                elif (
+                                    level < WATCH_DEPTH
+                                    and entry.is_dir(follow_symlinks=False)
+                                    and _descend(name_lower, self._skip_dirs)
+                                ):
+                                    signature.append((entry.path,))
+                                    pending.append((entry.path, level + 1))
+                            except OSError:
+                                continue
+                except OSError as e:
+                    logger.debug(f"Cannot access {current}: {e}")
+            games[game_dir] = frozenset(signature)
+
+        return games
+
+    async def _poll(self, roots: list[str]) -> None:
+        while True:
+            await asyncio.sleep(POLL_INTERVAL)
+            for root in roots:
+                current = await run_in_pool(ExecutorPool.SCAN, self._snapshot, root)
+                previous = self._snapshots.get(root, {})
+                for game_dir in previous.keys() | current.keys():
+                    if previous.get(game_dir) != current.get(game_dir):
+                        self._notify(root, game_dir)
+                self._snapshots[root] = current
+
+    async def start(self, roots: list[str]) -> None:
+        for root in roots:
+            self._snapshots[root] = await run_in_pool(ExecutorPool.SCAN, self._snapshot, root)
+        self._task = register_task(asyncio.create_task(self._poll(roots)), "library_watcher_poll")
+        logger.info(f"[WATCH] Polling {len(roots)} roots every {POLL_INTERVAL:.0f}s")
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def get_library_roots() -> dict[str, str]:
+    """
+    Every configured launcher root that exists.
+
+    Returns:
+        Dict mapping root path to launcher name (as used by find_all_dlls)
+    """
+    roots: dict[str, str] = {}
+
+    def add(paths, launcher: str):
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                roots.setdefault(str(path), launcher)
+
+    steam_path = scanner.get_steam_install_path()
+    if steam_path:
+        add(scanner.get_steam_libraries(steam_path), "Steam")
+    add(scanner.get_steam_manual_paths(), "Steam")
+    add(await scanner.get_ea_games(), "EA Launcher")
+    add(await scanner.get_ubisoft_games(), "Ubisoft Launcher")
+    add(await scanner.get_epic_games(), "Epic Games Launcher")
+    add(await scanner.get_gog_games(), "GOG Launcher")
+    add(await scanner.get_battlenet_games(), "Battle.net Launcher")
+    add(await scanner.get_xbox_games(), "Xbox Launcher")
+    for folder_num in range(1, 5):
+        add(await scanner.get_custom_folder(folder_num), f"Custom Folder {folder_num}")
+
+    return roots
+
+
+async def refresh_game_folders(folders: dict[str, str], dll_names: list[str]) -> tuple[int, int, int]:
+    """
+    Rescan game folders and bring their database records up to date.
+
+    Args:
+        folders: Dict mapping game folder to launcher name
+        dll_names: DLL names to search for
+
+    Returns:
+        Tuple of (games upserted, DLLs upserted, games removed)
+    """
+    dll_names_lower = frozenset(name.lower() for name in dll_names)
+
+    # Rescan every changed folder
+    found: dict[str, list[str]] = {}
+    for folder, launcher in folders.items():
+        if os.path.isdir(folder):
+            found.setdefault(launcher, []).extend(
+                await scanner.scan_game_for_dlls(Path(folder), dll_names_lower)
+            )
+
+    whitelisted = await check_whitelist_batch([dll for dlls in found.values() for dll in dlls])
+
+    # Record what is there the same way a full scan does
+    pipeline = ScanPipeline()
+    pipeline.start()
+    kept = []
+    try:
+        for launcher, dlls in found.items():
+            dlls = [dll for dll in dlls if not whitelisted.get(dll, True)]
+            kept.extend(dlls)
+            await pipeline.submit(launcher, dlls)
+        stats = await pipeline.close()
+    except BaseException:
+        pipeline.cancel()
+        raise
+
+    # Drop what the rescan no longer found
+    removed_games = 0
+    for folder in folders:
+        games, _ = await db_manager.prune_missing_under(folder, kept)
+        removed_games += games
+
+    return stats.games, stats.dlls, removed_games
+
+
+class LibraryWatcher:
+    """
+    Background watcher over the launcher roots.
+
+    Create it on the event loop, start() it once and stop() it when done;
+    on_change (if given) is awaited after every refresh that touched the
+    database, e.g. to reload the Games view.
+    """
+
+    def __init__(
+        self,
+        roots: dict[str, str],
+        dll_names: list[str],
+        on_change: Callable[[], Awaitable[None]] | None = None
+    ):
+        self.roots = roots
+        self.dll_names = dll_names
+        self._on_change = on_change
+        self._backend: _InotifyBackend | _PollingBackend | None = None
+        self._task: asyncio.Task | None = None
+        # game folder -> launcher, waiting for the quiet period to end
+        self._pending: dict[str, str] = {}
+        self._last_change = 0.0
+        self._changed = asyncio.Event()
+
+    def _notify(self, root: str, path: str) -> None:
+        """Record a change at path (runs on the event loop)."""
+        relative = os.path.relpath(path, root)
+        if relative == os.curdir:
+            # The whole root changed (inotify overflow): every game folder in it
+            try:
+                with os.scandir(root) as entries:
+                    folders = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                folders = []
+        else:
+            folders = [os.path.join(root, relative.split(os.sep, 1)[0])]
+
+        for folder in folders:
+            self._pending[folder] = self.roots[root]
+        self._last_change = time.monotonic()
+        self._changed.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._changed.wait()
+            # Wait until changes have been quiet for WATCH_DEBOUNCE
+            while (remaining := self._last_change + WATCH_DEBOUNCE - time.monotonic()) > 0:
+                await asyncio.sleep(remaining)
+
+            self._changed.clear()
+            folders, self._pending = self._pending, {}
+            try:
+                games, dlls, removed = await refresh_game_folders(folders, self.dll_names)
+                logger.info(
+                    f"[WATCH] Refreshed {len(folders)} changed game folders: "
+                    f"{games} games and {dlls} DLLs recorded, {removed} games removed"
+                )
+                if self._on_change is not None:
+                    await self._on_change()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[WATCH] Refreshing changed game folders failed: {e}", exc_info=True)
+
+    async def start(self) -> None:
+        """Start watching (inotify on Linux, polling elsewhere or if inotify fails)."""
+        dll_names_lower = frozenset(name.lower() for name in self.dll_names)
+        roots = list(self.roots)
+
+        backend = None
+        if sys.platform.startswith("linux"):
+            try:
+                backend = _InotifyBackend(self._notify, dll_names_lower, scanner._SKIP_DIRECTORIES)
+                await backend.start(roots)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"[WATCH] inotify unavailable ({e}), falling back to polling")
+                if backend is not None:
+                    backend.close()
+                backend = None
+        if backend is None:
+            backend = _PollingBackend(self._notify, dll_names_lower, scanner._SKIP_DIRECTORIES)
+            await backend.start(roots)
+
+        self._backend = backend
+        self._task = register_task(asyncio.create_task(self._run()), "library_watcher")
+        register_shutdown_hook("library_watcher", self.stop)
+
+    async def stop(self) -> None:
+        """Stop watching; a refresh in progress is cancelled."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+            logger.info("[WATCH] Stopped watching launcher libraries")
@@ -17,6 +17,7 @@ Performance benefits:
 
 import msgspec
 from enum import StrEnum
+from typing import Any
 
 # =============================================================================
 # Constants
@@ -232,6 +233,8 @@ class DLLBackup(msgspec.Struct):
     original_version: str | None = None
     backup_created_at: datetime = msgspec.field(default_factory=datetime.now)
     is_active: bool = True
+    blob_digest: str | None = None  # Set when stored in the deduplicated backup store
+    checksum: str | None = None  # "algorithm:hex" recorded at backup time
 
 
 class GameDLLBackup(msgspec.Struct):
@@ -309,6 +312,66 @@ class SteamImage(msgspec.Struct):
     fetch_failed: bool = False
 
 
+class SteamAppRecord(msgspec.Struct):
+    """
+    Single entry of the downloaded Steam app list.
+
+    Only the fields stored in steam_apps are declared; msgspec skips the
+    rest (last_modified, price_change_number) without materialising them.
+    """
+    appid: int
+    name: str | None = None
+
+
+class SteamAppListSource(msgspec.Struct):
+    """Validators and app count for one downloaded app list file."""
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    app_count: int = 0
+
+
+class SteamAppListMetadata(msgspec.Struct):
+    """
+    Small record describing the last Steam app list refresh.
+
+    Replaces the full JSON copy of the app list that used to be written
+    only so its mtime could be checked for staleness.
+    """
+    fetched_at: datetime
+    app_count: int = 0
+    sources: list[SteamAppListSource] = msgspec.field(default_factory=list)
+
+
+class HttpValidators(msgspec.Struct):
+    """
+    Cache validators recorded for one URL.
+
+    checked_at is refreshed on every 200 or 304 so callers can tell when the
+    resource was last confirmed current.
+    """
+    etag: str | None = None
+    last_modified: str | None = None
+    checked_at: datetime = msgspec.field(default_factory=datetime.now)
+
+
+class HttpValidatorData(msgspec.Struct):
+    """Persistent per-URL validator store (http_validators.json)."""
+    version: int
+    entries: dict[str, HttpValidators] = msgspec.field(default_factory=dict)
+
+
+class ConditionalFetchResult(msgspec.Struct):
+    """
+    Outcome of a conditional GET backed by a local copy.
+
+    data is always the parsed current content: the fresh response on 200,
+    or the local copy when the server answered 304 Not Modified.
+    """
+    data: Any
+    not_modified: bool = False
+
+
 # =============================================================================
 # Configuration Structures (Phase 4)
 # =============================================================================
@@ -326,6 +389,7 @@ class UpdatePreferencesConfig(msgspec.Struct):
     update_streamline: bool = True
     create_backups: bool = True
     high_performance_mode: bool = False  # Default OFF - opt-in only
+    backup_storage: str = "sidecar"  # BackupStorageMode value
 
 
 class LauncherPathsConfig(msgspec.Struct):
@@ -354,17 +418,249 @@ class PerformanceConfig(msgspec.Struct):
     Controls thread pool sizes and other performance tuning.
     """
     max_worker_threads: int = 8
+    scan_mode: str = "full"  # ScanMode value
+    version_backend: str = "auto"  # VersionExtractionBackend value
+    skip_handle_enumeration: bool = False
+    fsync_policy: str = "file"  # FsyncPolicy value
+    backup_strategy: str = "auto"  # BackupStrategy value
+    guided_search: bool = False
+    guided_search_max_depth: int = 8
+    watch_libraries: bool = False
 
     def __post_init__(self):
-        """Validate worker thread count"""
+        """Validate worker thread count, scan mode, version backend, fsync policy, backup strategy and search depth"""
         if not 1 <= self.max_worker_threads <= 32:
             raise ValueError(f"max_worker_threads must be between 1 and 32, got {self.max_worker_threads}")
+        valid_modes = [m.value for m in ScanMode]
+        if self.scan_mode not in valid_modes:
+            raise ValueError(f"scan_mode must be one of {valid_modes}, got {self.scan_mode}")
+        valid_backends = [b.value for b in VersionExtractionBackend]
+        if self.version_backend not in valid_backends:
+            raise ValueError(f"version_backend must be one of {valid_backends}, got {self.version_backend}")
+        valid_policies = [p.value for p in FsyncPolicy]
+        if self.fsync_policy not in valid_policies:
+            raise ValueError(f"fsync_policy must be one of {valid_policies}, got {self.fsync_policy}")
+        valid_strategies = [s.value for s in BackupStrategy]
+        if self.backup_strategy not in valid_strategies:
+            raise ValueError(f"backup_strategy must be one of {valid_strategies}, got {self.backup_strategy}")
+        if not 1 <= self.guided_search_max_depth <= 64:
+            raise ValueError(f"guided_search_max_depth must be between 1 and 64, got {self.guided_search_max_depth}")
 
 
 # =============================================================================
 # Scanner/Updater Structures (Phase 5)
 # =============================================================================
 
+class ScanMode(StrEnum):
+    """
+    Directory walking strategy used by find_all_dlls().
+
+    FULL re-walks every launcher tree. INCREMENTAL consults the persistent
+    directory index and only re-lists directories whose mtime/inode changed.
+    """
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
+class VersionExtractionBackend(StrEnum):
+    """
+    Executor used for bulk DLL version extraction.
+
+    AUTO picks PROCESS on GIL-enabled interpreters (when the batch is large
+    enough to amortize worker start-up) and THREAD on free-threaded builds.
+    """
+    AUTO = "auto"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class BackupStorageMode(StrEnum):
+    """
+    Where create_backup() keeps backup copies.
+
+    SIDECAR writes a .dlsss file next to each DLL. DEDUPLICATED stores one
+    content-addressed blob per distinct DLL in the central backup store and
+    lets every dll_backups row with that content reference it.
+    """
+    SIDECAR = "sidecar"
+    DEDUPLICATED = "deduplicated"
+
+
+class BackupStrategy(StrEnum):
+    """
+    How a backup file is materialised (see copy_engine.clone_file).
+
+    AUTO tries a reflink clone, then a hard link, then a full copy. Naming a
+    specific strategy starts the chain there instead (COPY always copies).
+    Hard links are safe because updates replace the DLL with a new file
+    rather than rewriting it in place.
+    """
+    AUTO = "auto"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY = "copy"
+
+
+class StoredBackupBlob(msgspec.Struct):
+    """Result of storing a DLL in the deduplicated backup store."""
+    digest: str
+    blob_path: str
+    size: int
+    reused: bool  # True when an identical blob already existed
+    method: str  # "existing" or the BackupStrategy value used to create it
+
+
+class FsyncPolicy(StrEnum):
+    """
+    Durability policy for atomic DLL writes (see copy_engine).
+
+    NONE leaves flushing to the OS, FILE fsyncs the temp file before it is
+    renamed over the target, FULL additionally fsyncs the parent directory so
+    the rename itself survives a power loss.
+    """
+    NONE = "none"
+    FILE = "file"
+    FULL = "full"
+
+
+class ResourceClass(StrEnum):
+    """
+    Resource an adaptive concurrency limiter guards (see adaptive_concurrency).
+
+    DISK limiters are kept per device, NETWORK limiters per host, and a single
+    CPU limiter covers PE parsing.
+    """
+    DISK = "disk"
+    NETWORK = "network"
+    CPU = "cpu"
+
+
+class LimiterStats(msgspec.Struct):
+    """Snapshot of an adaptive concurrency limiter, for logging."""
+    name: str
+    limit: int
+    min_limit: int
+    max_limit: int
+    peak_in_flight: int
+    completed: int
+    errors: int
+    decreases: int
+    avg_latency_ms: float
+    throughput_ops_s: float
+
+
+class ExecutorPool(StrEnum):
+    """
+    Named thread pools of the executor registry (see executor_registry).
+
+    SCAN walks directory trees, PE_PARSE extracts DLL versions, FILE_COPY
+    backs up, copies and hashes DLLs, and DB runs synchronous SQLite work.
+    """
+    SCAN = "scan"
+    PE_PARSE = "pe-parse"
+    FILE_COPY = "file-copy"
+    DB = "db"
+
+
+class ExecutorStats(msgspec.Struct):
+    """Snapshot of a registry thread pool, for logging."""
+    name: str
+    max_workers: int
+    threads: int
+    queued: int
+    submitted: int
+
+
+class DLLLocationPrior(msgspec.Struct):
+    """
+    A directory (relative to the game root) where DLLs were found before.
+
+    Learned per engine and launcher by guided search; "*" as the first path
+    component stands for any top-level folder (e.g. an Unreal project name).
+    """
+    engine: str
+    launcher: str
+    relative_dir: str
+    hits: int = 0
+
+
+class WalkStats(msgspec.Struct):
+    """Timing and load balance of one directory walk (see directory_walker)."""
+    root: str
+    directories: int
+    files_found: int
+    workers: int
+    steals: int
+    elapsed_seconds: float
+    busiest_worker_share: float  # Fraction of directories listed by the busiest worker
+
+
+class ScanPipelineStats(msgspec.Struct):
+    """What one scan pipeline recorded and how soon (see scan_pipeline)."""
+    games: int
+    dlls: int
+    dlls_with_versions: int
+    batches: int
+    first_batch_seconds: float | None  # Seconds from start until the first batch was in the database
+    elapsed_seconds: float
+
+
+class StorageKind(StrEnum):
+    """
+    Kind of physical storage behind a filesystem (see device_scheduler).
+
+    Detected from /sys/block/*/queue/rotational on Linux; UNKNOWN elsewhere
+    and for virtual filesystems.
+    """
+    ROTATIONAL = "rotational"
+    SSD = "ssd"
+    NVME = "nvme"
+    UNKNOWN = "unknown"
+
+
+class DeviceBudget(msgspec.Struct):
+    """
+    Concurrency budget for one physical device.
+
+    Attributes:
+        kind: Storage kind the budget was chosen for
+        concurrent_roots: Library roots walked on the device at once
+        walk_workers: Worker threads per root walk
+        initial_limit: Starting limit of the device's adaptive disk limiter
+        max_limit: Ceiling of the device's adaptive disk limiter
+    """
+    kind: StorageKind
+    concurrent_roots: int
+    walk_workers: int
+    initial_limit: int
+    max_limit: int
+
+
+class DirectoryIndexEntry(msgspec.Struct, array_like=True):
+    """
+    Cached listing of a single directory for incremental scans.
+
+    Only names are stored (not full paths) to keep the index compact;
+    they are joined back onto the directory path at lookup time.
+    """
+    mtime_ns: int
+    inode: int
+    subdirs: list[str]  # Child directory names (skip list already applied)
+    dlls: list[str]  # Matched DLL file names
+
+
+class DirectoryIndexData(msgspec.Struct):
+    """
+    Persistent directory-mtime index stored next to games.db.
+
+    dll_names records the DLL set the entries were matched against; if the
+    requested set differs, the cached matches are not trusted.
+    """
+    version: int
+    dll_names: list[str]
+    entries: dict[str, DirectoryIndexEntry]
+
+
 class ProcessedDLLResult(msgspec.Struct):
     """
     Result from DLL update operation.
@@ -444,6 +740,66 @@ class BackupEntry(msgspec.Struct):
     backup_path: str
     original_size: int
     verified: bool = False
+    checksum: str | None = None  # "algorithm:hex" of the original at backup time
+    strategy: str = "copy"  # BackupStrategy value (or "existing" for a reused blob)
+
+
+class ChecksumVerificationReport(msgspec.Struct):
+    """Result of a parallel checksum verification run."""
+    verified: list[str] = msgspec.field(default_factory=list)
+    mismatched: list[str] = msgspec.field(default_factory=list)
+    errors: dict[str, str] = msgspec.field(default_factory=dict)  # path -> error
+    bytes_hashed: int = 0
+    duration_seconds: float = 0.0
+    throughput_mb_s: float = 0.0
+
+
+class UpdateJournalState(StrEnum):
+    """
+    Progress of one DLL through a journaled high-performance update.
+
+    PLANNED -> BACKED_UP -> WRITTEN -> VERIFIED for an applied update;
+    UNCHANGED marks a DLL the run skipped or failed without writing it.
+    """
+    PLANNED = "planned"
+    BACKED_UP = "backed_up"
+    WRITTEN = "written"
+    VERIFIED = "verified"
+    UNCHANGED = "unchanged"
+
+
+class UpdateJournalEntry(msgspec.Struct):
+    """Journaled state of one DLL in an update session."""
+    target_path: str
+    source_dll_name: str
+    game_name: str
+    dll_type: str
+    state: str  # UpdateJournalState value
+    backup_path: str | None = None
+    checksum: str | None = None  # Checksum of the original at backup time
+
+
+class IncompleteUpdateSession(msgspec.Struct):
+    """A journaled update session that never finished (e.g. the app crashed)."""
+    session_id: str
+    started_at: datetime
+    entries: list[UpdateJournalEntry] = msgspec.field(default_factory=list)
+
+    @property
+    def pending_entries(self) -> list[UpdateJournalEntry]:
+        """Entries the session had not finished with."""
+        return [
+            e for e in self.entries
+            if e.state not in (UpdateJournalState.VERIFIED, UpdateJournalState.UNCHANGED)
+        ]
+
+    @property
+    def restorable_entries(self) -> list[UpdateJournalEntry]:
+        """Entries with a backup that a rollback can restore."""
+        return [
+            e for e in self.entries
+            if e.backup_path and e.state != UpdateJournalState.UNCHANGED
+        ]
 
 
 class BatchUpdateResult(msgspec.Struct):
@@ -0,0 +1,101 @@
+"""
+Open File Snapshot for DLSS Updater
+Shared, time-bounded index of files held open by running processes
+
+Enumerating open handles means walking the whole process table, which is
+expensive (especially on Windows). Rather than doing that once per locked DLL
+from every update worker, the snapshot is built once, indexed by normalized
+path, and shared by all lookups until it expires. Concurrent callers wait for
+the in-flight build instead of starting their own.
+"""
+
+import os
+import threading
+import time
+
+import psutil
+
+from dlss_updater.logger import setup_logger
+
+logger = setup_logger()
+
+# How long a snapshot is trusted before the next lookup rebuilds it
+DEFAULT_SNAPSHOT_MAX_AGE = 2.0
+
+
+def normalize_handle_path(path) -> str:
+    """Normalize a path for snapshot lookups (absolute, case-folded on Windows)."""
+    return os.path.normcase(os.path.abspath(os.fspath(path)))
+
+
+class OpenFileSnapshot:
+    """
+    Point-in-time map of open file paths to the process holding them.
+
+    Lookups are O(1) dictionary hits on the normalized path.
+    """
+
+    def __init__(self, owners: dict[str, tuple[int, str]], captured_at: float):
+        self._owners = owners
+        self.captured_at = captured_at
+
+    @classmethod
+    def capture(cls) -> "OpenFileSnapshot":
+        """Enumerate every accessible process once and index its open files."""
+        start = time.monotonic()
+        owners: dict[str, tuple[int, str]] = {}
+        for proc in psutil.process_iter(["pid", "name", "open_files"]):
+            open_files = proc.info.get("open_files")
+            if not open_files:
+                # None when access was denied or the process exited
+                continue
+            owner = (proc.info["pid"], proc.info.get("name") or "")
+            for open_file in open_files:
+                owners.setdefault(normalize_handle_path(open_file.path), owner)
+
+        captured_at = time.monotonic()
+        logger.debug(
+            f"[OPEN FILES] Indexed {len(owners)} open files in "
+            f"{(captured_at - start) * 1000:.0f}ms"
+        )
+        return cls(owners, captured_at)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.captured_at
+
+    def lookup(self, path) -> tuple[int, str] | None:
+        """Return (pid, process name) holding path open, or None."""
+        return self._owners.get(normalize_handle_path(path))
+
+
+_snapshot_lock = threading.Lock()
+_snapshot: OpenFileSnapshot | None = None
+
+
+def get_open_file_snapshot(max_age: float = DEFAULT_SNAPSHOT_MAX_AGE) -> OpenFileSnapshot:
+    """
+    Get the shared snapshot, rebuilding it if older than max_age seconds.
+
+    Thread-safe: only one caller builds a new snapshot, the rest reuse it.
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.age() < max_age:
+        return snapshot
+
+    with _snapshot_lock:
+        # Double-check: another thread may have rebuilt it while we waited
+        if _snapshot is None or _snapshot.age() >= max_age:
+            _snapshot = OpenFileSnapshot.capture()
+        return _snapshot
+
+
+def invalidate_open_file_snapshot() -> None:
+    """Drop the shared snapshot so the next lookup enumerates processes afresh."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
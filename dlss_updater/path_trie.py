@@ -0,0 +1,102 @@
+"""
+Path Trie for DLSS Updater
+Ancestor/descendant queries over a set of directory paths
+
+Scans repeatedly need to know which of many directories lie inside one
+another: game roots found under another game's root are merged into it, and
+manually configured Steam folders already covered by an auto-detected
+library are skipped. Comparing every pair with startswith() is O(n²) and, done
+on raw strings, also treats "Games2" as inside "Games".
+
+PathTrie stores paths component by component, so every query walks at most
+one path's depth and only whole components match. Paths are compared case-
+insensitively (as the scanner always has), with "/" and os.sep equivalent.
+"""
+
+import os
+from typing import Iterable
+
+
+def _components(path) -> list[str]:
+    """Lowercase components of a path; a trailing separator is ignored."""
+    normalized = str(path).lower()
+    if os.altsep:
+        normalized = normalized.replace(os.altsep, os.sep)
+    return normalized.rstrip(os.sep).split(os.sep)
+
+
+class _Node:
+    __slots__ = ("children", "path")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.path: str | None = None  # Set when an inserted path ends here
+
+
+class PathTrie:
+    """Set of directory paths answering ancestor and descendant queries in O(depth)."""
+
+    def __init__(self, paths: Iterable = ()):
+        self._root = _Node()
+        self._size = 0
+        for path in paths:
+            self.add(path)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, path) -> None:
+        """Insert a path (the first spelling of a path is the one reported back)."""
+        node = self._root
+        for component in _components(path):
+            node = node.children.setdefault(component, _Node())
+        if node.path is None:
+            node.path = str(path)
+            self._size += 1
+
+    def outermost_ancestor(self, path) -> str | None:
+        """The shallowest inserted path that is path itself or contains it, if any."""
+        node = self._root
+        for component in _components(path):
+            node = node.children.get(component)
+            if node is None:
+                return None
+            if node.path is not None:
+                return node.path
+        return None
+
+    def has_descendant(self, path) -> bool:
+        """Whether any inserted path is path itself or lies inside it."""
+        node = self._root
+        for component in _components(path):
+            node = node.children.get(component)
+            if node is None:
+                return False
+        # Every node below here exists because some path was inserted through it
+        return True
+
+    def overlaps(self, path) -> bool:
+        """Whether path contains, equals or lies inside any inserted path."""
+        return self.outermost_ancestor(path) is not None or self.has_descendant(path)
+
+
+def group_nested_paths(paths: Iterable) -> dict[str, list[str]]:
+    """
+    Group paths under the outermost of them that contains each one.
+
+    Runs in time linear in the total length of the paths.
+
+    Returns:
+        Dict mapping every outermost path to the other paths inside it
+        (an empty list when nothing is nested under it)
+    """
+    paths = [str(path) for path in paths]
+    trie = PathTrie(paths)
+    groups: dict[str, list[str]] = {}
+    for path in paths:
+        outer = trie.outermost_ancestor(path)
+        if outer == path:
+            groups.setdefault(path, [])
+        elif outer is not None:
+            groups.setdefault(outer, []).append(path)
+    return groups
@@ -0,0 +1,317 @@
+"""
+Minimal PE Version Reader for DLSS Updater
+
+Reads the FileVersion of a DLL without loading the whole file into memory.
+
+Only the structures needed to reach the version resource are read:
+DOS header -> PE/optional header -> section table -> resource directory
+(RT_VERSION -> first name -> first language) -> VS_VERSIONINFO block.
+That is a handful of small seek+read calls (a few KB in total) instead of
+materialising a 50+ MB DLL just to read one string.
+
+Malformed or unusual files raise PEVersionError so callers can fall back to
+pefile, which tolerates far more edge cases.
+"""
+
+import struct
+
+# Resource type ID for version information
+RT_VERSION = 16
+
+# VS_FIXEDFILEINFO.dwSignature
+_VS_FFI_SIGNATURE = 0xFEEF04BD
+
+# Optional header magic values
+_PE32_MAGIC = 0x10B
+_PE32_PLUS_MAGIC = 0x20B
+
+# Index of the resource table in the optional header data directories
+_RESOURCE_DIRECTORY_INDEX = 2
+
+# Sanity limits - a version resource is normally well under 4 KB
+_MAX_SECTIONS = 96
+_MAX_DIRECTORY_ENTRIES = 4096
+_MAX_VERSION_RESOURCE_SIZE = 64 * 1024
+
+_SECTION_STRUCT = struct.Struct("<8sIIII")  # Name, VirtualSize, VirtualAddress, SizeOfRawData, PointerToRawData
+_SECTION_HEADER_SIZE = 40
+_BLOCK_HEADER = struct.Struct("<HHH")  # wLength, wValueLength, wType
+
+
+class PEVersionError(ValueError):
+    """Raised when the PE layout cannot be walked by the minimal reader."""
+
+
+def _read_exact(file, offset: int, size: int) -> bytes:
+    """Read exactly size bytes at offset or raise PEVersionError."""
+    file.seek(offset)
+    data = file.read(size)
+    if len(data) != size:
+        raise PEVersionError(f"Truncated read at offset {offset:#x} ({len(data)}/{size} bytes)")
+    return data
+
+
+def _align4(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _read_utf16z(data: bytes, offset: int, end: int) -> tuple[str, int]:
+    """Read a NUL-terminated UTF-16LE string; returns (string, offset after terminator)."""
+    pos = data.find(b"\x00\x00", offset, end)
+    while pos != -1:
+        if (pos - offset) % 2 == 0:
+            return data[offset:pos].decode("utf-16-le", errors="replace"), pos + 2
+        # Matched across a character boundary (e.g. "\x??\x00\x00\x??"), keep looking
+        pos = data.find(b"\x00\x00", pos + 1, end)
+    raise PEVersionError("Unterminated string in version resource")
+
+
+def _parse_block(data: bytes, offset: int, limit: int) -> tuple[int, int, str, int]:
+    """
+    Parse the common header shared by all VS_VERSIONINFO child blocks.
+
+    Returns:
+        Tuple of (value_length, end, key, value_offset)
+    """
+    if offset + _BLOCK_HEADER.size > limit:
+        raise PEVersionError("Version block header out of range")
+    length, value_length, _ = _BLOCK_HEADER.unpack_from(data, offset)
+    end = offset + length
+    if length < _BLOCK_HEADER.size or end > limit:
+        raise PEVersionError("Invalid version block length")
+    key, after_key = _read_utf16z(data, offset + _BLOCK_HEADER.size, end)
+    value_offset = _align4(after_key)
+    return value_length, end, key, value_offset
+
+
+def _find_string_file_version(data: bytes, offset: int, end: int) -> str | None:
+    """
+    Walk StringFileInfo -> StringTable -> String looking for FileVersion.
+
+    With several StringTables (one per language/codepage) the first non-empty
+    FileVersion wins. pefile nominally keeps the last one, but its table loop
+    stops once the table offset (relative to VS_VERSIONINFO) passes the
+    StringFileInfo length, so which later tables it sees depends on the
+    layout; the first table is the one both readers always agree on.
+    """
+    while offset < end:
+        _, block_end, key, children = _parse_block(data, offset, end)
+        if key == "StringFileInfo":
+            table = children
+            while table < block_end:
+                _, table_end, _, string_offset = _parse_block(data, table, block_end)
+                while string_offset < table_end:
+                    value_length, string_end, name, value_offset = _parse_block(
+                        data, string_offset, table_end
+                    )
+                    if name == "FileVersion" and value_length:
+                        # Text values are measured in WCHARs and include the terminator
+                        raw = data[value_offset:min(value_offset + value_length * 2, string_end)]
+                        value = raw.decode("utf-16-le", errors="replace").split("\x00", 1)[0].strip()
+                        if value:
+                            return value
+                    string_offset = _align4(string_end)
+                table = _align4(table_end)
+        offset = _align4(block_end)
+    return None
+
+
+def parse_version_resource(data: bytes) -> str | None:
+    """
+    Extract the file version from a raw VS_VERSIONINFO resource.
+
+    The StringFileInfo "FileVersion" string is preferred because that is what
+    the pefile-based reader has always reported (and what is stored in the
+    database); VS_FIXEDFILEINFO is used when no string table entry exists.
+
+    Args:
+        data: Raw bytes of the RT_VERSION resource
+
+    Returns:
+        Version string, or None if the resource carries no version
+
+    Raises:
+        PEVersionError: If the resource is malformed
+    """
+    value_length, end, key, value_offset = _parse_block(data, 0, len(data))
+    if key != "VS_VERSION_INFO":
+        raise PEVersionError(f"Unexpected version resource key {key!r}")
+
+    fixed_version = None
+    if value_length >= 52 and value_offset + 52 <= end:
+        signature, _, ms, ls = struct.unpack_from("<IIII", data, value_offset)
+        if signature == _VS_FFI_SIGNATURE:
+            fixed_version = f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+
+    children = _align4(value_offset + value_length)
+    string_version = _find_string_file_version(data, children, end)
+    return string_version or fixed_version
+
+
+def _rva_to_offset(rva: int, sections: list[tuple[int, int, int, int]]) -> int:
+    for virtual_address, virtual_size, raw_size, raw_pointer in sections:
+        if virtual_address <= rva < virtual_address + max(virtual_size, raw_size):
+            return rva - virtual_address + raw_pointer
+    raise PEVersionError(f"RVA {rva:#x} is not inside any section")
+
+
+def _read_directory_entries(file, offset: int) -> list[tuple[int, int]]:
+    """Read an IMAGE_RESOURCE_DIRECTORY and return its (name/id, offset) entries."""
+    named, ids = struct.unpack("<HH", _read_exact(file, offset + 12, 4))
+    count = named + ids
+    if count > _MAX_DIRECTORY_ENTRIES:
+        raise PEVersionError("Resource directory has too many entries")
+    raw = _read_exact(file, offset + 16, count * 8)
+    return [struct.unpack_from("<II", raw, i * 8) for i in range(count)]
+
+
+def _first_subentry(file, resource_offset: int, entry_offset: int) -> int:
+    """Follow the first entry of a resource subdirectory."""
+    entries = _read_directory_entries(file, resource_offset + entry_offset)
+    if not entries:
+        raise PEVersionError("Empty resource subdirectory")
+    return entries[0][1]
+
+
+def read_version_resource(file) -> bytes | None:
+    """
+    Locate and read the raw RT_VERSION resource from an open PE file.
+
+    Args:
+        file: Binary file object opened for reading
+
+    Returns:
+        Raw resource bytes, or None if the file has no version resource
+
+    Raises:
+        PEVersionError: If the PE layout is malformed
+    """
+    dos_header = _read_exact(file, 0, 64)
+    if dos_header[:2] != b"MZ":
+        raise PEVersionError("Missing MZ signature")
+    pe_offset = struct.unpack_from("<I", dos_header, 0x3C)[0]
+
+    nt_headers = _read_exact(file, pe_offset, 24)
+    if nt_headers[:4] != b"PE\x00\x00":
+        raise PEVersionError("Missing PE signature")
+    number_of_sections, = struct.unpack_from("<H", nt_headers, 6)
+    size_of_optional_header, = struct.unpack_from("<H", nt_headers, 20)
+    if number_of_sections > _MAX_SECTIONS:
+        raise PEVersionError("Too many sections")
+
+    optional_offset = pe_offset + 24
+    optional_header = _read_exact(file, optional_offset, size_of_optional_header)
+    magic, = struct.unpack_from("<H", optional_header, 0)
+    if magic == _PE32_MAGIC:
+        rva_count_offset = 92
+    elif magic == _PE32_PLUS_MAGIC:
+        rva_count_offset = 108
+    else:
+        raise PEVersionError(f"Unknown optional header magic {magic:#x}")
+
+    if rva_count_offset + 4 > size_of_optional_header:
+        raise PEVersionError("Optional header too small")
+    number_of_rva_and_sizes, = struct.unpack_from("<I", optional_header, rva_count_offset)
+    if number_of_rva_and_sizes <= _RESOURCE_DIRECTORY_INDEX:
+        return None
+
+    directory_offset = rva_count_offset + 4 + _RESOURCE_DIRECTORY_INDEX * 8
+    if directory_offset + 8 > size_of_optional_header:
+        raise PEVersionError("Data directories truncated")
+    resource_rva, resource_size = struct.unpack_from("<II", optional_header, directory_offset)
+    if not resource_rva or not resource_size:
+        return None
+
+    section_table = _read_exact(
+        file, optional_offset + size_of_optional_header, number_of_sections * _SECTION_HEADER_SIZE
+    )
+    sections = []
+    for i in range(number_of_sections):
+        _, virtual_size, virtual_address, raw_size, raw_pointer = _SECTION_STRUCT.unpack_from(
+            section_table, i * _SECTION_HEADER_SIZE
+        )
+        sections.append((virtual_address, virtual_size, raw_size, raw_pointer))
+
+    resource_offset = _rva_to_offset(resource_rva, sections)
+
+    # Level 1: resource type (RT_VERSION is an integer ID, not a named entry)
+    version_entry = None
+    for name, data_offset in _read_directory_entries(file, resource_offset):
+        if not name & 0x80000000 and name == RT_VERSION:
+            version_entry = data_offset
+            break
+    if version_entry is None:
+        return None
+    if not version_entry & 0x80000000:
+        raise PEVersionError("RT_VERSION entry is not a directory")
+
+    # Level 2: resource name/ID, Level 3: language
+    name_entry = _first_subentry(file, resource_offset, version_entry & 0x7FFFFFFF)
+    if not name_entry & 0x80000000:
+        raise PEVersionError("Version name entry is not a directory")
+    language_entry = _first_subentry(file, resource_offset, name_entry & 0x7FFFFFFF)
+    if language_entry & 0x80000000:
+        raise PEVersionError("Version language entry is not a data entry")
+
+    # IMAGE_RESOURCE_DATA_ENTRY: OffsetToData is an RVA, not a resource-relative offset
+    data_rva, data_size = struct.unpack(
+        "<II", _read_exact(file, resource_offset + language_entry, 8)
+    )
+    if not 0 < data_size <= _MAX_VERSION_RESOURCE_SIZE:
+        raise PEVersionError(f"Implausible version resource size {data_size}")
+
+    return _read_exact(file, _rva_to_offset(data_rva, sections), data_size)
+
+
+def read_file_version(dll_path) -> str | None:
+    """
+    Read a DLL's FileVersion using only small seek+read calls.
+
+    Args:
+        dll_path: Path to the DLL
+
+    Returns:
+        Version string, or None if the DLL has no version resource
+
+    Raises:
+        PEVersionError: If the file is not a PE this reader understands
+        OSError: If the file cannot be opened
+    """
+    with open(dll_path, "rb", buffering=0) as file:
+        try:
+            resource = read_version_resource(file)
+            if resource is None:
+                return None
+            return parse_version_resource(resource)
+        except struct.error as e:
+            raise PEVersionError(f"Truncated PE structure: {e}") from e
+
+
+def read_file_version_pefile(dll_path) -> str | None:
+    """
+    Extract FileVersion with pefile (fallback for files read_file_version rejects).
+
+    Uses fast_load=True and only parses the resource directory.
+    """
+    import pefile  # Deferred import for faster startup
+
+    with open(dll_path, "rb") as file:
+        # Use fast_load to skip unnecessary PE parsing
+        pe = pefile.PE(data=file.read(), fast_load=True)
+
+    # Only parse the resource directory (where version info lives)
+    pe.parse_data_directories(
+        directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']]
+    )
+
+    version_str = None
+    if hasattr(pe, 'FileInfo') and pe.FileInfo:
+        for fileinfo in pe.FileInfo:
+            for entry in fileinfo:
+                if hasattr(entry, "StringTable"):
+                    for st in entry.StringTable:
+                        for key, value in st.entries.items():
+                            if key == b"FileVersion":
+                                version_str = value.decode("utf-8").strip()
+                                break
+    return version_str
@@ -0,0 +1,233 @@
+"""
+Directory Scan Index for DLSS Updater
+Persistent directory-mtime index that lets rescans skip unchanged directories
+
+A directory's mtime (and inode) changes whenever an entry is added, removed or
+renamed inside it, so a cached listing is still valid while both match. The
+walker still stat()s every known directory (a change deep in a tree does not
+bubble up to its parents), but it only re-lists directories that changed,
+which avoids enumerating the thousands of asset files in each game folder.
+
+The index is stored next to games.db and is only used when the scan mode is
+ScanMode.INCREMENTAL; full scans keep using the regular walkers.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import msgspec
+
+from dlss_updater.directory_walker import MAX_WALK_WORKERS, walk_tree
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import DirectoryIndexData, DirectoryIndexEntry
+from dlss_updater.platform_utils import APP_CONFIG_DIR
+
+logger = setup_logger()
+
+# Bump when the on-disk layout changes; older index files are discarded
+INDEX_VERSION = 1
+INDEX_FILENAME = "scan_index.msgpack"
+
+_index_encoder = msgspec.msgpack.Encoder()
+_index_decoder = msgspec.msgpack.Decoder(DirectoryIndexData)
+
+
+def get_scan_index_path() -> Path:
+    """Get the scan index location (same directory as games.db)."""
+    return APP_CONFIG_DIR / INDEX_FILENAME
+
+
+class DirectoryScanIndex:
+    """
+    In-memory view of the persistent directory index.
+
+    Thread-safe for free-threading (Python 3.14+): walks for several launchers
+    may run concurrently and all record into the same index.
+    """
+
+    def __init__(self, index_path: Path | None = None):
+        self.index_path = index_path or get_scan_index_path()
+        self._entries: dict[str, DirectoryIndexEntry] = {}
+        self._dll_names: frozenset = frozenset()
+        self._touched: set[str] = set()
+        self._lock = threading.Lock()
+        self.dirs_reused = 0
+        self.dirs_rescanned = 0
+
+    @classmethod
+    def load(cls, index_path: Path | None = None) -> "DirectoryScanIndex":
+        """
+        Load the index from disk, starting empty if missing or unreadable.
+
+        Args:
+            index_path: Optional override for the index file location
+
+        Returns:
+            DirectoryScanIndex instance
+        """
+        index = cls(index_path)
+        if not index.index_path.exists():
+            logger.info("[SCAN INDEX] No index found, incremental scan will do a full walk")
+            return index
+
+        try:
+            data = _index_decoder.decode(index.index_path.read_bytes())
+        except (OSError, msgspec.DecodeError, msgspec.ValidationError) as e:
+            logger.warning(f"[SCAN INDEX] Discarding unreadable index {index.index_path}: {e}")
+            return index
+
+        if data.version != INDEX_VERSION:
+            logger.info(f"[SCAN INDEX] Index version {data.version} is outdated, rebuilding")
+            return index
+
+        index._entries = data.entries
+        index._dll_names = frozenset(data.dll_names)
+        logger.info(f"[SCAN INDEX] Loaded {len(index._entries)} directory entries")
+        return index
+
+    def save(self) -> bool:
+        """
+        Persist the index, dropping directories not visited during this run.
+
+        Written to a temporary file first and swapped in with os.replace() so
+        an interrupted save never leaves a truncated index behind.
+
+        Returns:
+            True if saved successfully
+        """
+        with self._lock:
+            if not self._touched:
+                return False
+            entries = {path: self._entries[path] for path in self._touched if path in self._entries}
+            data = DirectoryIndexData(
+                version=INDEX_VERSION,
+                dll_names=sorted(self._dll_names),
+                entries=entries,
+            )
+
+        temp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+        try:
+            temp_path.write_bytes(_index_encoder.encode(data))
+            os.replace(temp_path, self.index_path)
+            logger.info(
+                f"[SCAN INDEX] Saved {len(entries)} directories "
+                f"(reused: {self.dirs_reused}, rescanned: {self.dirs_rescanned})"
+            )
+            return True
+        except OSError as e:
+            logger.error(f"[SCAN INDEX] Failed to save index: {e}")
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+
+    def _prepare(self, dll_names_lower: frozenset) -> frozenset:
+        """
+        Make sure cached matches cover the requested DLL names.
+
+        Entries are matched against the index's own name set, so any subset
+        can be served from cache. A name outside that set invalidates every
+        cached match.
+
+        Returns:
+            The DLL name set directories should be matched against
+        """
+        with self._lock:
+            if not dll_names_lower <= self._dll_names:
+                if self._entries:
+                    logger.info("[SCAN INDEX] DLL selection changed, invalidating cached directory matches")
+                self._entries = {}
+                self._touched = set()
+                self._dll_names = dll_names_lower
+            return self._dll_names
+
+    def _visit(
+        self,
+        directory: str,
+        match_names: frozenset,
+        skip_dirs: frozenset,
+    ) -> tuple[list[str], list[str]]:
+        """
+        List one directory, from cache when its mtime/inode are unchanged.
+
+        Returns:
+            Tuple of (subdirectory paths, matched DLL file names)
+        """
+        st = os.stat(directory)
+        entry = self._entries.get(directory)
+
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.inode == st.st_ino:
+            with self._lock:
+                self._touched.add(directory)
+                self.dirs_reused += 1
+        else:
+            subdirs = []
+            dlls = []
+            with os.scandir(directory) as entries:
+                for dir_entry in entries:
+                    try:
+                        name_lower = dir_entry.name.lower()
+                        if dir_entry.is_file(follow_symlinks=False):
+                            if name_lower in match_names:
+                                dlls.append(dir_entry.name)
+                        elif dir_entry.is_dir(follow_symlinks=False):
+                            if name_lower not in skip_dirs:
+                                subdirs.append(dir_entry.name)
+                    except (OSError, PermissionError):
+                        continue
+
+            entry = DirectoryIndexEntry(
+                mtime_ns=st.st_mtime_ns,
+                inode=st.st_ino,
+                subdirs=subdirs,
+                dlls=dlls,
+            )
+            with self._lock:
+                self._entries[directory] = entry
+                self._touched.add(directory)
+                self.dirs_rescanned += 1
+
+        return (
+            [os.path.join(directory, name) for name in entry.subdirs],
+            entry.dlls,
+        )
+
+    def walk(
+        self,
+        root_path: str,
+        dll_names_lower: frozenset,
+        skip_dirs: frozenset = frozenset(),
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """
+        Find DLLs under root_path, re-listing only directories that changed.
+
+        Mirrors _parallel_scandir_walk(): directories are walked by the
+        work-stealing walker (see directory_walker).
+
+        Args:
+            root_path: Root directory to scan
+            dll_names_lower: Frozenset of lowercase DLL names to find
+            skip_dirs: Lowercase directory names to skip
+            max_workers: Walker workers in the shared scan pool
+                (default: MAX_WALK_WORKERS, 1 = serial walk)
+
+        Returns:
+            List of found DLL paths
+        """
+        match_names = self._prepare(dll_names_lower)
+        root = str(root_path)
+
+        if max_workers is None:
+            max_workers = MAX_WALK_WORKERS
+
+        def visit(directory: str) -> tuple[list[str], list[str]]:
+            subdirs, dlls = self._visit(directory, match_names, skip_dirs)
+            return subdirs, [
+                os.path.join(directory, name) for name in dlls if name.lower() in dll_names_lower
+            ]
+
+        results, _ = walk_tree(root, visit, max_workers)
+        return results
@@ -0,0 +1,367 @@
+"""
+Scan Pipeline for DLSS Updater
+Streams scan results into the database while launchers are still scanned
+
+find_all_dlls used to wait for every launcher, then group the DLLs into
+games, look up Steam app IDs, read DLL versions and write everything to the
+database in one go at the very end. Nothing was recorded until the slowest
+launcher (usually a large custom folder) had been walked.
+
+ScanPipeline takes each launcher's DLLs as soon as that launcher is done and
+passes them through concurrent stages connected by bounded queues:
+
+    submit() -> game-root resolution -> app-id lookup (LOOKUP_WORKERS tasks)
+             -> version extraction -> database writer
+
+The last two stages work in batches of whatever has queued up (at most
+WRITE_BATCH games), so the first batches are small and written quickly and
+later ones grow with the load. Version extraction of one batch overlaps
+with the database write of the previous one, and full queues hold back the
+stages before them.
+
+A DLL reported by several launchers belongs to the one earliest in the
+launcher priority order. Launchers are submitted in whatever order they
+finish, so a higher-priority launcher can claim DLLs another launcher
+already recorded: the writer skips DLLs whose owner has changed, moves
+claimed DLLs to the new owner's game (whose launcher wins on upsert) and
+deletes games left without DLLs.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from dlss_updater.constants import DLL_TYPE_MAP
+from dlss_updater.database import db_manager
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ScanPipelineStats
+from dlss_updater.path_trie import group_nested_paths
+from dlss_updater.utils import find_game_root
+
+logger = setup_logger()
+
+# Concurrent Steam app ID lookups
+LOOKUP_WORKERS = 16
+
+# Most games per version extraction / database batch
+WRITE_BATCH = 200
+
+# Capacity of the queues between stages (games)
+QUEUE_SIZE = 256
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+def group_dlls_by_game(launcher: str, dll_paths: list[str]) -> dict[str, list[str]]:
+    """
+    Group one launcher's DLLs by game root directory.
+
+    DLLs whose game root lies inside another game's root are merged into
+    that game (catches layouts find_game_root does not recognise).
+
+    Returns:
+        Dict mapping game root path to its DLL paths
+    """
+    games_dict = {}
+    normalized_to_original = {}
+
+    for dll_path in dll_paths:
+        game_dir = find_game_root(Path(dll_path), launcher)
+        game_dir_normalized = str(game_dir.resolve()).lower()
+
+        if game_dir_normalized not in games_dict:
+            games_dict[game_dir_normalized] = []
+            normalized_to_original[game_dir_normalized] = str(game_dir)
+
+        games_dict[game_dir_normalized].append(dll_path)
+
+    games_dict = {
+        normalized_to_original[norm_path]: dlls
+        for norm_path, dlls in games_dict.items()
+    }
+
+    # Merge games with overlapping paths (handles custom folders)
+    merged = 0
+    for outer, nested in group_nested_paths(games_dict).items():
+        for path in nested:
+            games_dict[outer].extend(games_dict.pop(path))
+            merged += 1
+            logger.debug(f"Merged subdir {path} into {outer}")
+
+    if merged:
+        logger.info(f"Merged {merged} duplicate game entries for {launcher}")
+
+    return games_dict
+
+
+async def _drain(queue: asyncio.Queue, open_producers: int) -> tuple[list[Any], int]:
+    """
+    Wait for one item, then take whatever else is already queued.
+
+    Returns:
+        Tuple of (items, at most WRITE_BATCH; producers still open)
+    """
+    batch = []
+    item = await queue.get()
+    while True:
+        if item is _DONE:
+            open_producers -= 1
+        else:
+            batch.append(item)
+        if not open_producers or len(batch) >= WRITE_BATCH or queue.empty():
+            return batch, open_producers
+        item = queue.get_nowait()
+
+
+class ScanPipeline:
+    """
+    Records scan results in the database while the scan is still running.
+
+    Use on the event loop: start(), submit() each launcher's DLLs as it
+    finishes, then close() to wait for everything to be written.
+    on_recorded (if given) is awaited after every database batch with the
+    running totals of games and DLLs recorded.
+
+    launcher_priority orders launchers for DLLs several of them report
+    (earliest wins); launchers not in it rank after all listed ones, and
+    among equals the first to submit a DLL keeps it.
+    """
+
+    def __init__(
+        self,
+        on_recorded: Callable[[int, int], Awaitable[None]] | None = None,
+        launcher_priority: list[str] | None = None
+    ):
+        self._on_recorded = on_recorded
+        self._ranks = {launcher: rank for rank, launcher in enumerate(launcher_priority or ())}
+        # DLL path -> launcher it belongs to
+        self._owners: dict[str, str] = {}
+        # DLL path -> game path it is recorded under, and recorded DLLs per game path
+        self._recorded_games: dict[str, str] = {}
+        self._game_dll_counts: Counter[str] = Counter()
+        # Game path -> launcher it is recorded with
+        self._game_launchers: dict[str, str] = {}
+        self._launchers: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._games: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._records: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        # Batches with their versions read, waiting for the writer
+        self._batches: asyncio.Queue = asyncio.Queue(maxsize=2)
+        self._tasks: list[asyncio.Task] = []
+        self._start = 0.0
+        self._dlls_with_versions = 0
+        self._batches_written = 0
+        self._first_batch_seconds: float | None = None
+
+    def start(self) -> None:
+        """Start the stage tasks."""
+        self._start = time.perf_counter()
+        self._tasks = [
+            asyncio.create_task(self._resolve_stage(), name="scan_pipeline_resolve"),
+            *(
+                asyncio.create_task(self._lookup_stage(), name=f"scan_pipeline_lookup_{i}")
+                for i in range(LOOKUP_WORKERS)
+            ),
+            asyncio.create_task(self._version_stage(), name="scan_pipeline_versions"),
+            asyncio.create_task(self._write_stage(), name="scan_pipeline_write"),
+        ]
+
+    def _rank(self, launcher: str) -> int:
+        return self._ranks.get(launcher, len(self._ranks))
+
+    def owner(self, dll_path) -> str | None:
+        """Launcher a submitted DLL currently belongs to."""
+        return self._owners.get(str(dll_path))
+
+    async def submit(self, launcher: str, dll_paths: list[str]) -> list[str]:
+        """
+        Queue one launcher's (whitelist-filtered) DLLs.
+
+        Returns:
+            The DLLs this launcher claimed: those not already claimed by the
+            same or a higher-priority launcher
+        """
+        rank = self._rank(launcher)
+        claimed = []
+        for dll_path in dll_paths:
+            owner = self._owners.get(str(dll_path))
+            if owner is None or rank < self._rank(owner):
+                self._owners[str(dll_path)] = launcher
+                claimed.append(dll_path)
+        if claimed:
+            await self._launchers.put((launcher, claimed))
+        return claimed
+
+    async def close(self) -> ScanPipelineStats:
+        """Wait until everything submitted is in the database."""
+        await self._launchers.put(_DONE)
+        await asyncio.gather(*self._tasks)
+
+        stats = ScanPipelineStats(
+            games=len(self._game_dll_counts),
+            dlls=len(self._recorded_games),
+            dlls_with_versions=self._dlls_with_versions,
+            batches=self._batches_written,
+            first_batch_seconds=self._first_batch_seconds,
+            elapsed_seconds=time.perf_counter() - self._start,
+        )
+        if stats.batches:
+            logger.info(
+                f"[PIPELINE] Recorded {stats.games} games, {stats.dlls} DLLs in {stats.batches} batches; "
+                f"first batch after {stats.first_batch_seconds:.2f}s, done after {stats.elapsed_seconds:.2f}s"
+            )
+        return stats
+
+    def cancel(self) -> None:
+        """Cancel all stages (e.g. when the scan itself is cancelled)."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def _resolve_stage(self) -> None:
+        """Group each launcher's DLLs into games."""
+        while (item := await self._launchers.get()) is not _DONE:
+            launcher, dll_paths = item
+            try:
+                # find_game_root resolves paths (filesystem access)
+                games = await asyncio.to_thread(group_dlls_by_game, launcher, dll_paths)
+            except Exception as e:
+                logger.error(f"Error grouping {launcher} DLLs into games: {e}", exc_info=True)
+                continue
+            for game_dir, game_dlls in games.items():
+                await self._games.put((launcher, game_dir, game_dlls))
+
+        for _ in range(LOOKUP_WORKERS):
+            await self._games.put(_DONE)
+
+    async def _lookup_stage(self) -> None:
+        """Build game records with their Steam app IDs."""
+        from dlss_updater.steam_integration import (
+            detect_steam_app_id_from_manifest,
+            find_steam_app_id_by_name,
+        )
+
+        while (item := await self._games.get()) is not _DONE:
+            launcher, game_dir_str, game_dlls = item
+            game_dir = Path(game_dir_str)
+            game_name = game_dir.name  # Use directory name directly instead of parsing DLL path
+
+            try:
+                app_id = None
+                if launcher == "Steam":
+                    app_id = await detect_steam_app_id_from_manifest(game_dir)
+                if app_id is None:
+                    app_id = await find_steam_app_id_by_name(game_name)
+            except Exception as e:
+                logger.error(f"Error preparing game data: {e}")
+                continue
+
+            record = {
+                'name': game_name,
+                'path': game_dir_str,
+                'launcher': launcher,
+                'steam_app_id': app_id,
+            }
+            await self._records.put((record, game_dlls))
+
+        await self._records.put(_DONE)
+
+    async def _version_stage(self) -> None:
+        """Read the DLL versions of each batch of games."""
+        # Unchanged DLLs are answered from the persistent version cache in one query;
+        # only new or modified files are PE-parsed (in parallel)
+        from dlss_updater.updater import get_dll_versions_cached_async
+
+        producers = LOOKUP_WORKERS
+        while producers:
+            batch, producers = await _drain(self._records, producers)
+            if not batch:
+                continue
+            try:
+                versions = await get_dll_versions_cached_async(
+                    dll_path for _, game_dlls in batch for dll_path in game_dlls
+                )
+            except Exception as e:
+                logger.error(f"Error extracting DLL versions: {e}", exc_info=True)
+                versions = {}
+            await self._batches.put((batch, versions))
+
+        await self._batches.put(_DONE)
+
+    async def _write_stage(self) -> None:
+        """Upsert each batch of games and their DLLs."""
+        while (item := await self._batches.get()) is not _DONE:
+            batch, versions = item
+            try:
+                await self._write(batch, versions)
+            except Exception as e:
+                logger.error(f"Error recording games in database: {e}", exc_info=True)
+
+    async def _write(self, batch: list[tuple[dict[str, Any], list[str]]], versions: dict[str, str | None]) -> None:
+        games_to_insert: dict[str, dict[str, Any]] = {}  # Maps game path to its record
+        game_dll_mapping: dict[str, list[str]] = {}  # Maps game path to list of DLL paths
+        for record, game_dlls in batch:
+            # A higher-priority launcher may have claimed some of these DLLs since
+            owned = [dll for dll in game_dlls if self._owners.get(str(dll)) == record['launcher']]
+            if not owned:
+                continue
+            path = record['path']
+            # Several launchers can own DLLs under one game; the game gets the best of them
+            best = games_to_insert.get(path, {}).get('launcher', self._game_launchers.get(path))
+            if best is not None and self._rank(best) < self._rank(record['launcher']):
+                record = {**record, 'launcher': best}
+            games_to_insert[path] = record
+            game_dll_mapping.setdefault(path, []).extend(owned)
+
+        if not games_to_insert:
+            return
+
+        games_result = await db_manager.batch_upsert_games(
+            list(games_to_insert.values()), update_launcher=bool(self._ranks)
+        )
+
+        dlls_to_insert = []
+        for game_path, game in games_result.items():
+            for dll_path in game_dll_mapping.get(game_path, ()):
+                dll_filename = Path(dll_path).name
+                dll_version = versions.get(str(dll_path))
+                dlls_to_insert.append({
+                    'game_id': game.id,
+                    'dll_type': DLL_TYPE_MAP.get(dll_filename.lower(), "Unknown"),
+                    'dll_filename': dll_filename,
+                    'dll_path': str(dll_path),
+                    'current_version': dll_version,
+                })
+                if dll_version:
+                    self._dlls_with_versions += 1
+
+        if not await db_manager.batch_upsert_dlls(dlls_to_insert):
+            return
+
+        # Games whose DLLs all moved to another launcher's game
+        vacated = set()
+        for game_path, game in games_result.items():
+            self._game_launchers[game_path] = game.launcher
+            for dll_path in game_dll_mapping.get(game_path, ()):
+                previous = self._recorded_games.get(str(dll_path))
+                if previous == game_path:
+                    continue
+                if previous is not None:
+                    self._game_dll_counts[previous] -= 1
+                    if not self._game_dll_counts[previous]:
+                        del self._game_dll_counts[previous]
+                        vacated.add(previous)
+                self._recorded_games[str(dll_path)] = game_path
+                self._game_dll_counts[game_path] += 1
+        if vacated:
+            await db_manager.delete_games_without_dlls(list(vacated))
+            for game_path in vacated:
+                self._game_launchers.pop(game_path, None)
+
+        self._batches_written += 1
+        if self._first_batch_seconds is None:
+            self._first_batch_seconds = time.perf_counter() - self._start
+
+        if self._on_recorded is not None:
+            await self._on_recorded(len(self._game_dll_counts), len(self._recorded_games))
@@ -2,13 +2,22 @@ import os
 from pathlib import Path
 from typing import Any
 from .config import LauncherPathName, config_manager, Concurrency
+from .models import ScanMode
+from .scan_index import DirectoryScanIndex
+from .adaptive_concurrency import get_disk_limiter, log_limiter_stats
+from .device_scheduler import DeviceScheduler, device_key, get_device_budget, get_path_budget
+from .directory_walker import MAX_WALK_WORKERS, walk_tree
+from .guided_search import GuidedSearch
+from .scan_pipeline import ScanPipeline
+from .path_trie import PathTrie
+from .executor_registry import log_executor_stats
 from .whitelist import is_whitelisted
 from .constants import DLL_GROUPS
-from .utils import find_game_root
 from .vdf_parser import VDFParser
 from .platform_utils import IS_WINDOWS, IS_LINUX
 import asyncio
 import concurrent.futures
+import threading
 from dlss_updater.logger import setup_logger
 import sys
 
@@ -46,82 +55,42 @@ def _parallel_scandir_walk(root_path: str, dll_names_lower: frozenset, max_worke
 
     Strategy:
     - Use os.scandir() which is faster than os.listdir() + os.stat()
-    - Parallelize across top-level directories for better load distribution
-    - Use thread pool sized to CPU count (more beneficial with no GIL)
+    - Every subdirectory is a unit of work for the work-stealing walker, so
+      one huge game folder is spread over all workers
+    - Run on the shared scan pool (more beneficial with no GIL)
 
     Args:
         root_path: Root directory to scan
         dll_names_lower: Frozenset of lowercase DLL names to find
-        max_workers: Number of worker threads (default: CPU count * 2 for I/O)
+        max_workers: Number of walker workers (default: MAX_WALK_WORKERS)
 
     Returns:
         List of found DLL paths
     """
     import os
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     if max_workers is None:
-        # Use thread pool sized for I/O operations - scale aggressively
-        max_workers = Concurrency.THREADPOOL_IO
-
-    results = []
+        max_workers = MAX_WALK_WORKERS
 
-    def scan_directory_recursive(directory: str) -> list[str]:
-        """Recursively scan a directory for DLLs using os.scandir()"""
+    def scan_directory(directory: str) -> tuple[list[str], list[str]]:
+        """List one directory: (subdirectories to descend into, DLLs found)"""
+        subdirs = []
         found = []
-        try:
-            with os.scandir(directory) as entries:
-                subdirs = []
-                for entry in entries:
-                    try:
-                        name_lower = entry.name.lower()
-                        if entry.is_file(follow_symlinks=False):
-                            if name_lower in dll_names_lower:
-                                found.append(entry.path)
-                        elif entry.is_dir(follow_symlinks=False):
-                            if name_lower not in _SKIP_DIRECTORIES:
-                                subdirs.append(entry.path)
-                    except (OSError, PermissionError):
-                        continue
-
-                # Recurse into subdirectories
-                for subdir in subdirs:
-                    found.extend(scan_directory_recursive(subdir))
-
-        except (OSError, PermissionError):
-            pass
-        return found
-
-    # Get top-level directories for parallel processing
-    try:
-        with os.scandir(root_path) as entries:
-            top_level_dirs = []
+        with os.scandir(directory) as entries:
             for entry in entries:
                 try:
-                    if entry.is_dir(follow_symlinks=False):
-                        if entry.name.lower() not in _SKIP_DIRECTORIES:
-                            top_level_dirs.append(entry.path)
-                    elif entry.is_file(follow_symlinks=False):
-                        if entry.name.lower() in dll_names_lower:
-                            results.append(entry.path)
+                    name_lower = entry.name.lower()
+                    if entry.is_file(follow_symlinks=False):
+                        if name_lower in dll_names_lower:
+                            found.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        if name_lower not in _SKIP_DIRECTORIES:
+                            subdirs.append(entry.path)
                 except (OSError, PermissionError):
                     continue
-    except (OSError, PermissionError) as e:
-        logger.debug(f"Cannot access {root_path}: {e}")
-        return results
-
-    if not top_level_dirs:
-        return results
-
-    # Parallel scan of top-level directories
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(scan_directory_recursive, d): d for d in top_level_dirs}
-        for future in as_completed(futures):
-            try:
-                results.extend(future.result())
-            except Exception as e:
-                logger.debug(f"Error scanning {futures[future]}: {e}")
+        return subdirs, found
 
+    results, _ = walk_tree(str(root_path), scan_directory, max_workers)
     return results
 
 # Pre-computed frozen set of DLL names for O(1) lookup (populated at scan time)
@@ -228,46 +197,70 @@ def get_steam_libraries(steam_path):
     return libraries
 
 
-async def find_dlls(library_paths, launcher_name, dll_names):
-    """Find DLLs from a filtered list of DLL names using batch whitelist checking"""
+async def find_dlls(
+    library_paths,
+    launcher_name,
+    dll_names,
+    scan_index: DirectoryScanIndex | None = None,
+    scheduler: DeviceScheduler | None = None
+):
+    """Find DLLs from a filtered list of DLL names using batch whitelist checking
+
+    When scan_index is provided (incremental mode), directories whose mtime is
+    unchanged since the last scan are served from the index instead of re-listed.
+    Library roots are walked under their device's budget; pass the scan-wide
+    scheduler so roots of other launchers on the same disk are accounted for.
+    """
     dll_paths = []
     logger.debug(f"Searching for DLLs in {launcher_name}")
 
+    if scheduler is None:
+        scheduler = DeviceScheduler()
+
     # Pre-compute lowercase DLL names for O(1) lookup
     dll_names_lower = frozenset(d.lower() for d in dll_names)
 
-    # First, collect all potential DLL paths
-    potential_dlls = []
+    def _scan_library(library_path, walk_workers: int) -> list[str]:
+        results = []
 
-    for library_path in library_paths:
+        if scan_index is not None:
+            return scan_index.walk(
+                str(library_path), dll_names_lower, _SKIP_DIRECTORIES, walk_workers
+            )
+
+        # Use scandir-rs for 6-70x faster scanning on Windows if available
+        if HAVE_SCANDIR_RS:
+            try:
+                for entry in FastWalk(str(library_path)):
+                    # Skip directories in skip list
+                    if entry.is_dir:
+                        if entry.name.lower() in _SKIP_DIRECTORIES:
+                            continue
+                    elif entry.is_file:
+                        if entry.name.lower() in dll_names_lower:
+                            results.append(entry.path)
+                return results
+            except Exception as e:
+                logger.warning(f"scandir-rs failed, falling back to os.walk: {e}")
+
+        # Fallback to parallel scandir (faster than os.walk, especially with GIL disabled)
+        return _parallel_scandir_walk(str(library_path), dll_names_lower, walk_workers)
+
+    async def _scan_on_device(library_path, budget) -> list[str]:
         logger.debug(f"Scanning directory: {library_path}")
-        try:
-            # Use asyncio.to_thread to avoid blocking the event loop
-            def _scan_library():
-                results = []
-
-                # Use scandir-rs for 6-70x faster scanning on Windows if available
-                if HAVE_SCANDIR_RS:
-                    try:
-                        for entry in FastWalk(str(library_path)):
-                            # Skip directories in skip list
-                            if entry.is_dir:
-                                if entry.name.lower() in _SKIP_DIRECTORIES:
-                                    continue
-                            elif entry.is_file:
-                                if entry.name.lower() in dll_names_lower:
-                                    results.append(entry.path)
-                        return results
-                    except Exception as e:
-                        logger.warning(f"scandir-rs failed, falling back to os.walk: {e}")
+        # Use asyncio.to_thread to avoid blocking the event loop
+        return await asyncio.to_thread(_scan_library, library_path, budget.walk_workers)
 
-                # Fallback to parallel scandir (faster than os.walk, especially with GIL disabled)
-                return _parallel_scandir_walk(str(library_path), dll_names_lower)
+    # First, collect all potential DLL paths
+    potential_dlls = []
 
-            lib_dlls = await asyncio.to_thread(_scan_library)
-            potential_dlls.extend(lib_dlls)
-        except Exception as e:
-            logger.error(f"Error scanning {library_path}: {e}")
+    library_paths = list(library_paths)
+    scanned = await scheduler.map(library_paths, _scan_on_device)
+    for library_path, lib_dlls in zip(library_paths, scanned):
+        if isinstance(lib_dlls, Exception):
+            logger.error(f"Error scanning {library_path}: {lib_dlls}")
+            continue
+        potential_dlls.extend(lib_dlls)
 
     # Batch check whitelist status
     if potential_dlls:
@@ -608,7 +601,13 @@ async def get_custom_folder(folder_num):
     return [Path(p) for p in custom_paths if Path(p).exists()]
 
 
-async def scan_game_for_dlls(game_path: Path, dll_names_lower: frozenset) -> list[str]:
+async def scan_game_for_dlls(
+    game_path: Path,
+    dll_names_lower: frozenset,
+    scan_index: DirectoryScanIndex | None = None,
+    guided: GuidedSearch | None = None,
+    launcher: str = "Steam"
+) -> list[str]:
     """
     Scan a single game directory for DLLs using optimized os.scandir().
 
@@ -621,10 +620,24 @@ async def scan_game_for_dlls(game_path: Path, dll_names_lower: frozenset) -> lis
     Args:
         game_path: Path to the game directory
         dll_names_lower: Frozenset of lowercase DLL names to search for
+        scan_index: Optional directory index for incremental scans
+        guided: Optional guided search; takes precedence over scan_index
+        launcher: Launcher the game belongs to (for guided search priors)
 
     Returns:
         List of found DLL paths
     """
+    if guided is not None:
+        return await asyncio.to_thread(
+            guided.scan, game_path, dll_names_lower, _SKIP_DIRECTORIES, launcher
+        )
+
+    if scan_index is not None:
+        # Games are already scanned concurrently, so walk each one serially
+        return await asyncio.to_thread(
+            scan_index.walk, str(game_path), dll_names_lower, _SKIP_DIRECTORIES, 1
+        )
+
     def _scan_sync() -> list[str]:
         """Synchronous scanning using os.scandir() (runs in thread pool)"""
         results = []
@@ -658,7 +671,10 @@ async def scan_game_for_dlls(game_path: Path, dll_names_lower: frozenset) -> lis
 async def scan_games_for_dlls_parallel(
     games: list[dict[str, Any]],
     dll_names_lower: frozenset,
-    max_concurrent: int = None
+    max_concurrent: int = None,
+    scan_index: DirectoryScanIndex | None = None,
+    guided: GuidedSearch | None = None,
+    launcher: str = "Steam"
 ) -> dict[str, list[str]]:
     """
     Scan multiple game directories for DLLs in parallel with maximum concurrency.
@@ -666,7 +682,11 @@ async def scan_games_for_dlls_parallel(
     Args:
         games: List of game dicts with 'path' key
         dll_names_lower: Frozenset of lowercase DLL names
-        max_concurrent: Maximum concurrent scans (default: IO_HEAVY from Concurrency)
+        max_concurrent: Overall ceiling on concurrent scans (default: IO_HEAVY
+            from Concurrency); each disk is further limited adaptively
+        scan_index: Optional directory index for incremental scans
+        guided: Optional guided search (see scan_game_for_dlls)
+        launcher: Launcher the games belong to
 
     Returns:
         Dict mapping game path string to list of found DLLs
@@ -676,13 +696,17 @@ async def scan_games_for_dlls_parallel(
     results = {}
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def scan_with_limit(game: dict[str, Any]):
-        async with semaphore:
+    # One adaptive limiter per disk device (resolving it stats the path)
+    limiters = await asyncio.to_thread(lambda: [get_disk_limiter(g['path']) for g in games])
+
+    async def scan_with_limit(game: dict[str, Any], limiter):
+        # Disk limiter first: a task waiting on a throttled disk must not hold a global slot
+        async with limiter.slot_async(), semaphore:
             game_path = game['path']
-            dlls = await scan_game_for_dlls(game_path, dll_names_lower)
+            dlls = await scan_game_for_dlls(game_path, dll_names_lower, scan_index, guided, launcher)
             return str(game_path), dlls, game
 
-    tasks = [scan_with_limit(g) for g in games]
+    tasks = [scan_with_limit(g, limiter) for g, limiter in zip(games, limiters)]
     completed = await asyncio.gather(*tasks, return_exceptions=True)
 
     for result in completed:
@@ -723,7 +747,13 @@ async def enumerate_steam_games_fast(steam_path: str) -> list[dict[str, Any]]:
         return []
 
 
-async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
+async def scan_steam_fast(
+    steam_path: str,
+    dll_names: list[str],
+    scan_index: DirectoryScanIndex | None = None,
+    scheduler: DeviceScheduler | None = None,
+    guided: GuidedSearch | None = None
+) -> list[str]:
     """
     Optimized Steam scanning using appmanifest enumeration + targeted scanning.
 
@@ -736,6 +766,9 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     Args:
         steam_path: Steam installation path
         dll_names: List of DLL names to search for
+        scan_index: Optional directory index for incremental scans
+        scheduler: Scan-wide device scheduler for the manual path walks
+        guided: Optional guided search for the per-game scans
 
     Returns:
         List of found DLL paths
@@ -749,7 +782,9 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     if games:
         # Step 2: Scan game directories in parallel
         logger.info(f"Scanning {len(games)} Steam game directories for DLLs...")
-        scan_results = await scan_games_for_dlls_parallel(games, dll_names_lower)
+        scan_results = await scan_games_for_dlls_parallel(
+            games, dll_names_lower, scan_index=scan_index, guided=guided
+        )
 
         # Collect all DLLs
         for path_str, data in scan_results.items():
@@ -766,27 +801,18 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     # This handles cases where users have additional game directories
     manual_paths = get_steam_manual_paths()
 
-    # De-duplicate: remove paths that are already covered by auto-detected libraries
-    auto_detected_libs = set()
-    if steam_path:
-        for lib in get_steam_libraries(steam_path):
-            auto_detected_libs.add(str(lib).lower())
-
-    unique_manual_paths = []
-    for manual_path in manual_paths:
-        manual_str = str(manual_path).lower()
-        # Check if this path is not already covered
-        is_duplicate = False
-        for auto_lib in auto_detected_libs:
-            if manual_str.startswith(auto_lib) or auto_lib.startswith(manual_str):
-                is_duplicate = True
-                break
-        if not is_duplicate:
-            unique_manual_paths.append(manual_path)
+    # De-duplicate: remove paths that contain or lie inside auto-detected libraries
+    auto_detected_libs = PathTrie(get_steam_libraries(steam_path) if steam_path else ())
+    unique_manual_paths = [
+        manual_path for manual_path in manual_paths
+        if not auto_detected_libs.overlaps(manual_path)
+    ]
 
     if unique_manual_paths:
         logger.info(f"Scanning {len(unique_manual_paths)} additional manual Steam paths...")
-        manual_dlls = await find_dlls(unique_manual_paths, "Steam (Manual)", dll_names)
+        manual_dlls = await find_dlls(
+            unique_manual_paths, "Steam (Manual)", dll_names, scan_index, scheduler
+        )
         all_dlls.extend(manual_dlls)
         logger.info(f"Found {len(manual_dlls)} DLLs in manual Steam paths")
 
@@ -803,15 +829,44 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     return unique_dlls
 
 
-async def find_all_dlls(progress_callback=None):
+def get_selected_dll_names() -> list[str]:
+    """DLL names to search for, based on the technologies the user chose to update."""
+    update_dlss = config_manager.get_update_preference("DLSS")
+    update_ds = config_manager.get_update_preference("DirectStorage")
+    update_streamline = config_manager.get_update_preference("Streamline")
+    update_xess = config_manager.get_update_preference("XeSS")
+    update_fsr = config_manager.get_update_preference("FSR")
+
+    dll_names = []
+    if update_dlss:
+        dll_names.extend(DLL_GROUPS["DLSS"])
+    if update_streamline:
+        dll_names.extend(DLL_GROUPS["Streamline"])
+    # DirectStorage DLLs are optional and Windows-only
+    if update_ds and "DirectStorage" in DLL_GROUPS:
+        dll_names.extend(DLL_GROUPS["DirectStorage"])
+    if update_xess and DLL_GROUPS["XeSS"]:  # Only add if there are XeSS DLLs defined
+        dll_names.extend(DLL_GROUPS["XeSS"])
+    if update_fsr and DLL_GROUPS["FSR"]:  # Add FSR DLLs if FSR is selected
+        dll_names.extend(DLL_GROUPS["FSR"])
+    return dll_names
+
+
+async def find_all_dlls(progress_callback=None, scan_mode: ScanMode | None = None, on_recorded=None):
     """
     Find all DLLs across configured launchers
 
     Args:
         progress_callback: Optional callback(current, total, message) for progress updates
+        scan_mode: ScanMode.FULL or ScanMode.INCREMENTAL (default: configured scan mode)
+        on_recorded: Optional callback(games, dlls) awaited whenever another batch
+            of games is in the database, while the scan is still running
     """
     logger.info("Starting find_all_dlls function")
 
+    if scan_mode is None:
+        scan_mode = config_manager.get_scan_mode()
+
     # Report initialization
     if progress_callback:
         await progress_callback(0, 100, "Initializing scan...")
@@ -831,26 +886,8 @@ async def find_all_dlls(progress_callback=None):
         "_skipped_paths": [],  # Paths skipped due to permissions (Linux)
     }
 
-    # Get user preferences
-    update_dlss = config_manager.get_update_preference("DLSS")
-    update_ds = config_manager.get_update_preference("DirectStorage")
-    update_streamline = config_manager.get_update_preference("Streamline")
-    update_xess = config_manager.get_update_preference("XeSS")
-    update_fsr = config_manager.get_update_preference("FSR")
-
     # Build list of DLLs to search for based on preferences
-    dll_names = []
-    if update_dlss:
-        dll_names.extend(DLL_GROUPS["DLSS"])
-    if update_streamline:
-        dll_names.extend(DLL_GROUPS["Streamline"])
-    # DirectStorage DLLs are optional and Windows-only
-    if update_ds and "DirectStorage" in DLL_GROUPS:
-        dll_names.extend(DLL_GROUPS["DirectStorage"])
-    if update_xess and DLL_GROUPS["XeSS"]:  # Only add if there are XeSS DLLs defined
-        dll_names.extend(DLL_GROUPS["XeSS"])
-    if update_fsr and DLL_GROUPS["FSR"]:  # Add FSR DLLs if FSR is selected
-        dll_names.extend(DLL_GROUPS["FSR"])
+    dll_names = get_selected_dll_names()
 
     # Skip if no technologies selected
     if not dll_names:
@@ -863,12 +900,27 @@ async def find_all_dlls(progress_callback=None):
     if progress_callback:
         await progress_callback(5, 100, "Preparing to scan launchers...")
 
+    # Incremental mode: load the persistent directory index shared by all launchers
+    scan_index = None
+    if scan_mode == ScanMode.INCREMENTAL:
+        scan_index = await asyncio.to_thread(DirectoryScanIndex.load)
+    logger.info(f"Scan mode: {scan_mode}")
+
+    # Guided search: per-game scans probe learned DLL locations first
+    guided = None
+    if config_manager.get_guided_search():
+        guided = await GuidedSearch.load(config_manager.get_guided_search_max_depth())
+
+    # Shared by all launchers: library roots on the same disk take turns,
+    # roots on different disks are walked in parallel
+    scheduler = DeviceScheduler()
+
     # Define async functions for each launcher
     async def scan_steam():
         steam_path = get_steam_install_path()
         if steam_path:
             # Use optimized appmanifest-based scanning (FAST)
-            all_steam_dlls = await scan_steam_fast(steam_path, dll_names)
+            all_steam_dlls = await scan_steam_fast(steam_path, dll_names, scan_index, scheduler, guided)
 
             # Now filter by whitelist
             from .whitelist import check_whitelist_batch
@@ -889,7 +941,7 @@ async def find_all_dlls(progress_callback=None):
     async def scan_ea():
         ea_games = await get_ea_games()
         if ea_games:
-            return await find_dlls(ea_games, "EA Launcher", dll_names)
+            return await find_dlls(ea_games, "EA Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_ubisoft():
@@ -897,38 +949,38 @@ async def find_all_dlls(progress_callback=None):
         get_ubisoft_install_path()  # This will auto-add path if found in registry
         ubisoft_games = await get_ubisoft_games()
         if ubisoft_games:
-            return await find_dlls(ubisoft_games, "Ubisoft Launcher", dll_names)
+            return await find_dlls(ubisoft_games, "Ubisoft Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_epic():
         epic_games = await get_epic_games()
         if epic_games:
-            return await find_dlls(epic_games, "Epic Games Launcher", dll_names)
+            return await find_dlls(epic_games, "Epic Games Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_gog():
         gog_games = await get_gog_games()
         if gog_games:
-            return await find_dlls(gog_games, "GOG Launcher", dll_names)
+            return await find_dlls(gog_games, "GOG Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_battlenet():
         battlenet_games = await get_battlenet_games()
         if battlenet_games:
-            return await find_dlls(battlenet_games, "Battle.net Launcher", dll_names)
+            return await find_dlls(battlenet_games, "Battle.net Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_xbox():
         xbox_games = await get_xbox_games()
         if xbox_games:
-            return await find_dlls(xbox_games, "Xbox Launcher", dll_names)
+            return await find_dlls(xbox_games, "Xbox Launcher", dll_names, scan_index, scheduler)
         return []
 
     async def scan_custom(folder_num):
         custom_folder = await get_custom_folder(folder_num)
         if custom_folder:
             return await find_dlls(
-                custom_folder, f"Custom Folder {folder_num}", dll_names
+                custom_folder, f"Custom Folder {folder_num}", dll_names, scan_index, scheduler
             )
         return []
 
@@ -947,249 +999,90 @@ async def find_all_dlls(progress_callback=None):
         "Custom Folder 4": asyncio.create_task(scan_custom(4)),
     }
 
-    # Wait for all tasks to complete and gather results with progress reporting
+    # Stream each launcher's DLLs into the database as soon as it is done, while
+    # others are still being scanned: game grouping, app ID lookup, version
+    # extraction and the batched DB writes overlap the scan. A DLL reported by
+    # several launchers belongs to the first in launcher order; the pipeline
+    # lets a later-finishing, higher-priority launcher take it over
     completed_count = 0
     total_launchers = len(tasks)
+    recorded_pct = 5
 
-    for launcher_name, task in tasks.items():
-        try:
-            dlls = await task
-            all_dll_paths[launcher_name] = dlls
-            completed_count += 1
-
-            # Calculate progress (5% base + 65% for launchers = 5-70%)
-            progress_pct = int(5 + (completed_count / total_launchers) * 65)
-
-            if progress_callback:
-                await progress_callback(
-                    progress_pct,
-                    100,
-                    f"Scanned {launcher_name}: {len(dlls)} DLLs found"
-                )
-
-            if dlls:
-                logger.info(f"Found {len(dlls)} DLLs in {launcher_name}")
-        except Exception as e:
-            logger.error(f"Error scanning {launcher_name}: {e}")
-            all_dll_paths[launcher_name] = []
-            completed_count += 1
-
-            # Report progress even on error
-            progress_pct = int(5 + (completed_count / total_launchers) * 65)
-            if progress_callback:
-                await progress_callback(
-                    progress_pct,
-                    100,
-                    f"Error scanning {launcher_name}"
-                )
-
-    # Report whitelist filtering phase
-    if progress_callback:
-        await progress_callback(70, 100, "Filtering whitelisted games...")
-
-    # Remove duplicates
-    unique_dlls = set()
-    for launcher in all_dll_paths:
-        all_dll_paths[launcher] = [
-            dll
-            for dll in all_dll_paths[launcher]
-            if str(dll) not in unique_dlls and not unique_dlls.add(str(dll))
-        ]
-
-    # Log summary
-    total_dlls = sum(len(dlls) for dlls in all_dll_paths.values())
-    logger.info(f"Scan complete. Found {total_dlls} total DLLs across all launchers")
-
-    # Record discovered games and DLLs in database using BATCH operations
-    try:
-        from dlss_updater.database import db_manager
-        from dlss_updater.steam_integration import (
-            find_steam_app_id_by_name,
-            detect_steam_app_id_from_manifest
-        )
-        from dlss_updater.utils import extract_game_name
-        from dlss_updater.constants import DLL_TYPE_MAP
-
-        # Report database recording start
+    async def on_batch_recorded(games: int, dlls: int):
         if progress_callback:
-            await progress_callback(75, 100, "Preparing game data...")
-
-        logger.info("Recording scanned games in database (batch mode)...")
-
-        # Phase 1: Group DLLs by game directory
-        all_games_dict = {}
-        for launcher, dll_paths in all_dll_paths.items():
-            games_dict = {}
-            normalized_to_original = {}
-
-            for dll_path in dll_paths:
-                game_dir = find_game_root(Path(dll_path), launcher)
-                game_dir_normalized = str(game_dir.resolve()).lower()
-
-                if game_dir_normalized not in games_dict:
-                    games_dict[game_dir_normalized] = []
-                    normalized_to_original[game_dir_normalized] = str(game_dir)
-
-                games_dict[game_dir_normalized].append(dll_path)
-
-            games_dict_original = {
-                normalized_to_original[norm_path]: dlls
-                for norm_path, dlls in games_dict.items()
-            }
+            await progress_callback(recorded_pct, 100, f"Recorded {games} games, {dlls} DLLs so far...")
+        if on_recorded:
+            await on_recorded(games, dlls)
 
-            all_games_dict[launcher] = games_dict_original
+    pipeline = ScanPipeline(on_batch_recorded, launcher_priority=list(tasks))
+    pipeline.start()
+    launcher_by_task = {task: launcher_name for launcher_name, task in tasks.items()}
 
-        # Phase 1b: Merge games with overlapping paths (handles custom folders)
-        # This catches cases where DLLs are in subdirectories that weren't detected by pattern matching
-        for launcher, games_dict in all_games_dict.items():
-            sorted_paths = sorted(games_dict.keys(), key=len)
-            paths_to_remove = set()
-
-            for i, path1 in enumerate(sorted_paths):
-                if path1 in paths_to_remove:
+    try:
+        pending = set(launcher_by_task)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                launcher_name = launcher_by_task[task]
+                completed_count += 1
+                # 5% base + 85% for launchers; the remainder waits for the last DB batches
+                recorded_pct = int(5 + (completed_count / total_launchers) * 85)
+                try:
+                    all_dll_paths[launcher_name] = task.result()
+                except Exception as e:
+                    logger.error(f"Error scanning {launcher_name}: {e}")
+                    all_dll_paths[launcher_name] = []
+                    if progress_callback:
+                        await progress_callback(recorded_pct, 100, f"Error scanning {launcher_name}")
                     continue
-                path1_lower = path1.lower()
-
-                for path2 in sorted_paths[i + 1:]:
-                    if path2 in paths_to_remove:
-                        continue
-                    path2_lower = path2.lower()
-
-                    # Check if path2 is under path1 (path1 is parent)
-                    if path2_lower.startswith(path1_lower + os.sep):
-                        games_dict[path1].extend(games_dict[path2])
-                        paths_to_remove.add(path2)
-                        logger.debug(f"Merged subdir {path2} into {path1}")
-
-            for path in paths_to_remove:
-                del games_dict[path]
-
-            if paths_to_remove:
-                logger.info(f"Merged {len(paths_to_remove)} duplicate game entries for {launcher}")
-
-        # Phase 2: Prepare game records with Steam app IDs (parallel lookup)
-        if progress_callback:
-            await progress_callback(78, 100, "Looking up Steam app IDs...")
-
-        games_to_insert = []
-        game_dll_mapping = {}  # Maps game path to list of DLL paths
-
-        async def prepare_game_data(launcher: str, game_dir_str: str, game_dlls: list):
-            game_dir = Path(game_dir_str)
-            game_name = game_dir.name  # Use directory name directly instead of parsing DLL path
-
-            # Try to find Steam app ID
-            app_id = None
-            if launcher == "Steam":
-                app_id = await detect_steam_app_id_from_manifest(game_dir)
-
-            if app_id is None:
-                app_id = await find_steam_app_id_by_name(game_name)
-
-            return {
-                'name': game_name,
-                'path': game_dir_str,
-                'launcher': launcher,
-                'steam_app_id': app_id,
-                'dlls': game_dlls  # Keep track of DLLs for this game
-            }
-
-        # Gather all game preparation tasks
-        prepare_tasks = []
-        for launcher, games_dict in all_games_dict.items():
-            for game_dir_str, game_dlls in games_dict.items():
-                prepare_tasks.append(prepare_game_data(launcher, game_dir_str, game_dlls))
-
-        # Execute all Steam ID lookups in parallel
-        prepared_games = await asyncio.gather(*prepare_tasks, return_exceptions=True)
-
-        # Filter out exceptions and extract game data
-        for result in prepared_games:
-            if isinstance(result, Exception):
-                logger.error(f"Error preparing game data: {result}")
-                continue
-            game_dll_mapping[result['path']] = result.pop('dlls')
-            games_to_insert.append(result)
 
+                if progress_callback:
+                    await progress_callback(
+                        recorded_pct,
+                        100,
+                        f"Scanned {launcher_name}: {len(all_dll_paths[launcher_name])} DLLs found"
+                    )
+
+                dlls = await pipeline.submit(launcher_name, all_dll_paths[launcher_name])
+                if dlls:
+                    logger.info(f"Found {len(dlls)} DLLs in {launcher_name}")
+
+        # Remove duplicates (a DLL belongs to the first launcher, in order, that reports it)
+        for launcher_name in tasks:
+            all_dll_paths[launcher_name] = list(dict.fromkeys(
+                dll for dll in all_dll_paths[launcher_name] if pipeline.owner(dll) == launcher_name
+            ))
+
+        if scan_index is not None:
+            await asyncio.to_thread(scan_index.save)
+        if guided is not None:
+            await guided.save()
+
+        # Log summary
+        total_dlls = sum(len(dlls) for dlls in all_dll_paths.values())
+        logger.info(f"Scan complete. Found {total_dlls} total DLLs across all launchers")
+        log_limiter_stats("scan")
+        log_executor_stats("scan")
+
+        recorded_pct = 92
         if progress_callback:
-            await progress_callback(82, 100, f"Batch inserting {len(games_to_insert)} games...")
-
-        # Phase 3: Batch upsert all games
-        games_result = await db_manager.batch_upsert_games(games_to_insert)
-        recorded_games = len(games_result)
-
-        if progress_callback:
-            await progress_callback(88, 100, "Extracting DLL versions...")
-
-        # Phase 4: Prepare DLL records with version extraction (parallel)
-        from .updater import get_dll_version
+            await progress_callback(recorded_pct, 100, "Recording remaining games...")
+        stats = await pipeline.close()
+    except BaseException:
+        pipeline.cancel()
+        for task in tasks.values():
+            task.cancel()
+        raise
 
-        dlls_to_insert = []
-        dlls_with_versions = 0
-
-        async def extract_dll_info(game_path: str, dll_path: str, game_id: int):
-            dll_filename = Path(dll_path).name
-            dll_type = DLL_TYPE_MAP.get(dll_filename.lower(), "Unknown")
-
-            # Run version extraction in thread pool
-            dll_version = await asyncio.to_thread(get_dll_version, dll_path)
-
-            return {
-                'game_id': game_id,
-                'dll_type': dll_type,
-                'dll_filename': dll_filename,
-                'dll_path': str(dll_path),
-                'current_version': dll_version,
-            }
+    logger.info(f"Database recording complete: {stats.games} games, {stats.dlls} DLLs")
+    logger.info(f"Version extraction: {stats.dlls_with_versions}/{stats.dlls} DLLs have valid versions")
 
-        # Gather all DLL extraction tasks
-        dll_tasks = []
-        for game_path, game in games_result.items():
-            if game_path in game_dll_mapping:
-                for dll_path in game_dll_mapping[game_path]:
-                    dll_tasks.append(extract_dll_info(game_path, dll_path, game.id))
+    if stats.dlls_with_versions == 0 and stats.dlls > 0:
+        logger.warning("No DLL versions extracted! Check get_dll_version() function")
 
-        # Execute all DLL version extractions in parallel - CPU-bound PE parsing
-        semaphore = asyncio.Semaphore(Concurrency.IO_HEAVY)  # Scale with CPU for PE parsing
-
-        async def extract_with_limit(task):
-            async with semaphore:
-                return await task
-
-        dll_results = await asyncio.gather(
-            *[extract_with_limit(t) for t in dll_tasks],
-            return_exceptions=True
-        )
-
-        # Collect DLL data
-        for result in dll_results:
-            if isinstance(result, Exception):
-                logger.error(f"Error extracting DLL info: {result}")
-                continue
-            dlls_to_insert.append(result)
-            if result.get('current_version'):
-                dlls_with_versions += 1
-
-        if progress_callback:
-            await progress_callback(95, 100, f"Batch inserting {len(dlls_to_insert)} DLLs...")
-
-        # Phase 5: Batch upsert all DLLs
-        recorded_dlls = await db_manager.batch_upsert_dlls(dlls_to_insert)
-
-        logger.info(f"Database recording complete: {recorded_games} games, {recorded_dlls} DLLs")
-        logger.info(f"Version extraction: {dlls_with_versions}/{recorded_dlls} DLLs have valid versions")
-
-        if dlls_with_versions == 0 and recorded_dlls > 0:
-            logger.warning("No DLL versions extracted! Check get_dll_version() function")
-
-        # Report completion
-        if progress_callback:
-            await progress_callback(100, 100, f"Scan complete: {recorded_games} games, {recorded_dlls} DLLs")
-
-    except Exception as e:
-        logger.error(f"Error recording games in database: {e}", exc_info=True)
-        if progress_callback:
-            await progress_callback(100, 100, "Scan complete (database recording failed)")
+    # Report completion
+    if progress_callback:
+        await progress_callback(100, 100, f"Scan complete: {stats.games} games, {stats.dlls} DLLs")
 
     # On Linux, collect any skipped paths due to permissions
     if IS_LINUX:
@@ -1241,8 +1134,11 @@ def scan_directory_for_dlls(directory, dll_names):
     # Pre-compute lowercase DLL names for O(1) lookup
     dll_names_lower = frozenset(d.lower() for d in dll_names) if not isinstance(dll_names, frozenset) else dll_names
 
-    # Use parallel scandir for better performance (especially with GIL disabled)
-    return _parallel_scandir_walk(str(directory), dll_names_lower)
+    # Use parallel scandir for better performance (especially with GIL disabled),
+    # with as many walkers as the directory's device can take
+    return _parallel_scandir_walk(
+        str(directory), dll_names_lower, get_path_budget(directory).walk_workers
+    )
 
 
 def scan_steam_libraries_parallel(library_paths, dll_names, max_workers=None):
@@ -1252,9 +1148,20 @@ def scan_steam_libraries_parallel(library_paths, dll_names, max_workers=None):
     logger.info(f"Scanning {len(library_paths)} Steam libraries in parallel (workers={max_workers})")
     all_dlls = []
 
+    # Libraries on the same device take turns according to its budget
+    device_slots: dict[str, threading.Semaphore] = {}
+    for lib_path in library_paths:
+        key = device_key(lib_path)
+        if key not in device_slots:
+            device_slots[key] = threading.Semaphore(get_device_budget(key).concurrent_roots)
+
+    def scan_on_device(lib_path):
+        with device_slots[device_key(lib_path)]:
+            return scan_directory_for_dlls(lib_path, dll_names)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_library = {
-            executor.submit(scan_directory_for_dlls, lib_path, dll_names): lib_path
+            executor.submit(scan_on_device, lib_path): lib_path
             for lib_path in library_paths
         }
 
@@ -24,6 +24,8 @@ Library Versions (December 2025):
 """
 
 import asyncio
+import bisect
+import re
 import threading
 import time
 from collections import OrderedDict
@@ -43,6 +45,9 @@ logger = setup_logger()
 _search_cache_lock = threading.Lock()
 _history_lock = threading.Lock()
 
+# Separators used when tokenizing game names into words
+_TOKEN_SPLIT_RE = re.compile(r'[\s\-_:]+')
+
 
 # =============================================================================
 # Data Models
@@ -99,29 +104,44 @@ class GameSearchIndex:
 
     Uses a combination of:
     - Normalized name hash map for O(1) exact matches
-    - Prefix tree (trie) for prefix matching
-    - Inverted index for word-based substring matching
+    - Prefix postings (first 1-5 chars) for prefix matching
+    - Inverted word index plus a sorted vocabulary for word-prefix matching
+    - Precomputed normalized-name array for the substring fallback
+
+    Postings hold positions into _all_games, and each launcher's games occupy
+    a contiguous range of positions, so launcher filtering is a range check.
 
     Thread-safe for free-threaded Python 3.14.
     """
 
+    # Prefix postings are built for the first 1..PREFIX_INDEX_LENGTH characters
+    PREFIX_INDEX_LENGTH = 5
+
     def __init__(self):
         self._lock = threading.Lock()
 
-        # Hash map: normalized_name -> Game
-        self._exact_index: dict[str, Game] = {}
+        # Hash map: normalized_name -> positions of games with that name
+        self._exact_index: dict[str, list[int]] = {}
 
-        # Prefix index: prefix -> list of (normalized_name, Game)
-        self._prefix_index: dict[str, list[tuple[str, Game]]] = {}
+        # Prefix index: prefix -> positions of games whose name starts with it
+        self._prefix_index: dict[str, list[int]] = {}
 
-        # Word index: word -> list of (normalized_name, Game)
-        self._word_index: dict[str, list[tuple[str, Game]]] = {}
+        # Word index: word -> positions of games containing that word
+        self._word_index: dict[str, list[int]] = {}
+
+        # Sorted word vocabulary for bisecting word-prefix ranges
+        self._sorted_words: list[str] = []
 
         # Launcher filter index: launcher -> list of Game
         self._launcher_index: dict[str, list[Game]] = {}
 
-        # All games list for full iteration when needed
+        # Launcher -> range of positions in _all_games
+        self._launcher_ranges: dict[str, range] = {}
+
+        # All games list plus per-game precomputed search keys (same positions)
         self._all_games: list[Game] = []
+        self._normalized_names: list[str] = []
+        self._name_tokens: list[list[str]] = []
 
         self._is_built = False
 
@@ -132,10 +152,21 @@ class GameSearchIndex:
     def _tokenize(self, text: str) -> list[str]:
         """Split text into searchable tokens."""
         # Split on common separators
-        import re
-        tokens = re.split(r'[\s\-_:]+', text.lower())
+        tokens = _TOKEN_SPLIT_RE.split(text.lower())
         return [t for t in tokens if len(t) >= 2]  # Min 2 chars
 
+    def _clear_indexes(self):
+        """Reset all index structures (caller holds the lock)."""
+        self._exact_index.clear()
+        self._prefix_index.clear()
+        self._word_index.clear()
+        self._sorted_words.clear()
+        self._launcher_index.clear()
+        self._launcher_ranges.clear()
+        self._all_games.clear()
+        self._normalized_names.clear()
+        self._name_tokens.clear()
+
     def build(self, games_by_launcher: dict[str, list[Game]]):
         """
         Build the search index from games data.
@@ -146,39 +177,54 @@ class GameSearchIndex:
             games_by_launcher: Games grouped by launcher from database
         """
         with self._lock:
-            # Clear existing indexes
-            self._exact_index.clear()
-            self._prefix_index.clear()
-            self._word_index.clear()
-            self._launcher_index.clear()
-            self._all_games.clear()
+            self._clear_indexes()
 
             for launcher, games in games_by_launcher.items():
                 self._launcher_index[launcher] = games
+                start = len(self._all_games)
 
                 for game in games:
-                    self._all_games.append(game)
+                    position = len(self._all_games)
                     normalized = self._normalize(game.name)
+                    tokens = self._tokenize(game.name)
+
+                    self._all_games.append(game)
+                    self._normalized_names.append(normalized)
+                    self._name_tokens.append(tokens)
 
                     # Exact match index
-                    self._exact_index[normalized] = game
+                    self._exact_index.setdefault(normalized, []).append(position)
 
                     # Prefix index (first 1-5 chars)
-                    for i in range(1, min(6, len(normalized) + 1)):
-                        prefix = normalized[:i]
-                        if prefix not in self._prefix_index:
-                            self._prefix_index[prefix] = []
-                        self._prefix_index[prefix].append((normalized, game))
-
-                    # Word index
-                    for word in self._tokenize(game.name):
-                        if word not in self._word_index:
-                            self._word_index[word] = []
-                        self._word_index[word].append((normalized, game))
+                    for i in range(1, min(self.PREFIX_INDEX_LENGTH, len(normalized)) + 1):
+                        self._prefix_index.setdefault(normalized[:i], []).append(position)
+
+                    # Word index (each game listed once per distinct word)
+                    for word in dict.fromkeys(tokens):
+                        self._word_index.setdefault(word, []).append(position)
+
+                self._launcher_ranges[launcher] = range(start, len(self._all_games))
 
+            self._sorted_words = sorted(self._word_index)
             self._is_built = True
             logger.info(f"Search index built: {len(self._all_games)} games indexed")
 
+    def _words_with_prefix(self, prefix: str) -> list[str]:
+        """Return indexed words starting with prefix (caller holds the lock)."""
+        words = self._sorted_words
+        start = bisect.bisect_left(words, prefix)
+        end = start
+        while end < len(words) and words[end].startswith(prefix):
+            end += 1
+        return words[start:end]
+
+    def _word_prefix_postings(self, prefix: str) -> set[int]:
+        """Positions of games with any word starting with prefix (caller holds the lock)."""
+        positions: set[int] = set()
+        for word in self._words_with_prefix(prefix):
+            positions.update(self._word_index[word])
+        return positions
+
     def search(
         self,
         query: str,
@@ -189,10 +235,14 @@ class GameSearchIndex:
         Search for games matching query.
 
         Search strategy (in order of priority):
-        1. Exact match (score 100)
-        2. Prefix match (score 90-99 based on length)
-        3. Word match (score 70-89 based on word position)
-        4. Substring match (score 50-69)
+        1. Exact match (score 100) - exact index lookup
+        2. Prefix match (score 90-99 based on length) - prefix postings
+        3. Word match (score 70-89 based on word position) - word postings
+        4. Substring match (score 50-69) - scan of precomputed names
+        5. Multi-word match (score 40+) - intersection of word postings
+
+        The substring scan is the only linear step and is skipped when the
+        indexed tiers already fill the limit, since its scores rank below them.
 
         Args:
             query: Search query string
@@ -207,69 +257,81 @@ class GameSearchIndex:
 
         query_normalized = self._normalize(query)
         query_words = self._tokenize(query)
+        if not query_normalized:
+            return []
 
         results: dict[int, SearchResult] = {}  # game_id -> SearchResult
+        matched: set[int] = set()  # positions already scored
+
+        def add(position: int, score: float, match_type: str):
+            matched.add(position)
+            game = self._all_games[position]
+            if game.id not in results:
+                results[game.id] = SearchResult(game=game, score=score, match_type=match_type)
 
         with self._lock:
             # Filter by launcher if specified
-            candidate_games = (
-                self._launcher_index.get(launcher, [])
-                if launcher else self._all_games
-            )
-
-            for game in candidate_games:
-                game_normalized = self._normalize(game.name)
-                score = 0.0
-                match_type = ""
-
-                # 1. Exact match
-                if game_normalized == query_normalized:
-                    score = 100.0
-                    match_type = "exact"
-
-                # 2. Prefix match
-                elif game_normalized.startswith(query_normalized):
+            if launcher:
+                allowed = self._launcher_ranges.get(launcher)
+                if allowed is None:
+                    return []
+            else:
+                allowed = range(len(self._all_games))
+
+            normalized_names = self._normalized_names
+
+            # 1. Exact match
+            for position in self._exact_index.get(query_normalized, ()):
+                if position in allowed:
+                    add(position, 100.0, "exact")
+
+            # 2. Prefix match (postings are exact up to PREFIX_INDEX_LENGTH chars)
+            prefix_key = query_normalized[:self.PREFIX_INDEX_LENGTH]
+            for position in self._prefix_index.get(prefix_key, ()):
+                if position in matched or position not in allowed:
+                    continue
+                name = normalized_names[position]
+                if name.startswith(query_normalized):
                     # Score based on how much of the name matches
-                    match_ratio = len(query_normalized) / len(game_normalized)
-                    score = 90.0 + (match_ratio * 9.0)  # 90-99
-                    match_type = "prefix"
-
-                # 3. Word match (any word starts with query)
-                elif not match_type:
-                    game_words = self._tokenize(game.name)
-                    for i, word in enumerate(game_words):
-                        if word.startswith(query_normalized):
-                            # Earlier words score higher
-                            position_bonus = max(0, 19 - (i * 5))
-                            score = 70.0 + position_bonus
-                            match_type = "word"
-                            break
-
-                # 4. Substring match
-                if not match_type and query_normalized in game_normalized:
-                    # Score based on position and length ratio
-                    pos = game_normalized.find(query_normalized)
-                    position_score = max(0, 19 - (pos * 2))  # Earlier = better
-                    score = 50.0 + position_score
-                    match_type = "substring"
-
-                # 5. Multi-word match (all query words appear somewhere)
-                if not match_type and len(query_words) > 1:
-                    game_words_set = set(self._tokenize(game.name))
-                    matching_words = sum(
-                        1 for qw in query_words
-                        if any(gw.startswith(qw) for gw in game_words_set)
-                    )
-                    if matching_words == len(query_words):
-                        score = 40.0 + (matching_words * 5)
-                        match_type = "multi_word"
-
-                if score > 0:
-                    results[game.id] = SearchResult(
-                        game=game,
-                        score=score,
-                        match_type=match_type
-                    )
+                    match_ratio = len(query_normalized) / len(name)
+                    add(position, 90.0 + (match_ratio * 9.0), "prefix")  # 90-99
+
+            # 3. Word match (any word starts with query)
+            for position in sorted(self._word_prefix_postings(query_normalized)):
+                if position in matched or position not in allowed:
+                    continue
+                for i, word in enumerate(self._name_tokens[position]):
+                    if word.startswith(query_normalized):
+                        # Earlier words score higher
+                        position_bonus = max(0, 19 - (i * 5))
+                        add(position, 70.0 + position_bonus, "word")
+                        break
+
+            # 4. Substring match - fallback scan, only needed to fill the limit
+            if len(results) < limit:
+                for position in allowed:
+                    if position in matched:
+                        continue
+                    # Score based on position (earlier = better)
+                    pos = normalized_names[position].find(query_normalized)
+                    if pos != -1:
+                        add(position, 50.0 + max(0, 19 - (pos * 2)), "substring")
+
+            # 5. Multi-word match (all query words prefix some game word)
+            if len(query_words) > 1:
+                candidates: set[int] | None = None
+                for query_word in query_words:
+                    postings = self._word_prefix_postings(query_word)
+                    candidates = postings if candidates is None else candidates & postings
+                    if not candidates:
+                        break
+                for position in sorted(candidates or ()):
+                    if position in matched or position not in allowed:
+                        continue
+                    # Substring matches belong to tier 4 even if it was skipped
+                    if query_normalized in normalized_names[position]:
+                        continue
+                    add(position, 40.0 + (len(query_words) * 5), "multi_word")
 
         # Sort by score descending, then by name
         sorted_results = sorted(
@@ -293,11 +355,7 @@ class GameSearchIndex:
     def clear(self):
         """Clear the search index."""
         with self._lock:
-            self._exact_index.clear()
-            self._prefix_index.clear()
-            self._word_index.clear()
-            self._launcher_index.clear()
-            self._all_games.clear()
+            self._clear_indexes()
             self._is_built = False
 
 
@@ -9,21 +9,102 @@ import threading
 import msgspec
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import AsyncIterator
 import aiohttp
 
 from dlss_updater.logger import setup_logger
 from dlss_updater.database import db_manager
+from dlss_updater.http_cache import http_validators
+from dlss_updater.http_client import get_http_session
+from dlss_updater.models import SteamAppRecord, SteamAppListSource, SteamAppListMetadata
 
 logger = setup_logger()
 
-# msgspec decoder for better performance
-_json_decoder = msgspec.json.Decoder()
+# msgspec decoders for better performance
+_app_batch_decoder = msgspec.json.Decoder(list[SteamAppRecord])
+_app_record_decoder = msgspec.json.Decoder(SteamAppRecord)
+_metadata_decoder = msgspec.json.Decoder(SteamAppListMetadata)
+
+# Precompiled patterns for normalize_game_name
+_TRADEMARK_RE = re.compile(r'[™®©]')
+_SPECIAL_CHARS_RE = re.compile(r'[^a-z0-9\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# A flat JSON object; strings are matched whole so braces inside names are ignored
+_JSON_OBJECT_RE = re.compile(rb'\{(?:[^{}"]|"(?:[^"\\]|\\.)*")*\}')
+_JSON_SEPARATOR_RE = re.compile(rb'[\s,]*')
 
 # Thread-safe cache for normalize_game_name (replaces @lru_cache for free-threading)
 _normalize_cache_lock = threading.Lock()
 _normalize_cache: dict = {}
 
 
+class _JsonArraySplitter:
+    """
+    Incrementally split a top-level JSON array of flat objects.
+
+    Network chunks are fed in as they arrive and the raw bytes of every
+    complete object are returned, so the whole document never has to be
+    buffered. Objects and strings may straddle chunk boundaries; nested
+    objects are not supported (the app list entries are flat).
+    """
+
+    # An incomplete object larger than this means the input is not what we expect
+    MAX_PENDING_BYTES = 1024 * 1024
+
+    def __init__(self):
+        self._buffer = b""
+        self._started = False
+        self._closed = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Consume a chunk and return the objects completed by it.
+
+        Raises:
+            ValueError: If the input is not an array of flat objects
+        """
+        buffer = self._buffer + chunk
+        pos = _JSON_SEPARATOR_RE.match(buffer).end() if not self._started else 0
+
+        if not self._started:
+            if pos == len(buffer):
+                self._buffer = b""
+                return []
+            if buffer[pos:pos + 1] != b"[":
+                raise ValueError("Expected a JSON array")
+            self._started = True
+            pos += 1
+
+        objects = []
+        while not self._closed:
+            pos = _JSON_SEPARATOR_RE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            if buffer[pos:pos + 1] == b"]":
+                self._closed = True
+                pos = len(buffer)
+                break
+            match = _JSON_OBJECT_RE.match(buffer, pos)
+            if match is None:
+                break  # Incomplete object, wait for the next chunk
+            objects.append(match.group())
+            pos = match.end()
+
+        self._buffer = buffer[pos:]
+        if len(self._buffer) > self.MAX_PENDING_BYTES:
+            raise ValueError("JSON array element is too large or not a flat object")
+        return objects
+
+    def finish(self):
+        """
+        Raises:
+            ValueError: If the array was not terminated
+        """
+        if not self._closed:
+            raise ValueError("Truncated JSON array")
+
+
 class SteamIntegration:
     """
     Steam integration for fetching game images and app list
@@ -40,6 +121,8 @@ class SteamIntegration:
     CDN_FALLBACK = "https://cdn.akamai.steamstatic.com/steam/apps"
 
     APP_LIST_CACHE_DAYS = 7  # Re-download app list after 7 days
+    APP_LIST_CHUNK_SIZE = 64 * 1024  # Network read size while streaming the app list
+    APP_BATCH_SIZE = 1000  # Apps decoded/normalized/staged per batch
     IMAGE_SEMAPHORE = 5  # Max 5 concurrent image downloads
 
     def __init__(self):
@@ -47,8 +130,10 @@ class SteamIntegration:
         self.image_cache_dir = APP_CONFIG_DIR / "steam_images"
         self.image_cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Local cache file for Steam app list (used for downloading, then stored in DB)
-        self.app_list_cache_file = APP_CONFIG_DIR / "steam_app_list.json"
+        # Small record of the last app list refresh (the list itself lives in the DB)
+        self.app_list_metadata_file = APP_CONFIG_DIR / "steam_app_list_meta.json"
+        # Full JSON copy written by older versions, removed after the next refresh
+        self.legacy_app_list_cache_file = APP_CONFIG_DIR / "steam_app_list.json"
 
         # Database-backed storage replaces in-memory indexes
         # This saves ~20-30 MB RAM by eliminating the 207K-entry dictionaries
@@ -96,10 +181,11 @@ class SteamIntegration:
 
         Checks:
         1. If database is empty, download and populate
-        2. If JSON cache file is stale (>7 days old), re-download and update DB
+        2. If the last refresh is stale (>7 days old), re-check the files with a
+           conditional GET and only re-download if any of them changed
         """
         try:
-            # Check database first - if populated, check if cache file is stale
+            # Check database first - if populated, check if the last refresh is stale
             db_count = await db_manager.get_steam_apps_count()
 
             if db_count == 0:
@@ -107,92 +193,212 @@ class SteamIntegration:
                 logger.info("Steam apps database empty, downloading app list...")
                 await self.download_steam_app_list()
                 self._db_populated = True
-            elif self.app_list_cache_file.exists():
-                # Check file age for staleness
-                file_time = datetime.fromtimestamp(self.app_list_cache_file.stat().st_mtime)
-                age_days = (datetime.now() - file_time).days
-
-                if age_days > self.APP_LIST_CACHE_DAYS:
-                    logger.info(f"Steam app list cache is {age_days} days old, updating...")
-                    await self.download_steam_app_list()
-                else:
-                    logger.info(f"Steam apps database has {db_count} entries (cache age: {age_days} days)")
-                    self._db_populated = True
+                return
+
+            metadata = await asyncio.to_thread(self._load_app_list_metadata)
+            if metadata is not None:
+                fetched_at = metadata.fetched_at
+            elif self.legacy_app_list_cache_file.exists():
+                # Upgraded from a version that tracked refreshes by file mtime
+                fetched_at = datetime.fromtimestamp(self.legacy_app_list_cache_file.stat().st_mtime)
             else:
-                # Database populated but no cache file - create cache file timestamp
+                # Database populated but no refresh record
                 logger.info(f"Steam apps database has {db_count} entries")
                 self._db_populated = True
+                return
+
+            age_days = (datetime.now() - fetched_at).days
+            if age_days > self.APP_LIST_CACHE_DAYS:
+                logger.info(f"Steam app list cache is {age_days} days old, checking for updates...")
+                await self.download_steam_app_list(conditional=True)
+            else:
+                logger.info(f"Steam apps database has {db_count} entries (cache age: {age_days} days)")
+                self._db_populated = True
 
         except Exception as e:
             logger.error(f"Error checking Steam app list: {e}", exc_info=True)
 
-    async def download_steam_app_list(self):
+    def _load_app_list_metadata(self) -> SteamAppListMetadata | None:
+        """Load the last refresh record, or None if missing/unreadable."""
+        try:
+            return _metadata_decoder.decode(self.app_list_metadata_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, msgspec.DecodeError, msgspec.ValidationError) as e:
+            logger.warning(f"Ignoring unreadable Steam app list metadata: {e}")
+            return None
+
+    def _save_app_list_metadata(self, metadata: SteamAppListMetadata):
+        """Write the refresh record and drop the legacy full JSON cache."""
+        self.app_list_metadata_file.write_bytes(msgspec.json.encode(metadata))
+        # Pre-metadata versions kept a full copy of the app list (tens of MB)
+        self.legacy_app_list_cache_file.unlink(missing_ok=True)
+
+    @classmethod
+    def _prepare_app_batch(cls, raw_objects: list[bytes]) -> list[tuple[int, str, str]]:
         """
-        Download full Steam app list and store in database with FTS5 indexing.
+        Decode and normalize one batch of raw app list objects (runs in thread).
 
-        Downloads from GitHub repository, normalizes names, and bulk-inserts
-        into the steam_apps table with FTS5 triggers handling the search index.
+        Returns:
+            List of (appid, name, name_normalized) tuples for apps with a name
         """
         try:
-            logger.info("Downloading Steam app list from GitHub repository...")
-            all_apps = []
+            records = _app_batch_decoder.decode(b"[" + b",".join(raw_objects) + b"]")
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            # Decode individually so one malformed entry only loses itself
+            records = []
+            for raw in raw_objects:
+                try:
+                    records.append(_app_record_decoder.decode(raw))
+                except (msgspec.DecodeError, msgspec.ValidationError):
+                    continue
 
-            async with aiohttp.ClientSession() as session:
-                # Download all category files
-                for url in self.STEAM_APP_LIST_URLS:
-                    try:
-                        logger.info(f"Fetching {url.split('/')[-1]}...")
-                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                            if response.status != 200:
-                                logger.warning(f"Failed to download {url}: HTTP {response.status}")
-                                continue
+        db_apps = []
+        for record in records:
+            if not record.name:
+                continue
+            # Normalize: lowercase and remove spaces for exact matching
+            # (uncached - each of the ~200K names is only seen once)
+            name_normalized = cls._normalize_name(record.name).replace(' ', '')
+            db_apps.append((record.appid, record.name, name_normalized))
+        return db_apps
+
+    async def _stream_app_list(
+        self,
+        session: aiohttp.ClientSession,
+        source: SteamAppListSource,
+    ) -> AsyncIterator[list[tuple[int, str, str]]]:
+        """
+        Stream one app list file as normalized batches of APP_BATCH_SIZE apps.
 
-                            # Read raw bytes and decode with msgspec (GitHub returns text/plain MIME type)
-                            content = await response.read()
-                            apps = _json_decoder.decode(content)
+        Only the current network chunk and one batch are held in memory.
+        Fills in the source's validators and app count as it goes.
+        """
+        name = source.url.split('/')[-1]
+        logger.info(f"Fetching {name}...")
 
-                            # GitHub repo format: array of {appid, name, last_modified, price_change_number}
-                            if isinstance(apps, list):
-                                all_apps.extend(apps)
-                                logger.info(f"Downloaded {len(apps)} apps from {url.split('/')[-1]}")
-                            else:
-                                logger.warning(f"Unexpected format from {url}")
+        async with session.get(source.url, timeout=aiohttp.ClientTimeout(total=60)) as response:
+            if response.status != 200:
+                logger.warning(f"Failed to download {source.url}: HTTP {response.status}")
+                return
 
-                    except TimeoutError:
-                        logger.warning(f"Timeout downloading {url}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Error downloading {url}: {e}")
-                        continue
+            source.etag = response.headers.get('ETag')
+            source.last_modified = response.headers.get('Last-Modified')
+
+            # GitHub repo format: array of {appid, name, last_modified, price_change_number}
+            splitter = _JsonArraySplitter()
+            pending: list[bytes] = []
+            async for chunk in response.content.iter_chunked(self.APP_LIST_CHUNK_SIZE):
+                pending.extend(splitter.feed(chunk))
+                while len(pending) >= self.APP_BATCH_SIZE:
+                    batch = await asyncio.to_thread(
+                        self._prepare_app_batch, pending[:self.APP_BATCH_SIZE]
+                    )
+                    del pending[:self.APP_BATCH_SIZE]
+                    source.app_count += len(batch)
+                    yield batch
+
+            splitter.finish()
+            if pending:
+                batch = await asyncio.to_thread(self._prepare_app_batch, pending)
+                source.app_count += len(batch)
+                yield batch
+
+        logger.info(f"Downloaded {source.app_count} apps from {name}")
+
+    async def _app_list_unchanged(self, session: aiohttp.ClientSession) -> bool:
+        """
+        Ask every app list file whether it changed since the last refresh.
 
-            if not all_apps:
-                logger.error("Failed to download any Steam app data")
+        steam_apps is rebuilt from all files together, so the download can only
+        be skipped when every file answers 304 Not Modified.
+        """
+        async def not_modified(url: str) -> bool:
+            headers = await asyncio.to_thread(http_validators.request_headers, url)
+            if not headers:
+                return False
+            async with session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                # A 200 body is not read here; the refresh streams it afresh
+                return response.status == 304
+
+        results = await asyncio.gather(
+            *(not_modified(url) for url in self.STEAM_APP_LIST_URLS),
+            return_exceptions=True,
+        )
+        return all(result is True for result in results)
+
+    async def _touch_app_list(self):
+        """Record that the stored app list was confirmed current."""
+        for url in self.STEAM_APP_LIST_URLS:
+            await asyncio.to_thread(http_validators.touch, url)
+
+        metadata = await asyncio.to_thread(self._load_app_list_metadata)
+        if metadata is None:
+            metadata = SteamAppListMetadata(
+                fetched_at=datetime.now(),
+                app_count=await db_manager.get_steam_apps_count(),
+            )
+        metadata.fetched_at = datetime.now()
+        await asyncio.to_thread(self._save_app_list_metadata, metadata)
+
+    async def download_steam_app_list(self, conditional: bool = False):
+        """
+        Download full Steam app list and store in database with FTS5 indexing.
+
+        Each category file from the GitHub repository is streamed and decoded
+        incrementally; normalized batches are staged and swapped into the
+        steam_apps table in one transaction, so peak memory stays flat
+        regardless of catalogue size. A small metadata record (validators and
+        counts) is written for staleness tracking.
+
+        Args:
+            conditional: Skip the download if every file is unchanged since the
+                last refresh (only valid while the database holds that list)
+        """
+        try:
+            session = await get_http_session()
+            if conditional and await self._app_list_unchanged(session):
+                await self._touch_app_list()
+                self._db_populated = True
+                logger.info("[HTTP CACHE] Steam app list not modified, keeping database copy")
                 return
 
-            logger.info(f"Total: {len(all_apps)} Steam apps, processing for database...")
+            logger.info("Downloading Steam app list from GitHub repository...")
+            sources = [SteamAppListSource(url=url) for url in self.STEAM_APP_LIST_URLS]
+            completed: set[str] = set()
 
-            # Prepare data for database: (appid, name, name_normalized)
-            # Normalize names by lowercasing and removing spaces for exact matching
-            db_apps = []
-            for app in all_apps:
-                if not app.get('name'):
-                    continue
+            async def all_batches():
+                for source in sources:
+                    try:
+                        async for batch in self._stream_app_list(session, source):
+                            yield batch
+                        completed.add(source.url)
+                    except TimeoutError:
+                        logger.warning(f"Timeout downloading {source.url}")
+                    except (aiohttp.ClientError, ValueError) as e:
+                        logger.warning(f"Error downloading {source.url}: {e}")
 
-                appid = app['appid']
-                name = app['name']
-                # Normalize: lowercase and remove spaces for exact matching
-                name_normalized = self.normalize_game_name(name).replace(' ', '')
-                db_apps.append((appid, name, name_normalized))
+            count = await db_manager.replace_steam_apps(all_batches())
 
-            logger.info(f"Inserting {len(db_apps)} apps into database with FTS5 indexing...")
+            if not count:
+                logger.error("Failed to download any Steam app data")
+                return
 
-            # Clear existing data and insert fresh
-            await db_manager.clear_steam_apps()
-            count = await db_manager.upsert_steam_apps(db_apps)
+            # Only files stored in full may be answered with 304 next time
+            for source in sources:
+                if source.url in completed and source.app_count:
+                    await asyncio.to_thread(http_validators.record, source.url, source.etag, source.last_modified)
+                else:
+                    await asyncio.to_thread(http_validators.forget, source.url)
 
-            # Save to local cache file for timestamp tracking (smaller subset)
-            cache_data = msgspec.json.encode(all_apps)
-            await asyncio.to_thread(self.app_list_cache_file.write_bytes, cache_data)
+            metadata = SteamAppListMetadata(
+                fetched_at=datetime.now(),
+                app_count=count,
+                sources=sources,
+            )
+            await asyncio.to_thread(self._save_app_list_metadata, metadata)
 
             self._db_populated = True
             logger.info(f"Steam app list saved to database ({count} apps with FTS5 index)")
@@ -200,6 +406,24 @@ class SteamIntegration:
         except Exception as e:
             logger.error(f"Error downloading Steam app list: {e}", exc_info=True)
 
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """Uncached core of normalize_game_name()."""
+        normalized = name.lower().strip()
+
+        # Remove trademark symbols
+        normalized = _TRADEMARK_RE.sub('', normalized)
+
+        # Remove "The" prefix
+        if normalized.startswith('the '):
+            normalized = normalized[4:]
+
+        # Remove special characters except spaces and alphanumeric
+        normalized = _SPECIAL_CHARS_RE.sub('', normalized)
+
+        # Collapse multiple spaces
+        return _WHITESPACE_RE.sub(' ', normalized).strip()
+
     @staticmethod
     def normalize_game_name(name: str) -> str:
         """
@@ -218,20 +442,7 @@ class SteamIntegration:
                 return _normalize_cache[name]
 
         # Compute normalized name
-        normalized = name.lower().strip()
-
-        # Remove trademark symbols
-        normalized = re.sub(r'[™®©]', '', normalized)
-
-        # Remove "The" prefix
-        if normalized.startswith('the '):
-            normalized = normalized[4:]
-
-        # Remove special characters except spaces and alphanumeric
-        normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
-
-        # Collapse multiple spaces
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = SteamIntegration._normalize_name(name)
 
         # Store in cache with size limit (thread-safe)
         with _normalize_cache_lock:
@@ -359,7 +570,7 @@ class SteamIntegration:
             logger.error(f"Error detecting Steam app ID from manifest for {game_dir}: {e}", exc_info=True)
             return None
 
-    async def fetch_steam_header_image(self, app_id: int) -> Path | None:
+    async def fetch_steam_header_image(self, app_id: int, cache_checked: bool = False) -> Path | None:
         """
         Fetch Steam game header image and save as optimized WebP thumbnail.
 
@@ -371,24 +582,27 @@ class SteamIntegration:
 
         Args:
             app_id: Steam app ID
+            cache_checked: Caller already resolved the cache row (e.g. via
+                batch_get_image_cache_status()) and found no usable image
 
         Returns:
             Path to cached WebP thumbnail file, or None if failed
         """
         try:
-            # Check if already cached (async DB query)
-            cached_path = await db_manager.get_cached_image_path(app_id)
-            if cached_path:
-                cache_file = Path(cached_path)
-                # File exists check is fast enough to not need async
-                if cache_file.exists():
-                    logger.debug(f"Using cached image for app {app_id}")
-                    return cache_file
-
-            # Check if previously failed - skip immediately (async DB query)
-            if await db_manager.is_image_fetch_failed(app_id):
-                logger.debug(f"Skipping image fetch for app {app_id} - previously failed")
-                return None
+            if not cache_checked:
+                # Check if already cached (async DB query)
+                cached_path = await db_manager.get_cached_image_path(app_id)
+                if cached_path:
+                    cache_file = Path(cached_path)
+                    # File exists check is fast enough to not need async
+                    if cache_file.exists():
+                        logger.debug(f"Using cached image for app {app_id}")
+                        return cache_file
+
+                # Check if previously failed - skip immediately (async DB query)
+                if await db_manager.is_image_fetch_failed(app_id):
+                    logger.debug(f"Skipping image fetch for app {app_id} - previously failed")
+                    return None
 
             # Use semaphore to limit concurrent downloads
             async with self.semaphore:
@@ -401,34 +615,35 @@ class SteamIntegration:
                     f"{self.CDN_FALLBACK}/{app_id}/header.jpg"
                 ]
 
-                async with aiohttp.ClientSession() as session:
-                    for url in urls:
-                        try:
-                            # Async network request
-                            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                                if response.status == 200:
-                                    raw_data = await response.read()
+                # Shared pooled session - keep-alive connections to each CDN are reused
+                session = await get_http_session()
+                for url in urls:
+                    try:
+                        # Async network request
+                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                            if response.status == 200:
+                                raw_data = await response.read()
 
-                                    # Create and save WebP thumbnail (async CPU + file I/O)
-                                    from .image_optimizer import save_thumbnail
-                                    await save_thumbnail(raw_data, cache_file)
+                                # Create and save WebP thumbnail (async CPU + file I/O)
+                                from .image_optimizer import save_thumbnail
+                                await save_thumbnail(raw_data, cache_file)
 
-                                    # Record in database (async DB write)
-                                    await db_manager.cache_steam_image(app_id, str(cache_file))
+                                # Record in database (async DB write)
+                                await db_manager.cache_steam_image(app_id, str(cache_file))
 
-                                    logger.info(f"Fetched and cached thumbnail for Steam app {app_id}")
-                                    return cache_file
+                                logger.info(f"Fetched and cached thumbnail for Steam app {app_id}")
+                                return cache_file
 
-                                elif response.status == 404:
-                                    logger.debug(f"Image not found (404) for app {app_id} at {url}")
-                                    continue
+                            elif response.status == 404:
+                                logger.debug(f"Image not found (404) for app {app_id} at {url}")
+                                continue
 
-                        except TimeoutError:
-                            logger.debug(f"Timeout fetching image from {url}")
-                            continue
-                        except Exception as e:
-                            logger.debug(f"Error fetching from {url}: {e}")
-                            continue
+                    except TimeoutError:
+                        logger.debug(f"Timeout fetching image from {url}")
+                        continue
+                    except Exception as e:
+                        logger.debug(f"Error fetching from {url}: {e}")
+                        continue
 
                 # All URLs failed - expected for games without images
                 logger.debug(f"Failed to fetch image for Steam app {app_id} from all CDNs")
@@ -475,9 +690,9 @@ async def detect_steam_app_id_from_manifest(game_dir: Path) -> int | None:
     return await steam_integration.detect_steam_app_id_from_manifest(game_dir)
 
 
-async def fetch_steam_image(app_id: int) -> Path | None:
+async def fetch_steam_image(app_id: int, cache_checked: bool = False) -> Path | None:
     """Fetch Steam header image"""
-    return await steam_integration.fetch_steam_header_image(app_id)
+    return await steam_integration.fetch_steam_header_image(app_id, cache_checked)
 
 
 async def migrate_image_cache_if_needed() -> bool:
@@ -2,11 +2,14 @@
 Task Registry for graceful shutdown management.
 
 Thread-safe for Python 3.14 free-threaded interpreter.
-Tracks background tasks and cancels them during application shutdown.
+Tracks background tasks and cancels them during application shutdown,
+then runs registered shutdown hooks (e.g. closing the shared HTTP session).
 """
 
 import asyncio
+import inspect
 import threading
+from typing import Callable
 from dlss_updater.logger import setup_logger
 
 logger = setup_logger()
@@ -14,6 +17,7 @@ logger = setup_logger()
 # Thread-safe lock for task registry (Python 3.14 free-threading)
 _registry_lock = threading.Lock()
 _background_tasks: list[asyncio.Task] = []
+_shutdown_hooks: dict[str, Callable] = {}
 _shutdown_in_progress = False
 
 
@@ -39,8 +43,39 @@ def register_task(task: asyncio.Task, name: str = "") -> asyncio.Task:
     return task
 
 
+def register_shutdown_hook(name: str, hook: Callable) -> None:
+    """Register a cleanup callable to run after background tasks are cancelled.
+
+    Hooks run from cancel_all_tasks() in reverse registration order, so
+    resources created later are released first. Registering the same name
+    again replaces the previous hook.
+
+    Args:
+        name: Unique hook name (for logging and de-duplication)
+        hook: Sync function or coroutine function taking no arguments
+    """
+    with _registry_lock:
+        _shutdown_hooks.pop(name, None)
+        _shutdown_hooks[name] = hook
+
+
+async def _run_shutdown_hooks():
+    """Run registered shutdown hooks, logging (not raising) failures."""
+    with _registry_lock:
+        hooks = list(_shutdown_hooks.items())
+
+    for name, hook in reversed(hooks):
+        try:
+            result = hook()
+            if inspect.isawaitable(result):
+                await result
+            logger.debug(f"Shutdown hook completed: {name}")
+        except Exception as e:
+            logger.warning(f"Shutdown hook '{name}' failed: {e}")
+
+
 async def cancel_all_tasks(timeout: float = 3.0) -> int:
-    """Cancel all registered background tasks.
+    """Cancel all registered background tasks, then run shutdown hooks.
 
     Args:
         timeout: Maximum time to wait for task cancellation
@@ -57,6 +92,7 @@ async def cancel_all_tasks(timeout: float = 3.0) -> int:
 
     if not tasks:
         logger.debug("No background tasks to cancel")
+        await _run_shutdown_hooks()
         return 0
 
     logger.info(f"Cancelling {len(tasks)} background tasks...")
@@ -77,4 +113,7 @@ async def cancel_all_tasks(timeout: float = 3.0) -> int:
 
     cancelled = sum(1 for t in tasks if t.cancelled())
     logger.info(f"Cancelled {cancelled}/{len(tasks)} background tasks")
+
+    # Release shared resources once nothing is using them any more
+    await _run_shutdown_hooks()
     return cancelled
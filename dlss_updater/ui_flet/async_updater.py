@@ -27,13 +27,16 @@ class AsyncUpdateCoordinator:
 
     async def scan_for_games(
         self,
-        progress_callback: Callable[[UpdateProgress], None] | None = None
+        progress_callback: Callable[[UpdateProgress], None] | None = None,
+        on_recorded: Callable[[int, int], Any] | None = None
     ) -> dict[str, list]:
         """
         Scan all configured launchers for games with DLLs
 
         Args:
             progress_callback: Optional callback for progress updates
+            on_recorded: Optional async callback(games, dlls) after each batch of
+                games is written to the database during the scan
 
         Returns:
             Dictionary of launcher -> list of DLL paths
@@ -60,7 +63,7 @@ class AsyncUpdateCoordinator:
                     ))
 
             # find_all_dlls is already async and now accepts progress_callback
-            dll_dict = await find_all_dlls(progress_callback=scanner_progress_wrapper)
+            dll_dict = await find_all_dlls(progress_callback=scanner_progress_wrapper, on_recorded=on_recorded)
 
             # Count total games found
             total_games = sum(len(dlls) for dlls in dll_dict.values())
@@ -450,8 +450,14 @@ class GameCard(ft.Card):
         if self.on_restore_callback:
             self.on_restore_callback(self.game, group)
 
-    async def load_image(self):
-        """Async load Steam image with fade-in animation"""
+    async def load_image(self, image_cache: dict[int, tuple[str | None, bool]] | None = None):
+        """Async load Steam image with fade-in animation
+
+        Args:
+            image_cache: Optional prefetched result of
+                db_manager.batch_get_image_cache_status() covering this game;
+                avoids two database queries per card
+        """
         # Prevent duplicate image loads
         if self._image_loaded:
             return
@@ -461,10 +467,17 @@ class GameCard(ft.Card):
             return
 
         try:
-            from dlss_updater.database import db_manager
+            if image_cache is not None:
+                # Prefetched by the games view (one query per launcher)
+                cached_path, fetch_failed = image_cache.get(self.game.steam_app_id, (None, False))
+                if fetch_failed:
+                    self.logger.debug(f"Skipping image for {self.game.name} - previously failed")
+                    return
+            else:
+                from dlss_updater.database import db_manager
 
-            # Check cache first
-            cached_path = await db_manager.get_cached_image_path(self.game.steam_app_id)
+                # Check cache first
+                cached_path = await db_manager.get_cached_image_path(self.game.steam_app_id)
 
             if cached_path:
                 # Use try/except instead of exists() check to avoid race condition
@@ -479,7 +492,9 @@ class GameCard(ft.Card):
 
             # Fetch from Steam CDN
             self.logger.info(f"Fetching Steam image for {self.game.name} (app_id: {self.game.steam_app_id})")
-            image_path = await fetch_steam_image(self.game.steam_app_id)
+            image_path = await fetch_steam_image(
+                self.game.steam_app_id, cache_checked=image_cache is not None
+            )
 
             if image_path:
                 try:
@@ -0,0 +1,135 @@
+"""
+Interrupted Update Dialog
+Offers to resume or roll back a journaled update session that never finished
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import flet as ft
+
+from dlss_updater.models import IncompleteUpdateSession
+
+
+class InterruptedUpdateDialog:
+    """
+    Dialog shown at startup when a high-performance update was interrupted.
+
+    Lists the DLLs the session had not finished and lets the user resume the
+    update, roll every DLL back to its backup, or decide later.
+    """
+
+    RESUME = "resume"
+    ROLLBACK = "rollback"
+
+    PRIMARY_BLUE = "#2D6E88"
+    WARNING_ORANGE = ft.Colors.ORANGE
+    INFO_BOX_BG = "#3C3C3C"
+    MAX_LISTED_DLLS = 8
+
+    def __init__(self, page: ft.Page, logger: logging.Logger, session: IncompleteUpdateSession):
+        self.page = page
+        self.logger = logger
+        self.session = session
+        self._choice: str | None = None
+        self._dialog: ft.AlertDialog | None = None
+        self._close_event: asyncio.Event | None = None
+
+    def _build_dll_list(self) -> ft.Container:
+        """Build the list of DLLs the session left unfinished."""
+        pending = self.session.pending_entries
+        rows = [
+            ft.Text(
+                f"{entry.game_name} - {Path(entry.target_path).name} ({entry.state.replace('_', ' ')})",
+                size=12,
+            )
+            for entry in pending[:self.MAX_LISTED_DLLS]
+        ]
+        if len(pending) > self.MAX_LISTED_DLLS:
+            rows.append(ft.Text(
+                f"...and {len(pending) - self.MAX_LISTED_DLLS} more",
+                size=12,
+                color=ft.Colors.GREY_400,
+                italic=True,
+            ))
+
+        return ft.Container(
+            content=ft.Column(controls=rows, spacing=4, tight=True),
+            bgcolor=self.INFO_BOX_BG,
+            padding=ft.padding.all(12),
+            border_radius=6,
+        )
+
+    async def show(self) -> str | None:
+        """
+        Show the dialog and return the user's choice.
+
+        Returns:
+            RESUME, ROLLBACK, or None when the user chose to decide later
+        """
+        self._choice = None
+        self._close_event = asyncio.Event()
+
+        def make_handler(choice: str | None):
+            async def handler(e):
+                self._choice = choice
+                self.page.close(self._dialog)
+                self._close_event.set()
+            return handler
+
+        started = self.session.started_at.strftime("%Y-%m-%d %H:%M")
+        restorable = len(self.session.restorable_entries)
+
+        content = ft.Column(
+            controls=[
+                ft.Text(
+                    f"An update started on {started} did not finish. "
+                    f"{len(self.session.pending_entries)} of {len(self.session.entries)} DLLs "
+                    f"were left incomplete:",
+                    size=13,
+                ),
+                self._build_dll_list(),
+                ft.Text(
+                    f"Resume finishes the remaining updates. Roll back restores "
+                    f"{restorable} DLLs from their backups.",
+                    size=12,
+                    color=ft.Colors.GREY_400,
+                ),
+            ],
+            spacing=12,
+            tight=True,
+        )
+
+        self._dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Row(
+                controls=[
+                    ft.Icon(ft.Icons.RESTORE, color=self.WARNING_ORANGE, size=24),
+                    ft.Text("Interrupted Update"),
+                ],
+                spacing=10,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            content=ft.Container(content=content, width=500),
+            actions=[
+                ft.TextButton("Later", on_click=make_handler(None)),
+                ft.TextButton(
+                    "Roll Back",
+                    on_click=make_handler(self.ROLLBACK),
+                    disabled=restorable == 0,
+                ),
+                ft.FilledButton(
+                    "Resume",
+                    on_click=make_handler(self.RESUME),
+                    style=ft.ButtonStyle(bgcolor=self.PRIMARY_BLUE),
+                ),
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+
+        self.page.open(self._dialog)
+        await self._close_event.wait()
+
+        self.logger.info(f"Interrupted update session {self.session.session_id[:8]}: {self._choice or 'later'}")
+        return self._choice
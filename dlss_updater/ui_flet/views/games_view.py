@@ -8,7 +8,6 @@ from typing import Callable, Any
 import flet as ft
 
 from dlss_updater.database import db_manager, Game, merge_games_by_name
-from dlss_updater.models import MergedGame
 from dlss_updater.ui_flet.components.game_card import GameCard
 from dlss_updater.ui_flet.components.search_bar import SearchBar
 from dlss_updater.ui_flet.theme.colors import MD3Colors
@@ -256,25 +255,32 @@ class GamesView(ft.Column):
             # Merge games with same name into single entries
             merged_games = merge_games_by_name(games)
 
-            # Load DLLs and backup groups for ALL game IDs in each merged game
-            async def load_merged_game_data(merged: MergedGame):
+            # Load DLLs and backup groups for ALL game IDs of this launcher in
+            # two bulk queries instead of two queries per game
+            game_ids = [game_id for mg in merged_games for game_id in mg.all_game_ids]
+            dlls_by_game, backups_by_game = await asyncio.gather(
+                db_manager.batch_get_dlls_for_games(game_ids),
+                db_manager.batch_get_backups_grouped_by_dll_type(game_ids),
+            )
+
+            results = []
+            for merged in merged_games:
                 all_dlls = []
                 all_backup_groups = {}
 
                 for game_id in merged.all_game_ids:
-                    dlls = await db_manager.get_dlls_for_game(game_id)
-                    all_dlls.extend(dlls)
+                    all_dlls.extend(dlls_by_game.get(game_id, []))
 
-                    backup_groups = await db_manager.get_backups_grouped_by_dll_type(game_id)
-                    for dll_type, backups in backup_groups.items():
+                    for dll_type, backups in backups_by_game.get(game_id, {}).items():
                         if dll_type not in all_backup_groups:
                             all_backup_groups[dll_type] = []
                         all_backup_groups[dll_type].extend(backups)
 
-                return merged, all_dlls, all_backup_groups
+                results.append((merged, all_dlls, all_backup_groups))
 
-            tasks = [load_merged_game_data(mg) for mg in merged_games]
-            results = await asyncio.gather(*tasks)
+            # Resolve cached image paths / failed flags for the whole tab at once
+            app_ids = [mg.primary_game.steam_app_id for mg in merged_games if mg.primary_game.steam_app_id]
+            image_cache = await db_manager.batch_get_image_cache_status(app_ids)
 
             # Create game cards for this launcher
             game_cards = []
@@ -300,7 +306,7 @@ class GamesView(ft.Column):
                 game_cards.append(card)
 
                 # Load image asynchronously (non-blocking)
-                asyncio.create_task(card.load_image())
+                asyncio.create_task(card.load_image(image_cache))
 
             # Trigger staggered fade-in animation for game cards
             asyncio.create_task(self._animate_cards_in(game_cards))
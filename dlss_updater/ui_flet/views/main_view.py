@@ -7,6 +7,7 @@ import asyncio
 import logging
 import os
 import subprocess
+import time
 import webbrowser
 from datetime import datetime
 from pathlib import Path
@@ -78,6 +79,7 @@ from dlss_updater.ui_flet.panels import PreferencesPanel, ReleaseNotesPanel, Bla
 from dlss_updater.ui_flet.dialogs.app_update_dialog import AppUpdateDialog
 from dlss_updater.ui_flet.dialogs.dlss_overlay_dialog import DLSSOverlayDialog
 from dlss_updater.ui_flet.dialogs.dlss_preset_dialog import DLSSPresetDialog
+from dlss_updater.ui_flet.dialogs.interrupted_update_dialog import InterruptedUpdateDialog
 from dlss_updater.ui_flet.async_updater import AsyncUpdateCoordinator, UpdateProgress
 from dlss_updater.platform_utils import FEATURES, IS_LINUX, IS_WINDOWS
 from dlss_updater.linux_paths import is_flatpak, get_flatpak_override_command
@@ -88,6 +90,9 @@ from dlss_updater.ui_flet.components.app_menu_selector import AppMenuSelector, M
 from dlss_updater.version import __version__
 from dlss_updater.utils import find_game_root
 
+# Shortest interval between Games view reloads while a scan is recording games
+GAMES_REFRESH_INTERVAL = 2.0
+
 
 class MainView(ft.Column):
     """
@@ -134,6 +139,7 @@ class MainView(ft.Column):
 
         # Navigation state
         self.current_view_index = 0  # 0=Launchers, 1=Games, 2=Backups
+        self.library_watcher = None  # LibraryWatcher when [Performance] WatchLibraries is on
         self.last_view_index = 0  # Track previous view for cleanup
 
         # Scan state management - store last scan results for update operations
@@ -1242,9 +1248,14 @@ class MainView(ft.Column):
         """
         Called after DLL cache initialization completes.
 
-        Shows the DLSS preset dialog for first-time NVIDIA GPU users.
-        This allows them to configure optimal presets before updating games.
+        Offers recovery of an interrupted update session (resuming needs the
+        source DLLs), then shows the DLSS preset dialog for first-time NVIDIA
+        GPU users. This allows them to configure optimal presets before
+        updating games.
         """
+        await self._offer_interrupted_update_recovery()
+        await self._restart_library_watcher()
+
         # Only show for NVIDIA GPU users who haven't seen the dialog
         if not FEATURES.nvidia_gpu_detected:
             self.logger.debug("DLSS preset dialog skipped - no NVIDIA GPU detected")
@@ -1261,6 +1272,86 @@ class MainView(ft.Column):
         dialog = DLSSPresetDialog(self.page, self.logger)
         await dialog.show()
 
+    async def _restart_library_watcher(self):
+        """(Re)start the background library watcher if enabled, using the current launcher roots"""
+        from dlss_updater.library_watcher import LibraryWatcher, get_library_roots
+        from dlss_updater.scanner import get_selected_dll_names
+
+        if self.library_watcher is not None:
+            await self.library_watcher.stop()
+            self.library_watcher = None
+
+        if not config_manager.get_watch_libraries():
+            return
+
+        try:
+            roots = await get_library_roots()
+            dll_names = get_selected_dll_names()
+            if not roots or not dll_names:
+                return
+            watcher = LibraryWatcher(roots, dll_names, on_change=self._on_library_changed)
+            await watcher.start()
+            self.library_watcher = watcher
+        except Exception as ex:
+            self.logger.warning(f"Could not start library watcher: {ex}")
+
+    async def _on_library_changed(self):
+        """Reload the Games view after the library watcher updated the database"""
+        if self.current_view_index == 1:
+            await self.games_view.load_games()
+
+    async def _refresh_games_view(self):
+        """Reload the Games view with newly recorded games (search index included)"""
+        from dlss_updater.search_service import search_service
+        search_service.clear_index()
+        await self.games_view.load_games()
+
+    async def _offer_interrupted_update_recovery(self):
+        """Offer to resume or roll back update sessions a crash left unfinished"""
+        from dlss_updater.update_journal import (
+            get_incomplete_update_sessions,
+            resume_update_session,
+            rollback_update_session,
+        )
+
+        try:
+            sessions = await get_incomplete_update_sessions()
+        except Exception as e:
+            self.logger.warning(f"Could not check for interrupted updates: {e}")
+            return
+
+        for session in sessions:
+            choice = await InterruptedUpdateDialog(self.page, self.logger, session).show()
+            if choice is None:
+                continue
+
+            try:
+                if choice == InterruptedUpdateDialog.ROLLBACK:
+                    self.loading_overlay.show(self.page, "Rolling back interrupted update...")
+                    results = await rollback_update_session(session)
+                    self.loading_overlay.hide(self.page)
+                    message = f"Restored {results['success_count']} DLLs"
+                    if results["failure_count"]:
+                        message += f", {results['failure_count']} failed (see log)"
+                else:
+                    self.loading_overlay.show(self.page, "Resuming interrupted update...")
+
+                    async def on_progress(current: int, total: int, message: str):
+                        percentage = max(0, min(100, int(current / total * 100))) if total > 0 else 0
+                        await self.loading_overlay.set_progress_async(percentage, self.page, message)
+
+                    result = await resume_update_session(session, on_progress)
+                    self.loading_overlay.hide(self.page)
+                    message = (
+                        f"Update resumed: {result.updates_succeeded} updated, "
+                        f"{result.updates_skipped} skipped, {result.updates_failed} failed"
+                    )
+                await self._show_snackbar(message, duration=4000)
+            except Exception as e:
+                self.logger.error(f"Failed to recover interrupted update: {e}", exc_info=True)
+                self.loading_overlay.hide(self.page)
+                await self._show_snackbar("Could not recover interrupted update (see log)", duration=4000)
+
     async def _on_settings_clicked(self, e):
         """Handle settings button click"""
         panel_manager = PanelManager.get_instance(self.page, self.logger)
@@ -1294,8 +1385,31 @@ class MainView(ft.Column):
                     progress.message
                 )
 
+            # Show games in the Games view as the scan records them (throttled)
+            refresh_task: asyncio.Task | None = None
+            last_refresh = 0.0
+
+            async def on_recorded(games: int, dlls: int):
+                nonlocal refresh_task, last_refresh
+                if self.current_view_index != 1:
+                    return
+                if refresh_task is not None and not refresh_task.done():
+                    return
+                now = time.monotonic()
+                if now - last_refresh < GAMES_REFRESH_INTERVAL:
+                    return
+                last_refresh = now
+                # Don't hold up the database writer while the view rebuilds
+                refresh_task = asyncio.create_task(self._refresh_games_view())
+
             # Run scan only
-            dll_dict = await self.update_coordinator.scan_for_games(on_progress)
+            dll_dict = await self.update_coordinator.scan_for_games(on_progress, on_recorded)
+
+            # Show the last batches too
+            if refresh_task is not None:
+                await refresh_task
+            if self.current_view_index == 1:
+                await self._refresh_games_view()
 
             # SAVE SCAN RESULTS FOR LATER UPDATE (both in memory and to disk)
             self.last_scan_results = dll_dict
@@ -1311,6 +1425,9 @@ class MainView(ft.Column):
             # Parse DLL dict and update launcher cards
             await self._populate_launcher_cards(dll_dict)
 
+            # Launcher paths may have changed since the watcher started
+            await self._restart_library_watcher()
+
             # Count unique games (group DLLs by game root)
             unique_games = set()
             for launcher, dll_paths in dll_dict.items():
@@ -1686,7 +1803,7 @@ class MainView(ft.Column):
 
         try:
             async with asyncio.timeout(SHUTDOWN_TIMEOUT):
-                # 1. Cancel all registered background tasks
+                # 1. Cancel all registered background tasks and run shutdown hooks
                 try:
                     from dlss_updater.task_registry import cancel_all_tasks
                     await cancel_all_tasks(timeout=3.0)
@@ -1701,15 +1818,8 @@ class MainView(ft.Column):
                 except Exception as e:
                     self.logger.warning(f"Error stopping cache manager: {e}")
 
-                # 3. Close HTTP session
-                try:
-                    from dlss_updater.dll_repository import close_http_session
-                    await close_http_session()
-                    self.logger.info("HTTP session closed")
-                except Exception as e:
-                    self.logger.warning(f"Error closing HTTP session: {e}")
-
-                # 4. Close database connections
+                # 3. Close database connections
+                # (the shared HTTP session and thread pools are closed by cancel_all_tasks() hooks)
                 try:
                     from dlss_updater.database import db_manager
                     await db_manager.close()
@@ -1717,6 +1827,13 @@ class MainView(ft.Column):
                 except Exception as e:
                     self.logger.warning(f"Error closing database: {e}")
 
+                # 4. Stop version extraction worker processes
+                try:
+                    from dlss_updater.updater import shutdown_version_process_pool
+                    shutdown_version_process_pool()
+                except Exception as e:
+                    self.logger.warning(f"Error stopping version process pool: {e}")
+
             self.logger.info("Application shutdown complete")
 
         except asyncio.TimeoutError:
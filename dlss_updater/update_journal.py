@@ -0,0 +1,234 @@
+"""
+Update Journal for DLSS Updater
+Write-ahead journal of high-performance update sessions, with crash recovery
+
+BackupManifest only lives in memory, so a crash in the middle of a batch update
+used to lose track of which DLLs had been backed up or already replaced. The
+journal mirrors each DLL's progress (planned -> backed_up -> written ->
+verified) into SQLite. A session is deleted when its run finishes; a session
+still present at startup was interrupted and can be resumed or rolled back.
+
+State changes are buffered and written in batches, so the parallel phases never
+wait on SQLite once per DLL. All backup records are flushed before the first
+DLL is written (the write-ahead rule). Losing the last unflushed WRITTEN or
+VERIFIED records in a crash is harmless: resuming skips DLLs that are already
+up to date, and rolling back restores every DLL that has a backup.
+"""
+
+import asyncio
+import os
+import shutil
+import stat
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from dlss_updater.checksum import verify_checksum
+from dlss_updater.config import get_current_settings
+from dlss_updater.copy_engine import atomic_copy_file
+from dlss_updater.database import db_manager
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import (
+    BatchUpdateResult,
+    IncompleteUpdateSession,
+    UpdateJournalEntry,
+    UpdateJournalState,
+)
+
+logger = setup_logger()
+
+# State changes buffered before they are written in one transaction
+JOURNAL_BATCH_SIZE = 32
+
+
+class UpdateJournal:
+    """
+    Batched write-ahead journal for one high-performance update session.
+
+    record() is called from worker threads and only appends to a buffer; a
+    full buffer (or an explicit flush() at a phase boundary) is written to
+    SQLite in one transaction. Journal failures are logged and never fail the
+    update itself.
+    """
+
+    def __init__(self, session_id: str | None = None, batch_size: int = JOURNAL_BATCH_SIZE):
+        self.session_id = session_id or uuid.uuid4().hex
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        # Serialises flushes so batches reach the database in record order
+        self._flush_lock = threading.Lock()
+        self._pending: list[tuple[str, str, str | None, str | None]] = []
+        self._active = False
+
+    def begin(self, tasks: list[Any]) -> bool:
+        """
+        Journal the session with every task in the PLANNED state.
+
+        Args:
+            tasks: DLLTask objects the session is about to process
+
+        Returns:
+            True if the session was journaled
+        """
+        entries = [
+            (task.target_path, task.source_dll_name, task.game_name, task.dll_type)
+            for task in tasks
+        ]
+        self._active = db_manager.begin_update_session_sync(self.session_id, entries)
+        if self._active:
+            logger.info(f"[JOURNAL] Session {self.session_id[:8]} started ({len(entries)} DLLs)")
+        return self._active
+
+    def record(
+        self,
+        target_path: str,
+        state: UpdateJournalState,
+        backup_path: str | None = None,
+        checksum: str | None = None
+    ) -> None:
+        """Buffer a state change, flushing when the batch is full (thread-safe)."""
+        if not self._active:
+            return
+        with self._lock:
+            self._pending.append((
+                str(target_path),
+                str(state),
+                str(backup_path) if backup_path else None,
+                checksum
+            ))
+            full = len(self._pending) >= self._batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered state changes in one transaction.
+
+        Returns:
+            Number of state changes written
+        """
+        if not self._active:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            return db_manager.write_journal_states_sync(self.session_id, batch)
+
+    def finish(self) -> None:
+        """Drop the session: the run completed or was cleanly resolved."""
+        if not self._active:
+            return
+        with self._flush_lock:
+            with self._lock:
+                self._pending.clear()
+            db_manager.finish_update_session_sync(self.session_id)
+            self._active = False
+        logger.info(f"[JOURNAL] Session {self.session_id[:8]} finished")
+
+
+async def get_incomplete_update_sessions() -> list[IncompleteUpdateSession]:
+    """Get update sessions that were interrupted before they finished."""
+    return await db_manager.get_incomplete_update_sessions()
+
+
+def _restore_entry(entry: UpdateJournalEntry) -> bool:
+    """
+    Restore one journaled DLL from its backup (runs in thread pool).
+
+    Returns:
+        True if the DLL was restored, False if it already matched the backup
+    """
+    target_path = Path(entry.target_path)
+    backup_path = Path(entry.backup_path)
+
+    if not backup_path.exists():
+        raise FileNotFoundError(f"Backup not found: {backup_path}")
+
+    # A DLL the session never got to write still holds the original
+    if entry.checksum and target_path.exists() and verify_checksum(target_path, entry.checksum):
+        return False
+
+    if target_path.exists():
+        os.chmod(target_path, stat.S_IWRITE | stat.S_IREAD)
+    atomic_copy_file(backup_path, target_path)
+    shutil.copystat(backup_path, target_path)
+    return True
+
+
+async def rollback_update_session(session: IncompleteUpdateSession) -> dict[str, Any]:
+    """
+    Roll an interrupted session back by restoring every journaled backup.
+
+    The session is dropped once every DLL was restored; if any restore fails
+    it is kept so the rollback can be retried on the next start.
+
+    Returns:
+        Dict with 'success_count', 'failure_count', and 'errors' keys
+    """
+    results = {
+        "success_count": 0,
+        "failure_count": 0,
+        "errors": []
+    }
+
+    entries = session.restorable_entries
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(_restore_entry, entry) for entry in entries),
+        return_exceptions=True
+    )
+
+    for entry, outcome in zip(entries, outcomes):
+        if isinstance(outcome, Exception):
+            error_msg = f"Failed to roll back {entry.target_path}: {outcome}"
+            logger.error(f"[JOURNAL] {error_msg}")
+            results["errors"].append(error_msg)
+            results["failure_count"] += 1
+        else:
+            if outcome:
+                logger.info(f"[JOURNAL] Restored {Path(entry.target_path).name}")
+            results["success_count"] += 1
+
+    if results["failure_count"] == 0:
+        await db_manager.finish_update_session(session.session_id)
+
+    logger.info(
+        f"[JOURNAL] Rollback of session {session.session_id[:8]}: "
+        f"{results['success_count']} restored, {results['failure_count']} failed"
+    )
+    return results
+
+
+async def resume_update_session(
+    session: IncompleteUpdateSession,
+    progress_callback: Callable[[int, int, str], None] | None = None
+) -> BatchUpdateResult:
+    """
+    Finish an interrupted session by re-running its unfinished DLLs.
+
+    DLLs the session already replaced are skipped by the pipeline's version
+    pre-filter, so only the remaining ones are backed up and updated. The
+    re-run is journaled as a new session and the old one is dropped.
+
+    Raises:
+        MemoryPressureError: If the pipeline cannot run in high-performance mode
+    """
+    # Imported here: the pipeline itself depends on this module
+    from dlss_updater.high_performance_updater import DLLTask, HighPerformanceUpdateManager
+
+    tasks = [
+        DLLTask(
+            target_path=entry.target_path,
+            source_dll_name=entry.source_dll_name,
+            game_name=entry.game_name,
+            dll_type=entry.dll_type,
+        )
+        for entry in session.pending_entries
+    ]
+    logger.info(f"[JOURNAL] Resuming session {session.session_id[:8]} ({len(tasks)} DLLs)")
+
+    manager = HighPerformanceUpdateManager()
+    result = await manager.execute(tasks, get_current_settings(), progress_callback)
+
+    await db_manager.finish_update_session(session.session_id)
+    return result
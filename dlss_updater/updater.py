@@ -2,17 +2,31 @@ import os
 import shutil
 import threading
 import sys
-from .config import LATEST_DLL_VERSIONS, LATEST_DLL_PATHS, Concurrency
+from .config import LATEST_DLL_VERSIONS, LATEST_DLL_PATHS, CPU_THREADS, Concurrency
 from pathlib import Path
 import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
 import stat
 import time
-import psutil
 from packaging import version
 from .logger import setup_logger
 from .constants import DLL_TYPE_MAP, FSR4_DLL_RENAME_MAP
 from .config import config_manager
-from .models import ProcessedDLLResult
+from .backup_store import delete_blob, store_blob, unpin_blob
+from .checksum import BLAKE2B, compute_checksum, format_checksum, parse_checksum
+from .adaptive_concurrency import get_cpu_limiter
+from .executor_registry import get_executor, map_bounded
+from .copy_engine import atomic_copy_file, clone_file
+from .models import (
+    BackupStorageMode,
+    BackupStrategy,
+    ExecutorPool,
+    ProcessedDLLResult,
+    VersionExtractionBackend,
+)
+from .open_file_snapshot import DEFAULT_SNAPSHOT_MAX_AGE, get_open_file_snapshot
+from .version_worker import extract_versions_batch
 
 logger = setup_logger()
 
@@ -26,23 +40,100 @@ except AttributeError:
 _dll_version_cache_lock = threading.Lock()
 _parse_version_cache_lock = threading.Lock()
 
-# Thread pool for parallel version extraction (reused across calls)
-_version_executor = None
-_version_executor_lock = threading.Lock()
-
-
-def _get_version_executor():
-    """Get or create the shared thread pool executor for version extraction."""
-    global _version_executor
-    if _version_executor is None:
-        with _version_executor_lock:
-            if _version_executor is None:
-                # Use CPU-bound thread pool - scales with hardware
-                _version_executor = concurrent.futures.ThreadPoolExecutor(
-                    max_workers=Concurrency.THREADPOOL_CPU,
-                    thread_name_prefix="version_extract"
+# Process pool for bulk version extraction on GIL-enabled interpreters
+_version_process_pool = None
+_version_process_pool_lock = threading.Lock()
+
+# Below these thresholds, worker start-up and IPC cost more than they save
+_PROCESS_POOL_MIN_DLLS = 64
+_PROCESS_POOL_MIN_CPUS = 8
+
+
+def _get_version_process_pool():
+    """Get or create the shared process pool for bulk version extraction."""
+    global _version_process_pool
+    if _version_process_pool is None:
+        with _version_process_pool_lock:
+            if _version_process_pool is None:
+                # spawn: forking a multi-threaded process is unsafe, and it is the
+                # only start method on Windows anyway. Workers only import
+                # version_worker (see there), not the updater or the UI
+                _version_process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=Concurrency.CPU_BOUND,
+                    mp_context=multiprocessing.get_context("spawn"),
                 )
-    return _version_executor
+                logger.info(f"Version extraction process pool started (workers={Concurrency.CPU_BOUND})")
+    return _version_process_pool
+
+
+def shutdown_version_process_pool():
+    """Shut down the version extraction process pool (call on app shutdown)."""
+    global _version_process_pool
+    with _version_process_pool_lock:
+        if _version_process_pool is not None:
+            _version_process_pool.shutdown(wait=False, cancel_futures=True)
+            _version_process_pool = None
+
+
+def _resolve_version_backend(dll_count: int) -> VersionExtractionBackend:
+    """Pick the executor for a bulk extraction of dll_count DLLs."""
+    backend = config_manager.get_version_extraction_backend()
+    if backend != VersionExtractionBackend.AUTO:
+        return backend
+
+    # Threads already run in parallel without the GIL; processes only pay off
+    # for large batches on machines with enough cores
+    if GIL_DISABLED or dll_count < _PROCESS_POOL_MIN_DLLS or CPU_THREADS < _PROCESS_POOL_MIN_CPUS:
+        return VersionExtractionBackend.THREAD
+    return VersionExtractionBackend.PROCESS
+
+
+def extract_dll_versions(dll_paths: list[str]) -> list[str | None]:
+    """
+    Extract versions for many DLLs using the configured backend.
+
+    The process backend sends paths in batches (several per worker) so each
+    IPC round-trip carries enough work to amortize pickling overhead. Falls
+    back to the thread pool if the process pool cannot be used.
+
+    Args:
+        dll_paths: List of DLL paths
+
+    Returns:
+        List of version strings (None if unknown), in the same order as dll_paths
+    """
+    if not dll_paths:
+        return []
+    if len(dll_paths) == 1:
+        return [get_dll_version(dll_paths[0])]
+
+    backend = _resolve_version_backend(len(dll_paths))
+
+    if backend == VersionExtractionBackend.PROCESS:
+        try:
+            pool = _get_version_process_pool()
+            # ~4 batches per worker balances load without excessive IPC
+            batch_size = max(8, -(-len(dll_paths) // (Concurrency.CPU_BOUND * 4)))
+            batches = [dll_paths[i:i + batch_size] for i in range(0, len(dll_paths), batch_size)]
+
+            versions = []
+            for batch_versions in pool.map(extract_versions_batch, batches):
+                versions.extend(batch_versions)
+
+            logger.debug(f"Extracted {len(dll_paths)} versions in {len(batches)} process batches")
+            return versions
+
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            logger.warning(f"Process pool version extraction failed ({e}), falling back to threads")
+            shutdown_version_process_pool()
+
+    return list(get_executor(ExecutorPool.PE_PARSE).map(_get_dll_version_limited, dll_paths))
+
+
+def _get_dll_version_limited(dll_path):
+    """get_dll_version under the adaptive CPU limiter (thread pool worker)."""
+    with get_cpu_limiter().slot():
+        return get_dll_version(dll_path)
 
 
 def get_dll_versions_parallel(dll_path1, dll_path2):
@@ -55,7 +146,7 @@ def get_dll_versions_parallel(dll_path1, dll_path2):
     Returns:
         Tuple of (version1, version2)
     """
-    executor = _get_version_executor()
+    executor = get_executor(ExecutorPool.PE_PARSE)
     future1 = executor.submit(get_dll_version, dll_path1)
     future2 = executor.submit(get_dll_version, dll_path2)
 
@@ -122,14 +213,15 @@ def parse_version(version_string):
 
 def get_dll_version(dll_path):
     """
-    Extract version from a DLL file using pefile.
+    Extract version from a DLL file.
 
-    Uses fast_load=True and only parses the resource directory for better performance.
+    Uses the minimal VS_VERSIONINFO reader (a few KB of seek+read calls instead
+    of loading the whole DLL), falling back to pefile for malformed files.
     Results are cached based on file path and modification time.
 
     Thread-safe for free-threading (Python 3.14+).
     """
-    import pefile  # Deferred import for faster startup
+    from .pe_version import PEVersionError, read_file_version, read_file_version_pefile
 
     try:
         # Get file modification time for cache invalidation
@@ -144,38 +236,24 @@ def get_dll_version(dll_path):
                 return _dll_version_cache[cache_key]
 
         # Not in cache, parse the DLL (outside lock to avoid blocking)
-        with open(dll_path, "rb") as file:
-            # Use fast_load to skip unnecessary PE parsing
-            pe = pefile.PE(data=file.read(), fast_load=True)
+        try:
+            version_str = read_file_version(path_str)
+        except PEVersionError as e:
+            logger.debug(f"Minimal version reader failed for {dll_path} ({e}), falling back to pefile")
+            version_str = read_file_version_pefile(path_str)
 
-            # Only parse the resource directory (where version info lives)
-            pe.parse_data_directories(
-                directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']]
-            )
+        # Cache the result (thread-safe write)
+        with _dll_version_cache_lock:
+            _dll_version_cache[cache_key] = version_str
+
+            # Limit cache size to prevent memory bloat
+            if len(_dll_version_cache) > 256:
+                # Remove oldest entries (simple FIFO)
+                keys_to_remove = list(_dll_version_cache.keys())[:128]
+                for key in keys_to_remove:
+                    del _dll_version_cache[key]
 
-            version_str = None
-            if hasattr(pe, 'FileInfo') and pe.FileInfo:
-                for fileinfo in pe.FileInfo:
-                    for entry in fileinfo:
-                        if hasattr(entry, "StringTable"):
-                            for st in entry.StringTable:
-                                for key, value in st.entries.items():
-                                    if key == b"FileVersion":
-                                        version_str = value.decode("utf-8").strip()
-                                        break
-
-            # Cache the result (thread-safe write)
-            with _dll_version_cache_lock:
-                _dll_version_cache[cache_key] = version_str
-
-                # Limit cache size to prevent memory bloat
-                if len(_dll_version_cache) > 256:
-                    # Remove oldest entries (simple FIFO)
-                    keys_to_remove = list(_dll_version_cache.keys())[:128]
-                    for key in keys_to_remove:
-                        del _dll_version_cache[key]
-
-            return version_str
+        return version_str
 
     except Exception as e:
         logger.error(f"Error reading version from {dll_path}: {e}")
@@ -191,6 +269,95 @@ async def get_dll_version_async(dll_path):
     return await asyncio.to_thread(get_dll_version, dll_path)
 
 
+def _dll_fingerprint(dll_path) -> tuple[str, int, int, int]:
+    """
+    Build the persistent version cache key for a DLL.
+
+    Returns:
+        Tuple of (normalized path, size, mtime_ns, inode)
+    """
+    path_key = os.path.normcase(os.path.abspath(dll_path))
+    st = os.stat(path_key)
+    return path_key, st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def get_dll_versions_cached(dll_paths) -> dict[str, str | None]:
+    """
+    Get versions for many DLLs, consulting the persistent version cache first.
+
+    Unchanged files (same size, mtime_ns and inode) are answered by a single
+    batched SELECT; only new or modified DLLs are parsed (in parallel via
+    extract_dll_versions) and written back in one batch.
+
+    Args:
+        dll_paths: Iterable of DLL paths
+
+    Returns:
+        Dict mapping str(dll_path) to version string (None if unknown)
+    """
+    from .database import db_manager
+
+    results: dict[str, str | None] = {}
+    fingerprints: dict[str, tuple[str, int, int, int]] = {}
+
+    for dll_path in dll_paths:
+        path_str = str(dll_path)
+        if path_str in results or path_str in fingerprints:
+            continue
+        try:
+            fingerprints[path_str] = _dll_fingerprint(path_str)
+        except OSError as e:
+            logger.error(f"Error reading version from {path_str}: {e}")
+            results[path_str] = None
+
+    if not fingerprints:
+        return results
+
+    cached = db_manager.get_cached_dll_versions_sync(list(fingerprints.values()))
+
+    misses = []
+    for path_str, fingerprint in fingerprints.items():
+        if fingerprint[0] in cached:
+            results[path_str] = cached[fingerprint[0]]
+        else:
+            misses.append(path_str)
+
+    if misses:
+        parsed = extract_dll_versions(misses)
+
+        to_store = []
+        for path_str, version_str in zip(misses, parsed):
+            results[path_str] = version_str
+            if version_str:
+                to_store.append((*fingerprints[path_str], version_str))
+
+        if to_store:
+            db_manager.store_dll_versions_sync(to_store)
+
+    logger.debug(
+        f"Version cache: {len(fingerprints) - len(misses)} hits, {len(misses)} parsed"
+    )
+    return results
+
+
+def get_dll_version_cached(dll_path) -> str | None:
+    """
+    Get a DLL version through the persistent version cache.
+
+    Thread-safe for free-threading (Python 3.14+).
+    """
+    return get_dll_versions_cached([dll_path]).get(str(dll_path))
+
+
+async def get_dll_versions_cached_async(dll_paths) -> dict[str, str | None]:
+    """
+    Async wrapper for get_dll_versions_cached.
+    Runs the cache lookup and any PE parsing in a thread pool.
+    """
+    import asyncio
+    return await asyncio.to_thread(get_dll_versions_cached, list(dll_paths))
+
+
 def remove_read_only(file_path):
     if not os.access(file_path, os.W_OK):
         logger.info(f"Removing read-only attribute from {file_path}")
@@ -201,68 +368,82 @@ def restore_permissions(file_path, original_permissions):
     os.chmod(file_path, original_permissions)
 
 
-def is_file_in_use(file_path, timeout=5):
+def _find_file_owner(file_path, snapshot=None):
+    """
+    Look up the process holding file_path open via the shared open-file snapshot.
+
+    Returns:
+        (pid, process name) or None if no owner is visible
+    """
+    if snapshot is None or snapshot.age() >= DEFAULT_SNAPSHOT_MAX_AGE:
+        snapshot = get_open_file_snapshot()
+    return snapshot.lookup(file_path)
+
+
+def is_file_in_use(file_path, timeout=5, snapshot=None, enumerate_handles=None):
     """
     Check if a file is in use by another process.
 
+    The process table is not walked per call: owners are looked up in a shared,
+    time-bounded snapshot of open handles (see open_file_snapshot).
+
     Args:
         file_path: Path to the file to check
         timeout: Maximum time to wait in seconds
+        snapshot: Optional pre-built OpenFileSnapshot to look owners up in
+        enumerate_handles: Look up the owning process when the file cannot be
+            opened; None uses the SkipHandleEnumeration setting. When False,
+            a single failed open attempt counts as in use (no retries).
 
     Returns:
         True if file is in use, False otherwise
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    if enumerate_handles is None:
+        enumerate_handles = not config_manager.get_skip_handle_enumeration()
+
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < timeout:
         try:
             with open(file_path, "rb"):
                 return False
         except PermissionError:
-            for proc in psutil.process_iter(["pid", "name", "open_files"]):
-                try:
-                    for file in proc.open_files():
-                        if file.path == file_path:
-                            logger.error(
-                                f"File {file_path} is in use by process {proc.name()} (PID: {proc.pid})"
-                            )
-                            return True
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            if not enumerate_handles:
+                logger.info(f"File {file_path} cannot be opened, treating it as in use")
+                return True
+            owner = _find_file_owner(file_path, snapshot)
+            if owner:
+                logger.error(f"File {file_path} is in use by process {owner[1]} (PID: {owner[0]})")
+                return True
         time.sleep(0.1)
     logger.info(f"Timeout reached while checking if file {file_path} is in use")
-    return True  # Assume file is NOT in use if we can't determine otherwise to prevent hanging conditions
+    return True  # Assume file IS in use if we can't determine otherwise
 
 
-async def is_file_in_use_async(file_path, timeout=5):
+async def is_file_in_use_async(file_path, timeout=5, enumerate_handles=None):
     """
     Async version of is_file_in_use.
 
     Uses asyncio.sleep() instead of time.sleep() to avoid blocking the event loop.
-    Process iteration is run in a thread pool to avoid blocking.
+    Snapshot rebuilds are run in a thread pool to avoid blocking.
     """
     import asyncio
+    if enumerate_handles is None:
+        enumerate_handles = not config_manager.get_skip_handle_enumeration()
     start_time = time.monotonic()
 
-    def _check_process_using_file(path):
-        """Check which process has the file open (runs in thread)"""
-        for proc in psutil.process_iter(["pid", "name", "open_files"]):
-            try:
-                for f in proc.open_files():
-                    if f.path == path:
-                        logger.error(f"File {path} is in use by process {proc.name()} (PID: {proc.pid})")
-                        return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return False
-
     while time.monotonic() - start_time < timeout:
         try:
             # Quick test - try to open for reading
             with open(file_path, "rb"):
                 return False
         except PermissionError:
+            if not enumerate_handles:
+                logger.info(f"File {file_path} cannot be opened, treating it as in use")
+                return True
             # File is in use, check which process (in thread pool)
-            if await asyncio.to_thread(_check_process_using_file, str(file_path)):
+            owner = await asyncio.to_thread(_find_file_owner, str(file_path))
+            if owner:
+                logger.error(f"File {file_path} is in use by process {owner[1]} (PID: {owner[0]})")
                 return True
         await asyncio.sleep(0.1)  # Non-blocking sleep
 
@@ -298,7 +479,62 @@ def record_update_history_sync(dll_path, from_version, to_version, success):
         # Don't fail update if history recording fails
 
 
-def create_backup(dll_path):
+def _create_deduplicated_backup(dll_path, original_version=None, checksum=None):
+    """Back up a DLL into the content-addressed backup store; returns (blob path, method)"""
+    digest = None
+    if checksum is not None:
+        algorithm, hex_digest = parse_checksum(checksum)
+        # A BLAKE2b checksum already is the blob's content address
+        if algorithm == BLAKE2B:
+            digest = hex_digest
+    try:
+        blob = store_blob(dll_path, digest)
+    except Exception as e:
+        logger.error(f"[BACKUP] Failed to store {dll_path} in backup store: {e}", exc_info=True)
+        return None, None
+
+    blob_path = Path(blob.blob_path)
+    backup_id = None
+    try:
+        from dlss_updater.backup_manager import record_backup_metadata_sync
+        # The blob digest doubles as the backup checksum (same BLAKE2b parameters)
+        backup_id = record_backup_metadata_sync(
+            dll_path, blob_path, original_version,
+            blob_digest=blob.digest,
+            checksum=checksum or format_checksum(BLAKE2B, blob.digest)
+        )
+    except Exception as e:
+        logger.warning(f"[BACKUP] Failed to record backup metadata: {e}")
+    finally:
+        unpin_blob(blob.digest)
+
+    if backup_id is None:
+        # No row references the blob, so no prune would ever find it; the
+        # backup is unusable without its row, so report it as failed
+        from dlss_updater.database import db_manager
+        delete_blob(blob.digest, db_manager._is_blob_referenced)
+        logger.error(f"[BACKUP] No backup record for {dll_path}, discarded blob {blob.digest[:12]}")
+        return None, None
+
+    return blob_path, blob.method
+
+
+def create_backup(dll_path, original_version=None, checksum=None):
+    backup_path, _ = create_backup_with_strategy(dll_path, original_version, checksum)
+    return backup_path
+
+
+def create_backup_with_strategy(dll_path, original_version=None, checksum=None):
+    """
+    Create a backup of a DLL and report how its data was materialised.
+
+    Returns:
+        (backup path, strategy) - strategy is a BackupStrategy value, or
+        "existing" when a deduplicated blob was reused; (None, None) on failure
+    """
+    if config_manager.get_backup_storage_mode() == BackupStorageMode.DEDUPLICATED:
+        return _create_deduplicated_backup(dll_path, original_version, checksum)
+
     backup_path = dll_path.with_suffix(".dlsss")
     try:
         logger.info(f"[BACKUP] Attempting to create backup at: {backup_path}")
@@ -306,7 +542,7 @@ def create_backup(dll_path):
         # Pre-flight check 1: Verify write permission to directory (use os.access for portability)
         if not os.access(str(dll_path.parent), os.W_OK):
             logger.error(f"[BACKUP] No write permission to directory: {dll_path.parent}")
-            return None
+            return None, None
 
         # Pre-flight check 2: Verify sufficient disk space (need 2x DLL size for safety)
         try:
@@ -320,7 +556,7 @@ def create_backup(dll_path):
                     f"Available: {disk_stat.free / (1024**2):.1f}MB, "
                     f"Required: {required_space / (1024**2):.1f}MB"
                 )
-                return None
+                return None, None
 
             logger.debug(f"[BACKUP] Disk space check passed. Available: {disk_stat.free / (1024**2):.1f}MB")
         except Exception as e:
@@ -331,12 +567,14 @@ def create_backup(dll_path):
         if backup_path.exists():
             logger.info(f"[BACKUP] Previous backup exists, removing...")
             try:
-                os.chmod(backup_path, stat.S_IWRITE)
+                # A hard-linked backup of this same DLL shares its mode; leave it alone
+                if not os.path.samefile(backup_path, dll_path):
+                    os.chmod(backup_path, stat.S_IWRITE)
                 os.remove(backup_path)
                 logger.info(f"[BACKUP] Successfully removed old backup")
             except Exception as e:
                 logger.error(f"[BACKUP] Failed to remove old backup: {e}", exc_info=True)
-                return None
+                return None, None
 
         # Set directory permissions
         try:
@@ -346,13 +584,17 @@ def create_backup(dll_path):
             logger.warning(f"[BACKUP] Could not set directory permissions: {e}")
             # Continue anyway - not always critical
 
-        # Perform backup copy
-        shutil.copy2(dll_path, backup_path)
+        # Checksum the original before copying, so a corrupted copy is detectable later
+        if checksum is None:
+            checksum = compute_checksum(dll_path)
+
+        # Reflink / hard link / copy, whichever the filesystem supports first
+        strategy = clone_file(dll_path, backup_path)
 
         # Verification 1: Check backup file exists
         if not backup_path.exists():
             logger.error(f"[BACKUP] Backup file not created at {backup_path}")
-            return None
+            return None, None
 
         # Verification 2: Check backup file size matches original
         try:
@@ -370,41 +612,42 @@ def create_backup(dll_path):
                     logger.info(f"[BACKUP] Deleted corrupted backup file")
                 except Exception:
                     pass
-                return None
+                return None, None
 
             logger.debug(f"[BACKUP] Size verification passed: {original_size} bytes")
         except Exception as e:
             logger.warning(f"[BACKUP] Could not verify backup size: {e}")
             # Continue anyway - file exists at least
 
-        # Set backup file permissions
-        try:
-            os.chmod(backup_path, stat.S_IWRITE | stat.S_IREAD)
-        except Exception as e:
-            logger.warning(f"[BACKUP] Could not set backup file permissions: {e}")
+        # Set backup file permissions (a hard link shares its mode with the live DLL)
+        if strategy != BackupStrategy.HARDLINK:
+            try:
+                os.chmod(backup_path, stat.S_IWRITE | stat.S_IREAD)
+            except Exception as e:
+                logger.warning(f"[BACKUP] Could not set backup file permissions: {e}")
 
-        logger.info(f"[BACKUP] Successfully created and verified backup at: {backup_path}")
+        logger.info(f"[BACKUP] Successfully created and verified backup at: {backup_path} ({strategy.value})")
 
         # Record backup metadata in database
         try:
             from dlss_updater.backup_manager import record_backup_metadata_sync
-            record_backup_metadata_sync(dll_path, backup_path)
+            record_backup_metadata_sync(dll_path, backup_path, original_version, checksum=checksum)
         except Exception as e:
             logger.warning(f"[BACKUP] Failed to record backup metadata: {e}")
             # Don't fail backup creation if metadata recording fails
 
-        return backup_path
+        return backup_path, strategy
 
     except PermissionError as e:
         logger.error(f"[BACKUP] Permission denied creating backup for {dll_path}: {e}")
-        return None
+        return None, None
     except OSError as e:
         logger.error(f"[BACKUP] OS error creating backup for {dll_path}: {e}")
-        return None
+        return None, None
     except Exception as e:
         logger.error(f"[BACKUP] Unexpected error creating backup for {dll_path}: {e}", exc_info=True)
         logger.error(f"[BACKUP] Error type: {type(e).__name__}")
-        return None
+        return None, None
 
 
 def update_dll(dll_path, latest_dll_path):
@@ -483,8 +726,7 @@ def update_dll(dll_path, latest_dll_path):
             return ProcessedDLLResult(success=False, dll_type=dll_type)
 
         try:
-            os.remove(dll_path)
-            shutil.copyfile(latest_dll_path, dll_path)
+            atomic_copy_file(latest_dll_path, dll_path)
             restore_permissions(dll_path, original_permissions)
 
             # Verify update
@@ -508,7 +750,8 @@ def update_dll(dll_path, latest_dll_path):
             logger.error(f"File update operation failed: {e}")
             if backup_path and backup_path.exists():
                 try:
-                    shutil.copyfile(backup_path, dll_path)
+                    atomic_copy_file(backup_path, dll_path)
+                    shutil.copystat(backup_path, dll_path)
                     logger.info("Restored backup after failed update")
                 except Exception as restore_error:
                     logger.error(f"Failed to restore backup: {restore_error}")
@@ -612,8 +855,7 @@ def update_dll_with_backup(dll_path, latest_dll_path, pre_created_backup_path=No
             return ProcessedDLLResult(success=False, dll_type=dll_type)
 
         try:
-            os.remove(dll_path)
-            shutil.copyfile(latest_dll_path, dll_path)
+            atomic_copy_file(latest_dll_path, dll_path)
             restore_permissions(dll_path, original_permissions)
 
             # Verify update
@@ -637,7 +879,8 @@ def update_dll_with_backup(dll_path, latest_dll_path, pre_created_backup_path=No
             logger.error(f"File update operation failed: {e}")
             if backup_path and backup_path.exists():
                 try:
-                    shutil.copyfile(backup_path, dll_path)
+                    atomic_copy_file(backup_path, dll_path)
+                    shutil.copystat(backup_path, dll_path)
                     logger.info("Restored backup after failed update")
                 except Exception as restore_error:
                     logger.error(f"Failed to restore backup: {restore_error}")
@@ -664,27 +907,23 @@ def create_backups_parallel(dll_paths, max_workers=None, progress_callback=None)
     total_dlls = len(dll_paths)
     completed = 0
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_dll = {
-            executor.submit(create_backup, Path(dll_path)): dll_path
-            for dll_path in dll_paths
-        }
+    def _backup(dll_path):
+        return create_backup(Path(dll_path))
 
-        for future in concurrent.futures.as_completed(future_to_dll):
-            dll_path = future_to_dll[future]
-            try:
-                backup_path = future.result()
-                if backup_path:
-                    backup_results.append((dll_path, backup_path))
-                    logger.info(f"Created backup for {dll_path}")
-                else:
-                    logger.warning(f"Failed to create backup for {dll_path}")
-            except Exception as e:
-                logger.error(f"Error creating backup for {dll_path}: {e}")
+    for dll_path, future in map_bounded(ExecutorPool.FILE_COPY, _backup, dll_paths, max_workers):
+        try:
+            backup_path = future.result()
+            if backup_path:
+                backup_results.append((dll_path, backup_path))
+                logger.info(f"Created backup for {dll_path}")
+            else:
+                logger.warning(f"Failed to create backup for {dll_path}")
+        except Exception as e:
+            logger.error(f"Error creating backup for {dll_path}: {e}")
 
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total_dlls, f"Backed up {completed}/{total_dlls} files")
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total_dlls, f"Backed up {completed}/{total_dlls} files")
 
     return backup_results
 
@@ -816,12 +1055,9 @@ def update_fsr4_dll_with_rename(source_dll_path, target_dll_path, latest_dll_pat
                 return ProcessedDLLResult(success=False, dll_type=dll_type)
 
         try:
-            # Remove existing file if it exists
-            if target_dll_path.exists():
-                os.remove(target_dll_path)
-            
-            # Copy the source DLL to the target location (this performs the rename)
-            shutil.copyfile(latest_dll_path, target_dll_path)
+            # Copy the source DLL to the target location (this performs the rename),
+            # atomically replacing any existing file
+            atomic_copy_file(latest_dll_path, target_dll_path)
             restore_permissions(target_dll_path, original_permissions)
 
             # Verify update
@@ -838,7 +1074,8 @@ def update_fsr4_dll_with_rename(source_dll_path, target_dll_path, latest_dll_pat
             # Restore backup if update failed
             if backup_path and backup_path.exists() and target_dll_path.exists():
                 try:
-                    shutil.copyfile(backup_path, target_dll_path)
+                    atomic_copy_file(backup_path, target_dll_path)
+                    shutil.copystat(backup_path, target_dll_path)
                     logger.info("Restored backup after failed FSR4 update")
                 except Exception as restore_error:
                     logger.error(f"Failed to restore backup: {restore_error}")
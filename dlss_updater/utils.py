@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 from dlss_updater.logger import setup_logger
 from dlss_updater.config import config_manager, Concurrency
+from dlss_updater.adaptive_concurrency import get_disk_limiter, log_limiter_stats
 from dlss_updater.models import ProcessedDLLResult
 from dlss_updater.platform_utils import IS_WINDOWS, IS_LINUX
 
@@ -111,21 +112,27 @@ async def process_dlls_parallel(dll_tasks, max_workers=None, progress_callback=N
             return ProcessedDLLResult(success=False, dll_type=str(e)), dll_path, launcher
 
     # Process all DLLs concurrently using asyncio.gather
-    # Use semaphore to limit concurrency (similar to max_workers in ThreadPoolExecutor)
+    # Use semaphore to limit concurrency (similar to max_workers in ThreadPoolExecutor);
+    # each disk additionally gets an adaptive limit below that ceiling
     semaphore = asyncio.Semaphore(max_workers)
+    limiters = await asyncio.to_thread(
+        lambda: [get_disk_limiter(dll_path) for dll_path, _ in dll_tasks]
+    )
 
-    async def process_with_semaphore(dll_path, launcher):
-        async with semaphore:
+    async def process_with_semaphore(dll_path, launcher, limiter):
+        # Per-disk slot before the global one (see scanner.scan_games_for_dlls_parallel)
+        async with limiter.slot_async(), semaphore:
             return await process_with_progress(dll_path, launcher)
 
     # Create tasks for all DLLs
     tasks = [
-        process_with_semaphore(dll_path, launcher)
-        for dll_path, launcher in dll_tasks
+        process_with_semaphore(dll_path, launcher, limiter)
+        for (dll_path, launcher), limiter in zip(dll_tasks, limiters)
     ]
 
     # Wait for all tasks to complete
     task_results = await asyncio.gather(*tasks, return_exceptions=True)
+    log_limiter_stats("update")
 
     # Process results
     for task_result in task_results:
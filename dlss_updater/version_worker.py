@@ -0,0 +1,36 @@
+"""
+Version Extraction Worker for DLSS Updater
+Process pool entry point for reading DLL versions
+
+The version extraction pool uses the spawn start method, so every worker is
+a fresh interpreter that imports the module holding the target function.
+Pointing the pool at a function in updater.py made each worker import the
+updater and, through the package, the scanner, config and database - over a
+second of imports before the first DLL was read.
+
+This module only depends on pe_version and the logger, so a worker is ready
+as soon as those two are imported.
+"""
+
+from dlss_updater.logger import setup_logger
+from dlss_updater.pe_version import PEVersionError, read_file_version, read_file_version_pefile
+
+logger = setup_logger()
+
+
+def extract_version(dll_path: str) -> str | None:
+    """Read one DLL's FileVersion, falling back to pefile for malformed files."""
+    try:
+        try:
+            return read_file_version(dll_path)
+        except PEVersionError as e:
+            logger.debug(f"Minimal version reader failed for {dll_path} ({e}), falling back to pefile")
+            return read_file_version_pefile(dll_path)
+    except Exception as e:
+        logger.error(f"Error reading version from {dll_path}: {e}")
+    return None
+
+
+def extract_versions_batch(dll_paths: list[str]) -> list[str | None]:
+    """Process pool worker: extract versions for a batch of DLLs."""
+    return [extract_version(dll_path) for dll_path in dll_paths]
@@ -6,6 +6,8 @@ import asyncio
 import aiohttp
 from dlss_updater.logger import setup_logger
 from dlss_updater.config import config_manager, Concurrency
+from dlss_updater.http_cache import fetch_if_modified
+from dlss_updater.http_client import get_http_session
 
 logger = setup_logger()
 
@@ -30,31 +32,59 @@ async def _get_lock() -> asyncio.Lock:
     return _whitelist_lock
 
 
+def _get_whitelist_cache_path() -> Path:
+    """Local copy of the whitelist CSV, refreshed via conditional GET."""
+    from dlss_updater.platform_utils import APP_CONFIG_DIR
+    return APP_CONFIG_DIR / "whitelist.csv"
+
+
+def _parse_whitelist(content: bytes) -> set:
+    """Parse the whitelist CSV (first column holds the game name)."""
+    reader = csv.reader(StringIO(content.decode("utf-8-sig", errors="replace")))
+    return set(row[0].strip() for row in reader if row and row[0].strip())
+
+
+def _load_cached_whitelist() -> set:
+    """Read the last downloaded whitelist, used when the remote is unreachable."""
+    try:
+        return _parse_whitelist(_get_whitelist_cache_path().read_bytes())
+    except FileNotFoundError:
+        return set()
+    except (OSError, csv.Error) as e:
+        logger.error(f"Failed to read cached whitelist: {e}")
+        return set()
+
+
 async def fetch_whitelist_async() -> set:
-    """Fetch whitelist from remote URL using aiohttp (non-blocking)"""
+    """Fetch whitelist from remote URL using aiohttp (non-blocking)
+
+    Sent as a conditional GET while a local copy exists, so an unchanged
+    whitelist costs a 304 instead of a full download. Falls back to the local
+    copy if the remote cannot be fetched.
+    """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                WHITELIST_URL,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to fetch whitelist: HTTP {response.status}")
-                    return set()
-
-                csv_data = StringIO(await response.text())
-                reader = csv.reader(csv_data)
-                return set(row[0].strip() for row in reader if row and row[0].strip())
+        session = await get_http_session()
+        result = await fetch_if_modified(
+            session,
+            WHITELIST_URL,
+            _get_whitelist_cache_path(),
+            _parse_whitelist,
+            timeout=10,
+        )
+        if result is not None:
+            return result.data
 
     except TimeoutError:
         logger.error("Timeout fetching whitelist")
-        return set()
     except aiohttp.ClientError as e:
         logger.error(f"Failed to fetch whitelist: {e}")
-        return set()
     except csv.Error as e:
         logger.error(f"Failed to parse whitelist CSV: {e}")
-        return set()
+
+    cached = await asyncio.to_thread(_load_cached_whitelist)
+    if cached:
+        logger.info(f"Using cached whitelist ({len(cached)} games)")
+    return cached
 
 
 async def initialize_whitelist() -> None:
@@ -3,32 +3,43 @@ DLSS Updater - Flet UI Entry Point
 Async/await-based modern Material Design interface
 """
 
+from __future__ import annotations
+
+import multiprocessing
 import sys
 
-# Install faster event loop based on platform (must be done before any asyncio usage)
-if sys.platform == 'win32':
-    try:
-        import winloop
-        winloop.install()
-    except ImportError:
-        pass  # winloop not installed, use default event loop
-elif sys.platform == 'linux':
-    try:
-        import uvloop
-        uvloop.install()
-    except ImportError:
-        pass  # uvloop not installed, use default event loop
-
-import asyncio
-import logging
-import flet as ft
-
-# Core imports
-from dlss_updater.logger import setup_logger
-from dlss_updater.utils import check_dependencies, is_admin, run_as_admin  # Admin functions used on Windows only
-from dlss_updater.platform_utils import IS_WINDOWS, IS_LINUX
-from dlss_updater.ui_flet.views.main_view import MainView
-from dlss_updater.task_registry import register_task
+if __name__ == "__main__":
+    # Required for the version extraction process pool in frozen (PyInstaller) builds.
+    # Spawned workers run this file as __main__ and must leave here, before the UI imports
+    multiprocessing.freeze_support()
+
+# Unfrozen spawned workers re-run this file as __mp_main__; they only need the
+# worker module the pool points at (dlss_updater.version_worker), not flet and the UI
+if __name__ != "__mp_main__":
+    # Install faster event loop based on platform (must be done before any asyncio usage)
+    if sys.platform == 'win32':
+        try:
+            import winloop
+            winloop.install()
+        except ImportError:
+            pass  # winloop not installed, use default event loop
+    elif sys.platform == 'linux':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass  # uvloop not installed, use default event loop
+
+    import asyncio
+    import logging
+    import flet as ft
+
+    # Core imports
+    from dlss_updater.logger import setup_logger
+    from dlss_updater.utils import check_dependencies, is_admin, run_as_admin  # Admin functions used on Windows only
+    from dlss_updater.platform_utils import IS_WINDOWS, IS_LINUX
+    from dlss_updater.ui_flet.views.main_view import MainView
+    from dlss_updater.task_registry import register_task
 
 
 def ensure_flet_directories():
@@ -145,6 +156,12 @@ async def main(page: ft.Page):
                     task_name = "backup" if i == 0 else "game"
                     logger.info(f"Cleaned up {result} duplicate {task_name} entries on startup")
 
+            # Backup store blobs released by earlier runs (restores, superseded backups)
+            from dlss_updater.backup_manager import prune_backup_store
+            pruned = await prune_backup_store()
+            if pruned:
+                logger.info(f"Pruned {pruned} unreferenced backup store blobs on startup")
+
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}", exc_info=True)
             # Continue without database - app should still work
@@ -0,0 +1,120 @@
+"""
+Tests for the deduplicated backup store: blobs are pruned once no active
+backup references them, against a temp store and database.
+"""
+
+import threading
+
+import pytest
+
+from dlss_updater import backup_store
+from dlss_updater.backup_manager import prune_backup_store_sync, record_backup_metadata_sync
+from dlss_updater.backup_store import get_blob_path, store_blob, unpin_blob
+from dlss_updater.checksum import BLAKE2B, compute_checksum, parse_checksum
+from dlss_updater.database import db_manager
+from dlss_updater.updater import _create_deduplicated_backup
+
+
+@pytest.fixture
+def store_db(tmp_path, monkeypatch):
+    """Point the database manager and the backup store at temp locations"""
+    monkeypatch.setattr(db_manager, "db_path", tmp_path / "games.db")
+    # Drop thread-local connections to the real database
+    monkeypatch.setattr(db_manager, "_thread_local", threading.local())
+    monkeypatch.setattr(backup_store, "get_backup_store_dir", lambda: tmp_path / "backup_store")
+    db_manager._create_schema()
+    return db_manager
+
+
+def _game_dll(tmp_path, name="nvngx_dlss.dll"):
+    """A DLL on disk with its games/game_dlls rows"""
+    game_dir = tmp_path / "Game"
+    game_dir.mkdir(exist_ok=True)
+    dll_path = game_dir / name
+    games = db_manager._batch_upsert_games([
+        {"name": "Game", "path": str(game_dir), "launcher": "Steam", "steam_app_id": None}
+    ])
+    db_manager._batch_upsert_dlls([{
+        "game_id": games[str(game_dir)].id,
+        "dll_type": "DLSS DLL",
+        "dll_filename": name,
+        "dll_path": str(dll_path),
+        "current_version": "1.0",
+    }])
+    return dll_path
+
+
+def _back_up(dll_path, content: bytes):
+    """Write content to the DLL and back it up into the store like the updater does"""
+    dll_path.write_bytes(content)
+    blob = store_blob(dll_path)
+    try:
+        record_backup_metadata_sync(dll_path, get_blob_path(blob.digest), "1.0", blob_digest=blob.digest)
+    finally:
+        unpin_blob(blob.digest)
+    return blob.digest
+
+
+class TestPruneBackupStore:
+    """Test that released blobs are deleted"""
+
+    def test_superseded_backup_blob_is_pruned(self, tmp_path, store_db):
+        dll_path = _game_dll(tmp_path)
+        old = _back_up(dll_path, b"version one")
+        new = _back_up(dll_path, b"version two")
+
+        assert not get_blob_path(old).exists()
+        assert get_blob_path(new).exists()
+
+    def test_identical_backup_keeps_its_blob(self, tmp_path, store_db):
+        """Superseding a backup with the same content keeps the shared blob"""
+        dll_path = _game_dll(tmp_path)
+        first = _back_up(dll_path, b"same bytes")
+        second = _back_up(dll_path, b"same bytes")
+
+        assert first == second
+        assert get_blob_path(second).exists()
+
+    def test_full_prune_removes_unreferenced_blobs(self, tmp_path, store_db):
+        dll_path = _game_dll(tmp_path)
+        digest = _back_up(dll_path, b"restored away")
+        store_db._mark_old_backups_inactive(store_db._get_game_dll_by_path(str(dll_path)).id)
+
+        assert prune_backup_store_sync() == 1
+        assert not get_blob_path(digest).exists()
+        assert prune_backup_store_sync() == 0
+
+
+class TestDeduplicatedBackup:
+    """Test _create_deduplicated_backup()"""
+
+    def test_unrecorded_blob_is_discarded(self, tmp_path, store_db):
+        """Without a dll_backups row the blob is deleted and the backup fails"""
+        dll_path = tmp_path / "untracked.dll"
+        dll_path.write_bytes(b"no game_dlls row")
+
+        assert _create_deduplicated_backup(dll_path) == (None, None)
+        assert not any((tmp_path / "backup_store").rglob("*.blob"))
+
+    def test_recorded_blob_is_kept(self, tmp_path, store_db):
+        dll_path = _game_dll(tmp_path)
+        dll_path.write_bytes(b"tracked")
+
+        blob_path, _ = _create_deduplicated_backup(dll_path)
+
+        assert blob_path is not None and blob_path.exists()
+
+    def test_blake2b_checksum_is_reused_as_digest(self, tmp_path, store_db, monkeypatch):
+        """A BLAKE2b checksum from the caller saves hashing the DLL again"""
+        dll_path = _game_dll(tmp_path)
+        dll_path.write_bytes(b"hashed once")
+        checksum = compute_checksum(dll_path, BLAKE2B)
+
+        def fail(path):
+            raise AssertionError("DLL hashed twice")
+
+        monkeypatch.setattr(backup_store, "compute_file_digest", fail)
+
+        blob_path, _ = _create_deduplicated_backup(dll_path, checksum=checksum)
+
+        assert blob_path == get_blob_path(parse_checksum(checksum)[1])
@@ -0,0 +1,87 @@
+"""
+Tests for the conditional-GET layer, run against a local aiohttp server.
+"""
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from dlss_updater import http_cache
+from dlss_updater.http_cache import HttpValidatorStore, fetch_if_modified
+
+ETAG = '"v1"'
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Isolated validator store so tests never touch the real config dir"""
+    validator_store = HttpValidatorStore(tmp_path / "validators.json")
+    monkeypatch.setattr(http_cache, "http_validators", validator_store)
+    return validator_store
+
+
+@pytest.fixture
+async def server():
+    """Serve /data with an ETag, answering 304 to a matching If-None-Match"""
+    state = {"requests": [], "body": b"payload-1"}
+
+    async def handler(request):
+        state["requests"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(body=state["body"], headers={"ETag": ETAG})
+
+    app = web.Application()
+    app.router.add_get("/data", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["url"] = f"http://127.0.0.1:{port}/data"
+    yield state
+    await runner.cleanup()
+
+
+class TestConditionalFetch:
+    """Test fetch_if_modified() validator handling"""
+
+    async def test_second_fetch_is_conditional(self, tmp_path, store, server):
+        """A 200 stores body and ETag; the next request gets a 304 and uses the local copy"""
+        cache_path = tmp_path / "data.bin"
+
+        async with aiohttp.ClientSession() as session:
+            first = await fetch_if_modified(session, server["url"], cache_path, bytes)
+            second = await fetch_if_modified(session, server["url"], cache_path, bytes)
+
+        assert first.data == b"payload-1" and not first.not_modified
+        assert second.data == b"payload-1" and second.not_modified
+        assert server["requests"] == [None, ETAG]
+        assert cache_path.read_bytes() == b"payload-1"
+        assert store.get(server["url"]).etag == ETAG
+
+    async def test_missing_local_copy_forces_full_download(self, tmp_path, store, server):
+        """Validators are not sent when the local copy is gone"""
+        cache_path = tmp_path / "data.bin"
+
+        async with aiohttp.ClientSession() as session:
+            await fetch_if_modified(session, server["url"], cache_path, bytes)
+            cache_path.unlink()
+            result = await fetch_if_modified(session, server["url"], cache_path, bytes)
+
+        assert not result.not_modified
+        assert server["requests"] == [None, None]
+
+    async def test_parse_error_keeps_previous_copy(self, tmp_path, store, server):
+        """A body that fails to parse is neither stored nor recorded"""
+        cache_path = tmp_path / "data.bin"
+
+        def reject(body: bytes):
+            raise ValueError("bad payload")
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(ValueError):
+                await fetch_if_modified(session, server["url"], cache_path, reject)
+
+        assert not cache_path.exists()
+        assert store.get(server["url"]) is None
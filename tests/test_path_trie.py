@@ -0,0 +1,131 @@
+"""
+Tests for PathTrie and group_nested_paths, including a randomised comparison
+with the pairwise startswith() merge they replaced.
+"""
+
+import os
+import random
+
+import pytest
+
+from dlss_updater.path_trie import PathTrie, group_nested_paths
+
+# Filesystem root of the current platform ("/" or the current drive, e.g. "C:\\")
+ROOT = os.path.abspath(os.sep)
+
+
+def _path(*parts: str) -> str:
+    return os.path.join(ROOT, *parts)
+
+
+def _pairwise_merge(paths: list[str]) -> dict[str, list[str]]:
+    """The O(n²) merge used by the scanner before PathTrie"""
+    games_dict = {path: [] for path in paths}
+    sorted_paths = sorted(games_dict.keys(), key=len)
+    paths_to_remove = set()
+
+    for i, path1 in enumerate(sorted_paths):
+        if path1 in paths_to_remove:
+            continue
+        path1_lower = path1.lower()
+
+        for path2 in sorted_paths[i + 1:]:
+            if path2 in paths_to_remove:
+                continue
+            if path2.lower().startswith(path1_lower + os.sep):
+                games_dict[path1].append(path2)
+                paths_to_remove.add(path2)
+
+    for path in paths_to_remove:
+        del games_dict[path]
+    return games_dict
+
+
+def _normalized(groups: dict[str, list[str]]) -> dict[str, list[str]]:
+    return {outer: sorted(nested) for outer, nested in groups.items()}
+
+
+class TestPathTrie:
+    """Test PathTrie queries"""
+
+    def test_sibling_prefix_is_not_nested(self):
+        """A sibling whose name starts with the same text (Games2 vs Games) is not nested"""
+        trie = PathTrie([_path("Games")])
+
+        assert trie.outermost_ancestor(_path("Games2")) is None
+        assert trie.outermost_ancestor(_path("Games2", "Title")) is None
+        assert not trie.overlaps(_path("Games2"))
+        assert trie.outermost_ancestor(_path("Games", "Title")) == _path("Games")
+
+    def test_trailing_separator_is_ignored(self):
+        trie = PathTrie([_path("Games") + os.sep])
+
+        assert trie.outermost_ancestor(_path("Games")) == _path("Games") + os.sep
+        assert trie.outermost_ancestor(_path("Games", "Title") + os.sep) == _path("Games") + os.sep
+        assert trie.has_descendant(_path("Games") + os.sep)
+        assert len(PathTrie([_path("Games"), _path("Games") + os.sep])) == 1
+
+    def test_mixed_case_matches_first_spelling(self):
+        trie = PathTrie([_path("SteamLibrary", "Common"), _path("steamlibrary", "COMMON")])
+
+        assert len(trie) == 1
+        assert trie.outermost_ancestor(_path("STEAMLIBRARY", "common", "Game")) == _path("SteamLibrary", "Common")
+        assert trie.has_descendant(_path("steamLibrary"))
+
+    def test_drive_root_contains_everything(self):
+        trie = PathTrie([ROOT])
+
+        assert trie.outermost_ancestor(ROOT) == ROOT
+        assert trie.outermost_ancestor(_path("Games", "Title")) == ROOT
+        assert trie.overlaps(_path("Anything"))
+
+    def test_root_only_has_descendants(self):
+        trie = PathTrie([_path("Games", "Title")])
+
+        assert trie.has_descendant(ROOT)
+        assert trie.outermost_ancestor(ROOT) is None
+
+    def test_outermost_ancestor_prefers_shallowest(self):
+        trie = PathTrie([_path("Games", "Title", "Binaries"), _path("Games")])
+
+        assert trie.outermost_ancestor(_path("Games", "Title", "Binaries", "Win64")) == _path("Games")
+
+    @pytest.mark.skipif(not os.altsep, reason="no alternative separator on this platform")
+    def test_alternative_separator(self):
+        trie = PathTrie([_path("Games")])
+
+        assert trie.outermost_ancestor(_path("Games") + os.altsep + "Title") == _path("Games")
+
+
+class TestGroupNestedPaths:
+    """Test group_nested_paths()"""
+
+    def test_groups_under_outermost(self):
+        games = _path("Games")
+        groups = group_nested_paths([
+            _path("Games", "Title", "Binaries"), games, _path("Games2"), _path("Games", "Other"),
+        ])
+
+        assert _normalized(groups) == {
+            games: sorted([_path("Games", "Title", "Binaries"), _path("Games", "Other")]),
+            _path("Games2"): [],
+        }
+
+    def test_trailing_separator_and_case(self):
+        groups = group_nested_paths([_path("Games") + os.sep, _path("GAMES", "Title")])
+
+        assert groups == {_path("Games") + os.sep: [_path("GAMES", "Title")]}
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_pairwise_merge(self, seed):
+        """Same groups as the old pairwise merge on random path sets"""
+        rng = random.Random(seed)
+        names = ["games", "games2", "game", "steam", "common", "bin", "x64", "title"]
+        paths = set()
+        for _ in range(rng.randint(1, 120)):
+            depth = rng.randint(1, 5)
+            paths.add(_path(*(rng.choice(names) for _ in range(depth))))
+        paths = list(paths)
+        rng.shuffle(paths)
+
+        assert _normalized(group_nested_paths(paths)) == _normalized(_pairwise_merge(paths))
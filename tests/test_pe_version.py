@@ -0,0 +1,173 @@
+"""
+Tests for the minimal PE version reader, run against small PE32+ images
+built in memory (one .rsrc section holding a VS_VERSIONINFO resource).
+"""
+
+import struct
+
+import pytest
+
+from dlss_updater.pe_version import (
+    PEVersionError,
+    parse_version_resource,
+    read_file_version,
+    read_file_version_pefile,
+)
+
+SECTION_RVA = 0x1000
+SECTION_FILE_OFFSET = 0x200
+
+
+def _pad4(data: bytes) -> bytes:
+    return data + b"\x00" * (-len(data) % 4)
+
+
+def _block(key: str, value: bytes = b"", children: list[bytes] = (), text: bool = False) -> bytes:
+    """One VS_VERSIONINFO-style block: header, key, value and children, 4-byte aligned"""
+    body = _pad4(b"\x00" * 6 + (key + "\x00").encode("utf-16-le"))
+    body = _pad4(body + value)
+    for child in children:
+        body += _pad4(child)
+    # Text values are measured in WCHARs, binary ones in bytes
+    value_length = len(value) // 2 if text else len(value)
+    return struct.pack("<HHH", len(body), value_length, 1 if text else 0) + body[6:]
+
+
+def _string(name: str, value: str) -> bytes:
+    return _block(name, (value + "\x00").encode("utf-16-le"), text=True)
+
+
+def _fixed_file_info(major: int, minor: int, build: int, revision: int) -> bytes:
+    return struct.pack(
+        "<13I", 0xFEEF04BD, 0x10000, (major << 16) | minor, (build << 16) | revision, *([0] * 9)
+    )
+
+
+def _version_info(fixed: bytes | None = None, tables: dict[str, dict[str, str]] | None = None) -> bytes:
+    """VS_VERSIONINFO with an optional fixed part and StringTables keyed by language/codepage"""
+    children = []
+    if tables is not None:
+        children.append(_block("StringFileInfo", children=[
+            _block(lang, children=[_string(name, value) for name, value in strings.items()], text=True)
+            for lang, strings in tables.items()
+        ], text=True))
+    return _block("VS_VERSION_INFO", fixed or b"", children)
+
+
+def _pe_image(resource: bytes) -> bytes:
+    """A PE32+ image whose only section is a resource tree: RT_VERSION -> ID 1 -> 0x409"""
+    # Resource directories: root (16 + 8), name (16 + 8), language (16 + 8), data entry (16)
+    rsrc = struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1) + struct.pack("<II", 16, 0x80000000 | 24)
+    rsrc += struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1) + struct.pack("<II", 1, 0x80000000 | 48)
+    rsrc += struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1) + struct.pack("<II", 0x409, 72)
+    rsrc += struct.pack("<IIII", SECTION_RVA + 88, len(resource), 0, 0)
+    rsrc += resource
+    rsrc = rsrc + b"\x00" * (-len(rsrc) % 0x200)
+
+    optional_header = bytearray(240)
+    struct.pack_into("<H", optional_header, 0, 0x20B)
+    struct.pack_into("<II", optional_header, 32, 0x1000, 0x200)  # SectionAlignment, FileAlignment
+    struct.pack_into("<I", optional_header, 56, SECTION_RVA + len(rsrc))  # SizeOfImage
+    struct.pack_into("<I", optional_header, 60, SECTION_FILE_OFFSET)  # SizeOfHeaders
+    struct.pack_into("<I", optional_header, 108, 16)  # NumberOfRvaAndSizes
+    struct.pack_into("<II", optional_header, 112 + 2 * 8, SECTION_RVA, len(rsrc))  # Resource directory
+
+    dos_header = bytearray(64)
+    dos_header[:2] = b"MZ"
+    struct.pack_into("<I", dos_header, 0x3C, 64)
+    file_header = struct.pack("<HHIIIHH", 0x8664, 1, 0, 0, 0, len(optional_header), 0x2022)
+    section = struct.pack(
+        "<8sIIIIIIHHI", b".rsrc", len(rsrc), SECTION_RVA, len(rsrc), SECTION_FILE_OFFSET, 0, 0, 0, 0, 0x40000040
+    )
+
+    headers = bytes(dos_header) + b"PE\x00\x00" + file_header + bytes(optional_header) + section
+    return headers + b"\x00" * (SECTION_FILE_OFFSET - len(headers)) + rsrc
+
+
+@pytest.fixture
+def write_dll(tmp_path):
+    def write(data: bytes, name: str = "nvngx_dlss.dll"):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+    return write
+
+
+class TestReadFileVersion:
+    """Test read_file_version() on complete images"""
+
+    def test_string_file_version(self, write_dll):
+        """FileVersion from the string table is preferred over VS_FIXEDFILEINFO"""
+        resource = _version_info(
+            _fixed_file_info(3, 7, 10, 0),
+            {"040904b0": {"CompanyName": "NVIDIA", "FileVersion": "3.7.10.0 (release)"}},
+        )
+
+        assert read_file_version(write_dll(_pe_image(resource))) == "3.7.10.0 (release)"
+
+    def test_missing_string_file_info_uses_fixed_version(self, write_dll):
+        resource = _version_info(_fixed_file_info(310, 2, 1, 0))
+
+        assert read_file_version(write_dll(_pe_image(resource))) == "310.2.1.0"
+
+    def test_no_version_at_all(self, write_dll):
+        assert read_file_version(write_dll(_pe_image(_version_info()))) is None
+
+    def test_matches_pefile(self, write_dll):
+        resource = _version_info(
+            _fixed_file_info(2, 1, 0, 0),
+            {"040904b0": {"ProductName": "Game", "FileVersion": "2.1.0.0", "LegalCopyright": "(c)"}},
+        )
+        path = write_dll(_pe_image(resource))
+
+        assert read_file_version(path) == read_file_version_pefile(path) == "2.1.0.0"
+
+    def test_multiple_string_tables_use_first_file_version(self, write_dll):
+        """The first table with a FileVersion wins (see _find_string_file_version for pefile)"""
+        resource = _version_info(
+            _fixed_file_info(1, 0, 0, 0),
+            {
+                "040704b0": {"ProductName": "Spiel"},
+                "040904b0": {"FileVersion": "1.0.0.0"},
+                "041104b0": {"FileVersion": "1.0.0.1"},
+            },
+        )
+
+        assert read_file_version(write_dll(_pe_image(resource))) == "1.0.0.0"
+
+
+class TestMalformedInput:
+    """Test that damaged files raise PEVersionError (callers fall back to pefile)"""
+
+    @pytest.mark.parametrize("size", [0, 2, 63, 100, 300, SECTION_FILE_OFFSET + 40])
+    def test_truncated_image(self, write_dll, size):
+        image = _pe_image(_version_info(_fixed_file_info(1, 2, 3, 4), {"040904b0": {"FileVersion": "1.2.3.4"}}))
+
+        with pytest.raises(PEVersionError):
+            read_file_version(write_dll(image[:size]))
+
+    def test_missing_signatures(self, write_dll):
+        image = bytearray(_pe_image(_version_info(_fixed_file_info(1, 2, 3, 4))))
+        image[64:68] = b"XX\x00\x00"
+
+        with pytest.raises(PEVersionError):
+            read_file_version(write_dll(bytes(image)))
+        with pytest.raises(PEVersionError):
+            read_file_version(write_dll(b"ZZ" + bytes(image[2:])))
+
+    def test_corrupt_resource_length(self):
+        resource = bytearray(_version_info(_fixed_file_info(1, 2, 3, 4), {"040904b0": {"FileVersion": "1.2.3.4"}}))
+        struct.pack_into("<H", resource, 0, len(resource) + 64)
+
+        with pytest.raises(PEVersionError):
+            parse_version_resource(bytes(resource))
+
+    def test_unterminated_key(self):
+        resource = struct.pack("<HHH", 14, 0, 1) + "VS_V".encode("utf-16-le")
+
+        with pytest.raises(PEVersionError):
+            parse_version_resource(resource)
+
+    def test_unexpected_root_key(self):
+        with pytest.raises(PEVersionError):
+            parse_version_resource(_block("NOT_VERSION_INFO", _fixed_file_info(1, 2, 3, 4)))
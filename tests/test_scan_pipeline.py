@@ -0,0 +1,103 @@
+"""
+Tests for ScanPipeline's launcher priority: a DLL reported by several
+launchers ends up with the highest-priority one, whichever finishes first.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from dlss_updater import steam_integration
+from dlss_updater.database import db_manager
+from dlss_updater.scan_pipeline import ScanPipeline
+
+PRIORITY = ["Steam", "Epic Games Launcher", "Custom Folder 1"]
+
+
+@pytest.fixture
+def pipeline_db(tmp_path, monkeypatch):
+    """Fresh games.db and no Steam app ID lookups"""
+    monkeypatch.setattr(db_manager, "db_path", tmp_path / "games.db")
+    # Drop thread-local connections to the real database
+    monkeypatch.setattr(db_manager, "_thread_local", threading.local())
+    db_manager._create_schema()
+
+    async def no_app_id(*args):
+        return None
+
+    monkeypatch.setattr(steam_integration, "find_steam_app_id_by_name", no_app_id)
+    monkeypatch.setattr(steam_integration, "detect_steam_app_id_from_manifest", no_app_id)
+    return db_manager
+
+
+@pytest.fixture
+def steam_dll(tmp_path):
+    """A DLL inside a Steam library, which a custom folder also covers"""
+    dll_path = tmp_path / "steamapps" / "common" / "Game" / "bin" / "nvngx_dlss.dll"
+    dll_path.parent.mkdir(parents=True)
+    dll_path.write_bytes(b"not a real DLL")
+    return str(dll_path)
+
+
+class _RecordedEvents:
+    """on_recorded callback that lets a test wait for the next database batch"""
+
+    def __init__(self):
+        self.batches = asyncio.Queue()
+
+    async def __call__(self, games: int, dlls: int):
+        await self.batches.put((games, dlls))
+
+
+def _recorded_games():
+    return {
+        game.path: launcher
+        for launcher, games in db_manager._get_all_games_by_launcher().items()
+        for game in games
+    }
+
+
+class TestLauncherPriority:
+    """Test that the higher-priority launcher wins regardless of finish order"""
+
+    async def test_later_higher_priority_launcher_takes_over(self, tmp_path, pipeline_db, steam_dll):
+        recorded = _RecordedEvents()
+        pipeline = ScanPipeline(recorded, launcher_priority=PRIORITY)
+        pipeline.start()
+
+        # The custom folder finishes (and is written) first
+        assert await pipeline.submit("Custom Folder 1", [steam_dll]) == [steam_dll]
+        await recorded.batches.get()
+        assert await pipeline.submit("Steam", [steam_dll]) == [steam_dll]
+        stats = await pipeline.close()
+
+        steam_game = str(tmp_path / "steamapps" / "common" / "Game")
+        assert _recorded_games() == {steam_game: "Steam"}
+        steam_game_id = pipeline_db._get_all_games_by_launcher()["Steam"][0].id
+        assert pipeline_db._get_game_dll_by_path(steam_dll).game_id == steam_game_id
+        assert pipeline.owner(steam_dll) == "Steam"
+        assert (stats.games, stats.dlls) == (1, 1)
+
+    async def test_later_lower_priority_launcher_is_ignored(self, tmp_path, pipeline_db, steam_dll):
+        pipeline = ScanPipeline(launcher_priority=PRIORITY)
+        pipeline.start()
+
+        assert await pipeline.submit("Steam", [steam_dll]) == [steam_dll]
+        assert await pipeline.submit("Custom Folder 1", [steam_dll]) == []
+        stats = await pipeline.close()
+
+        assert _recorded_games() == {str(tmp_path / "steamapps" / "common" / "Game"): "Steam"}
+        assert (stats.games, stats.dlls) == (1, 1)
+
+    async def test_claim_before_write_skips_stale_record(self, tmp_path, pipeline_db, steam_dll):
+        """Both launchers submitted before any write: only the owner's record is written"""
+        pipeline = ScanPipeline(launcher_priority=PRIORITY)
+        pipeline.start()
+
+        await pipeline.submit("Custom Folder 1", [steam_dll])
+        await pipeline.submit("Steam", [steam_dll])
+        stats = await pipeline.close()
+
+        assert _recorded_games() == {str(tmp_path / "steamapps" / "common" / "Game"): "Steam"}
+        assert (stats.games, stats.dlls) == (1, 1)
@@ -0,0 +1,200 @@
+"""
+Tests for the update journal: session bookkeeping in SQLite, the restore
+helper and resume/rollback of an interrupted session, against a temp database.
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from dlss_updater import high_performance_updater
+from dlss_updater.checksum import compute_checksum
+from dlss_updater.database import db_manager
+from dlss_updater.models import (
+    BatchUpdateResult,
+    IncompleteUpdateSession,
+    UpdateJournalEntry,
+    UpdateJournalState,
+)
+from dlss_updater.update_journal import (
+    UpdateJournal,
+    _restore_entry,
+    get_incomplete_update_sessions,
+    resume_update_session,
+    rollback_update_session,
+)
+
+
+class _Task:
+    """Stand-in for DLLTask with the attributes UpdateJournal.begin() reads"""
+
+    def __init__(self, target_path, game_name="Game"):
+        self.target_path = str(target_path)
+        self.source_dll_name = "nvngx_dlss.dll"
+        self.game_name = game_name
+        self.dll_type = "DLSS DLL"
+
+
+@pytest.fixture
+def journal_db(tmp_path, monkeypatch):
+    """Point the database manager at a fresh games.db for the test"""
+    monkeypatch.setattr(db_manager, "db_path", tmp_path / "games.db")
+    # Drop thread-local connections to the real database
+    monkeypatch.setattr(db_manager, "_thread_local", threading.local())
+    db_manager._create_schema()
+    return db_manager
+
+
+def _entry(state, backup_path="backup.dlsss", target_path="game.dll", checksum=None):
+    return UpdateJournalEntry(
+        target_path=target_path,
+        source_dll_name="nvngx_dlss.dll",
+        game_name="Game",
+        dll_type="DLSS DLL",
+        state=state,
+        backup_path=backup_path,
+        checksum=checksum,
+    )
+
+
+def _session(*entries):
+    return IncompleteUpdateSession(session_id="s1", started_at=datetime.now(), entries=list(entries))
+
+
+def _backed_up_dll(tmp_path, name):
+    """A DLL already overwritten by the update, plus its backup and the original checksum"""
+    target = tmp_path / f"{name}.dll"
+    backup = tmp_path / f"{name}.dlsss"
+    backup.write_bytes(b"original " + name.encode())
+    target.write_bytes(b"updated " + name.encode())
+    return target, backup, compute_checksum(backup)
+
+
+class TestSessionEntries:
+    """Test IncompleteUpdateSession entry selection"""
+
+    def test_pending_entries(self):
+        """Only VERIFIED and UNCHANGED entries count as finished"""
+        session = _session(*(_entry(state, target_path=str(state)) for state in UpdateJournalState))
+
+        pending = {e.state for e in session.pending_entries}
+
+        assert pending == {
+            UpdateJournalState.PLANNED, UpdateJournalState.BACKED_UP, UpdateJournalState.WRITTEN
+        }
+
+    def test_restorable_entries(self):
+        """Entries need a backup and must not have been skipped"""
+        session = _session(
+            _entry(UpdateJournalState.PLANNED, backup_path=None, target_path="a"),
+            _entry(UpdateJournalState.BACKED_UP, target_path="b"),
+            _entry(UpdateJournalState.VERIFIED, target_path="c"),
+            _entry(UpdateJournalState.UNCHANGED, target_path="d"),
+        )
+
+        assert [e.target_path for e in session.restorable_entries] == ["b", "c"]
+
+
+class TestRestoreEntry:
+    """Test _restore_entry()"""
+
+    def test_restores_overwritten_dll(self, tmp_path):
+        target, backup, checksum = _backed_up_dll(tmp_path, "a")
+
+        assert _restore_entry(_entry(UpdateJournalState.WRITTEN, str(backup), str(target), checksum))
+        assert target.read_bytes() == b"original a"
+
+    def test_skips_dll_matching_checksum(self, tmp_path):
+        """A DLL still holding the original is left alone"""
+        target, backup, checksum = _backed_up_dll(tmp_path, "a")
+        target.write_bytes(backup.read_bytes())
+        mtime = target.stat().st_mtime_ns
+
+        assert not _restore_entry(_entry(UpdateJournalState.BACKED_UP, str(backup), str(target), checksum))
+        assert target.stat().st_mtime_ns == mtime
+
+    def test_missing_backup_raises(self, tmp_path):
+        entry = _entry(UpdateJournalState.WRITTEN, str(tmp_path / "gone.dlsss"), str(tmp_path / "a.dll"))
+
+        with pytest.raises(FileNotFoundError):
+            _restore_entry(entry)
+
+
+class TestJournalRoundTrip:
+    """Test journaling an interrupted session and resolving it"""
+
+    def _interrupted_session(self, tmp_path):
+        """Journal three DLLs: one verified, one written, one only planned"""
+        done, done_backup, done_checksum = _backed_up_dll(tmp_path, "done")
+        written, written_backup, written_checksum = _backed_up_dll(tmp_path, "written")
+        planned = tmp_path / "planned.dll"
+        planned.write_bytes(b"original planned")
+
+        journal = UpdateJournal(batch_size=2)
+        assert journal.begin([_Task(done), _Task(written), _Task(planned)])
+        journal.record(str(done), UpdateJournalState.BACKED_UP, str(done_backup), done_checksum)
+        journal.record(str(written), UpdateJournalState.BACKED_UP, str(written_backup), written_checksum)
+        journal.record(str(done), UpdateJournalState.WRITTEN)
+        journal.record(str(written), UpdateJournalState.WRITTEN)
+        journal.record(str(done), UpdateJournalState.VERIFIED)
+        journal.flush()
+        # No finish(): the run "crashed" here
+        return journal.session_id, done, written, planned
+
+    async def test_incomplete_session_is_reported(self, tmp_path, journal_db):
+        session_id, done, written, planned = self._interrupted_session(tmp_path)
+
+        sessions = await get_incomplete_update_sessions()
+
+        assert [s.session_id for s in sessions] == [session_id]
+        states = {e.target_path: e.state for e in sessions[0].entries}
+        assert states == {
+            str(done): UpdateJournalState.VERIFIED,
+            str(written): UpdateJournalState.WRITTEN,
+            str(planned): UpdateJournalState.PLANNED,
+        }
+        assert {e.target_path for e in sessions[0].pending_entries} == {str(written), str(planned)}
+
+    async def test_rollback_restores_and_drops_session(self, tmp_path, journal_db):
+        self._interrupted_session(tmp_path)
+        session = (await get_incomplete_update_sessions())[0]
+
+        results = await rollback_update_session(session)
+
+        assert results["failure_count"] == 0 and results["success_count"] == 2
+        assert (tmp_path / "done.dll").read_bytes() == b"original done"
+        assert (tmp_path / "written.dll").read_bytes() == b"original written"
+        assert (tmp_path / "planned.dll").read_bytes() == b"original planned"
+        assert await get_incomplete_update_sessions() == []
+
+    async def test_failed_rollback_keeps_session(self, tmp_path, journal_db):
+        self._interrupted_session(tmp_path)
+        (tmp_path / "written.dlsss").unlink()
+        session = (await get_incomplete_update_sessions())[0]
+
+        results = await rollback_update_session(session)
+
+        assert results["failure_count"] == 1
+        assert [s.session_id for s in await get_incomplete_update_sessions()] == [session.session_id]
+
+    async def test_resume_reruns_pending_and_drops_session(self, tmp_path, journal_db, monkeypatch):
+        self._interrupted_session(tmp_path)
+        session = (await get_incomplete_update_sessions())[0]
+        rerun = []
+
+        class FakeManager:
+            async def execute(self, tasks, settings, progress_callback=None):
+                rerun.extend(task.target_path for task in tasks)
+                return BatchUpdateResult(
+                    mode_used="high_performance", backups_created=0, updates_succeeded=len(tasks),
+                    updates_failed=0, updates_skipped=0, memory_peak_mb=0.0, duration_seconds=0.0,
+                )
+
+        monkeypatch.setattr(high_performance_updater, "HighPerformanceUpdateManager", FakeManager)
+
+        result = await resume_update_session(session)
+
+        assert result.updates_succeeded == 2
+        assert sorted(rerun) == sorted([str(tmp_path / "written.dll"), str(tmp_path / "planned.dll")])
+        assert await get_incomplete_update_sessions() == []